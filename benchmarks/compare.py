@@ -0,0 +1,54 @@
+# benchmarks/compare.py
+import argparse
+import json
+import sys
+from typing import Dict
+
+def load_runs(path: str) -> Dict[tuple, Dict]:
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    return {(run['rows'], run['items']): run for run in report['runs'] if not run.get('skipped')}
+
+def compare(base_path: str, new_path: str, threshold: float = 0.1) -> int:
+    """
+    Print the per-stage time ratio new/base for grid points present in both
+    reports; returns how many stages got slower by more than threshold
+    """
+    base_runs = load_runs(base_path)
+    new_runs = load_runs(new_path)
+    regressions = 0
+
+    for key in sorted(base_runs.keys() & new_runs.keys()):
+        base, new = base_runs[key], new_runs[key]
+        print(f"\n{key[0]} rows x {key[1]} items")
+        print(f"  {'stage':<42}{'base s':>10}{'new s':>10}{'ratio':>8}")
+        for stage, base_seconds in base['stages'].items():
+            if stage not in new['stages']:
+                continue
+            new_seconds = new['stages'][stage]
+            ratio = new_seconds / base_seconds if base_seconds > 0 else float('inf')
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  slower"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(f"  {stage:<42}{base_seconds:>10.4f}{new_seconds:>10.4f}{ratio:>8.2f}{flag}")
+        print(f"  {'total':<42}{base['total_seconds']:>10.4f}{new['total_seconds']:>10.4f}"
+              f"{new['total_seconds'] / base['total_seconds']:>8.2f}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('base', help="Results of the reference run")
+    parser.add_argument('new', help="Results of the run to check")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="Relative change reported as slower or faster (default 0.1)")
+    args = parser.parse_args(argv)
+    regressions = compare(args.base, args.new, args.threshold)
+    print(f"\n{regressions} stage(s) slower by more than {args.threshold:.0%}")
+    # Non-zero exit lets CI flag regressions
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
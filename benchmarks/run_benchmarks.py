@@ -0,0 +1,237 @@
+# benchmarks/run_benchmarks.py
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+import numpy as np
+import openpyxl
+import pandas as pd
+from src import __version__
+from src.core.analyzer import StatisticalAnalyzer
+from src.core.formatters.construct_formatter import ConstructValidityFormatter
+from src.core.formatters.cronbach_formatter import CronbachFormatter
+from src.core.formatters.split_half_formatter import SplitHalfFormatter
+from src.core.formatters.writers import create_workbook_writer
+from src.core.statistics_manager import StatisticsManager
+from src.core.workbook_cache import WorkbookCache
+from .synthetic_survey import analysis_ranges, write_survey
+
+# Full size grid; combinations above --max-cells are skipped
+ROW_GRID = [1000, 10000, 100000, 1000000]
+ITEM_GRID = [10, 100, 1000]
+QUICK_ROW_GRID = [1000, 10000]
+QUICK_ITEM_GRID = [10, 100]
+
+DEFAULT_MAX_CELLS = 10_000_000
+
+class StageTimer:
+    """Wall-clock seconds of named stages, keeping the fastest of repeated runs"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[name] = min(elapsed, self.stages.get(name, elapsed))
+
+def survey_path(data_dir: str, rows: int, items: int, args) -> str:
+    """Generated workbooks are reused across runs with the same parameters"""
+    name = (f"survey_{rows}x{items}_d{args.dimensions}_{args.responses}"
+            f"_m{args.missing_rate:g}_h{args.header_rows}_s{args.seed}.xlsx")
+    return os.path.join(data_dir, name)
+
+def time_pipeline(timer: StageTimer, path: str, ranges: Dict, output_dir: str, args) -> int:
+    """Run every analysis stage once, timing each; returns the number of response rows analysed"""
+    # Drop the parsed copy kept from the previous repeat so every read parses the file
+    WorkbookCache.get_instance().invalidate()
+
+    with timer.stage('excel_read'):
+        analyzer = StatisticalAnalyzer(path, ranges['selected_columns'], ranges['dimensions'],
+                                       streaming=args.streaming)
+    if args.streaming:
+        data = analyzer.responses
+    else:
+        with timer.stage('clean_data'):
+            analyzer.clean_data()
+        data = analyzer.data
+
+    with timer.stage('response_matrix'):
+        manager = StatisticsManager(data, analyzer.questions, analyzer.dimensions)
+
+    results = {}
+    with timer.stage('cronbach_alpha'):
+        results['total_alpha'] = manager.cronbach.calculate(manager.responses, manager.questions)
+    with timer.stage('split_half'):
+        results['split_half'] = manager.split_half.calculate(manager.responses, manager.questions)
+    with timer.stage('construct_validity'):
+        results['construct_validity'] = manager.construct_validity.calculate(
+            manager.responses, manager.questions, manager.dimensions
+        )
+    with timer.stage('per_question_construct_validity'):
+        results['per_question_construct_validity'] = manager.calculate_per_question_construct_validity()
+    with timer.stage('dimension_statistics'):
+        results['dimensions'] = {
+            dim_num: {
+                'alpha': manager.cronbach.calculate(manager.responses, dim_questions),
+                'split_half': manager.split_half.calculate(manager.responses, dim_questions)
+            }
+            for dim_num, dim_questions in manager.dimensions.items()
+        }
+    with timer.stage('per_question_alpha'):
+        results['per_question_alpha'] = manager.calculate_per_question_alpha()
+    with timer.stage('split_distribution'):
+        results['split_distribution'] = manager.calculate_split_distributions()
+
+    # Same sheets, in the same order, as StatisticsManager.export_results
+    wb = create_workbook_writer(os.path.join(output_dir, 'benchmark_output.xlsx'), args.backend)
+    with timer.stage('format_cronbach'):
+        CronbachFormatter.format_results(wb, results['total_alpha'])
+    with timer.stage('format_split_half'):
+        SplitHalfFormatter.format_results_to_sheet(wb.add_sheet("Split Half"), results['split_half'])
+    with timer.stage('format_construct_validity'):
+        ConstructValidityFormatter.format_results_to_sheet(
+            wb.add_sheet("Construct Validity"), results['construct_validity']
+        )
+    with timer.stage('format_per_question_construct_validity'):
+        manager.format_per_question_construct_validity(
+            wb.add_sheet("Question Construct Validity"), results['per_question_construct_validity']
+        )
+    with timer.stage('format_dimensions'):
+        for dim_num, dim_results in results['dimensions'].items():
+            if dim_results['alpha'].status == 'success':
+                CronbachFormatter.format_results_to_sheet(
+                    wb.add_sheet(f"Dimension {dim_num} Alpha"), dim_results['alpha']
+                )
+                SplitHalfFormatter.format_results_to_sheet(
+                    wb.add_sheet(f"Dimension {dim_num} Split"), dim_results['split_half']
+                )
+    with timer.stage('format_per_question_alpha'):
+        manager.format_per_question_results(wb.add_sheet("Question Analysis"), results['per_question_alpha'])
+    with timer.stage('format_split_distribution'):
+        SplitHalfFormatter.format_distribution_to_sheet(
+            wb.add_sheet("Split-Half Distribution"), results['split_distribution']
+        )
+    with timer.stage('workbook_save'):
+        wb.close()
+
+    return manager.responses.n_rows
+
+def environment() -> Dict:
+    return {
+        'app_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'openpyxl': openpyxl.__version__
+    }
+
+def grid(args) -> List[tuple]:
+    rows = args.rows or (QUICK_ROW_GRID if args.quick else ROW_GRID)
+    items = args.items or (QUICK_ITEM_GRID if args.quick else ITEM_GRID)
+    return [(r, k) for r in rows for k in items]
+
+def run(args) -> Dict:
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'settings': {
+            'dimensions': args.dimensions,
+            'responses': args.responses,
+            'missing_rate': args.missing_rate,
+            'header_rows': args.header_rows,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'streaming': args.streaming,
+            'backend': args.backend,
+            'max_cells': args.max_cells
+        },
+        'runs': []
+    }
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for rows, items in grid(args):
+            if rows * items > args.max_cells:
+                print(f"{rows} x {items}: skipped (over --max-cells)")
+                report['runs'].append({'rows': rows, 'items': items, 'skipped': True})
+                continue
+
+            path = survey_path(args.data_dir, rows, items, args)
+            generate_seconds = None
+            if not os.path.exists(path):
+                start = time.perf_counter()
+                write_survey(path, rows, items, args.dimensions, args.responses,
+                             missing_rate=args.missing_rate, header_rows=args.header_rows, seed=args.seed)
+                generate_seconds = time.perf_counter() - start
+
+            ranges = analysis_ranges(items, args.dimensions)
+            timer = StageTimer()
+            for _ in range(args.repeat):
+                analysed_rows = time_pipeline(timer, path, ranges, output_dir, args)
+
+            total = sum(timer.stages.values())
+            report['runs'].append({
+                'rows': rows,
+                'items': items,
+                'analysed_rows': analysed_rows,
+                'file_bytes': os.path.getsize(path),
+                'generate_seconds': generate_seconds,
+                'stages': timer.stages,
+                'total_seconds': total
+            })
+            slowest = max(timer.stages, key=timer.stages.get)
+            print(f"{rows} x {items}: {total:.3f}s (slowest stage: {slowest} {timer.stages[slowest]:.3f}s)")
+    return report
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Time each stage of the analysis over a grid of survey sizes")
+    parser.add_argument('--rows', type=int, nargs='+', help="Respondent counts (default: 1k to 1M)")
+    parser.add_argument('--items', type=int, nargs='+', help="Item counts (default: 10 to 1000)")
+    parser.add_argument('--quick', action='store_true', help="Small grid for a fast check")
+    parser.add_argument('--max-cells', type=int, default=DEFAULT_MAX_CELLS,
+                        help="Skip grid points with more response cells than this")
+    parser.add_argument('--dimensions', type=int, default=3)
+    parser.add_argument('--responses', choices=['arabic', 'numeric'], default='arabic')
+    parser.add_argument('--missing-rate', type=float, default=0.0)
+    parser.add_argument('--header-rows', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per grid point; the fastest time is kept")
+    parser.add_argument('--streaming', action='store_true', help="Use the streaming reader")
+    parser.add_argument('--backend', choices=['xlsxwriter', 'openpyxl'], default='xlsxwriter')
+    parser.add_argument('--data-dir', default=os.path.join('benchmarks', 'data'),
+                        help="Where generated workbooks are kept between runs")
+    parser.add_argument('--output', help="Results file (default: benchmarks/results/<timestamp>.json)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Logging is part of the pipeline, but console output at this volume would dominate the timings
+    logging.disable(logging.INFO)
+
+    report = run(args)
+    output = args.output or os.path.join(
+        'benchmarks', 'results', f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
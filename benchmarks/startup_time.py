@@ -0,0 +1,108 @@
+# benchmarks/startup_time.py
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+# Modules the window must not need before it is painted
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'openpyxl', 'xlsxwriter', 'pyarrow']
+
+DEFAULT_MODULE = 'src.gui.main_window'
+DEFAULT_BUDGET_MS = 400
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Builds and paints the main window offscreen, then prints the elapsed milliseconds
+_PAINT_SCRIPT = """
+import time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+from src.gui.main_window import MainWindow
+app = QApplication(['startup_time', '-platform', 'offscreen'])
+window = MainWindow()
+window.show()
+app.processEvents()
+print((time.perf_counter() - start) * 1000)
+"""
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Rows of `python -X importtime` output: module, self and cumulative microseconds, nesting depth"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us)
+        })
+    return rows
+
+def measure_imports(module: str) -> Dict:
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    rows = parse_importtime(completed.stderr)
+    imported = {row['module'] for row in rows}
+    top = [row for row in rows if row['module'] == module and row['depth'] == 0]
+    return {
+        'module': module,
+        'cumulative_ms': round(top[-1]['cumulative_us'] / 1000, 1) if top else None,
+        'heavy_modules': [name for name in HEAVY_MODULES if name in imported],
+        'slowest': sorted(rows, key=lambda row: row['self_us'], reverse=True)[:15]
+    }
+
+def measure_paint() -> float:
+    """Milliseconds from the first import to a painted main window, in a fresh interpreter"""
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    completed = subprocess.run([sys.executable, '-c', _PAINT_SCRIPT], cwd=REPO_ROOT,
+                               capture_output=True, text=True, env=env)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Showing the main window failed:\n{completed.stderr[-2000:]}")
+    return round(float(completed.stdout.strip().splitlines()[-1]), 1)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure GUI startup: import time breakdown and time to a painted window"
+    )
+    parser.add_argument('--module', default=DEFAULT_MODULE, help=f"Module to import (default: {DEFAULT_MODULE})")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Fail when importing takes longer (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument('--paint', action='store_true', help="Also time showing the main window (needs PyQt5)")
+    parser.add_argument('--output', help="Write the measurements as JSON")
+    args = parser.parse_args(argv)
+
+    result = measure_imports(args.module)
+    if args.paint:
+        result['paint_ms'] = measure_paint()
+
+    print(f"import {result['module']}: {result['cumulative_ms']} ms")
+    if 'paint_ms' in result:
+        print(f"main window painted after {result['paint_ms']} ms")
+    print("slowest modules (self time):")
+    for row in result['slowest'][:10]:
+        print(f"  {row['self_us'] / 1000:8.1f} ms  {row['module']}")
+
+    failures = []
+    if result['heavy_modules']:
+        failures.append(f"heavy modules imported at startup: {', '.join(result['heavy_modules'])}")
+    if result['cumulative_ms'] is not None and result['cumulative_ms'] > args.budget_ms:
+        failures.append(f"import took {result['cumulative_ms']} ms, over the {args.budget_ms:g} ms budget")
+    result['failures'] = failures
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# benchmarks/synthetic_survey.py
+import argparse
+import os
+from typing import Dict, List
+import numpy as np
+import xlsxwriter
+from src.core.response_mapping import RESPONSE_MAPPING
+
+# Leading identification columns, as in the questionnaires we receive
+ID_COLUMNS = ["الاسم / Name", "الرقم / ID"]
+
+# Rows written to the workbook per xlsxwriter call batch
+_WRITE_BATCH = 10000
+
+def dimension_sizes(items: int, dimensions: int) -> List[int]:
+    """Split items into dimensions as evenly as possible, earlier dimensions taking the remainder"""
+    dimensions = max(1, min(dimensions, items))
+    base, extra = divmod(items, dimensions)
+    return [base + (1 if d < extra else 0) for d in range(dimensions)]
+
+def analysis_ranges(items: int, dimensions: int) -> Dict:
+    """selected_columns and dimensions arguments of StatisticalAnalyzer for a generated survey"""
+    first = len(ID_COLUMNS)
+    selected_columns = list(range(first, first + items))
+    dims = {}
+    start = first
+    for d, size in enumerate(dimension_sizes(items, dimensions), 1):
+        dims[d] = list(range(start, start + size))
+        start += size
+    return {'selected_columns': selected_columns, 'dimensions': dims}
+
+def generate_scores(respondents: int, items: int, dimensions: int = 1, levels: int = 3,
+                    missing_rate: float = 0.0, seed: int = 0) -> np.ndarray:
+    """
+    Likert scores 1..levels from a latent trait model: each respondent has
+    a general trait and one factor per dimension, so items correlate more
+    within their dimension than across. Missing responses are NaN.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = dimension_sizes(items, dimensions)
+    item_dimension = np.repeat(np.arange(len(sizes)), sizes)
+
+    trait = rng.standard_normal((respondents, 1))
+    factors = rng.standard_normal((respondents, len(sizes)))
+    difficulty = rng.normal(0, 0.5, items)
+    latent = trait + 0.6 * factors[:, item_dimension] - difficulty + rng.standard_normal((respondents, items))
+
+    # Equal-probability cut points of the latent scale
+    cuts = np.quantile(latent, np.linspace(0, 1, levels + 1)[1:-1])
+    scores = (np.searchsorted(cuts, latent) + 1).astype(np.float64)
+    if missing_rate > 0:
+        scores[rng.random(scores.shape) < missing_rate] = np.nan
+    return scores
+
+def write_survey(path: str, respondents: int, items: int, dimensions: int = 1, responses: str = 'arabic',
+                 levels: int = 3, missing_rate: float = 0.0, header_rows: int = 1, seed: int = 0) -> str:
+    """
+    Write a questionnaire workbook: identification columns followed by item
+    columns whose numbers restart in each dimension ("1- ...", "2- ..."),
+    header_rows rows under the column names (dimension titles, then blank
+    rows), and one row per respondent. responses='arabic' writes the labels
+    of the default response mapping (which has three levels), 'numeric'
+    writes the scores 1..levels.
+    """
+    if responses not in ('arabic', 'numeric'):
+        raise ValueError(f"Unknown response type: {responses}")
+    if responses == 'arabic':
+        levels = len(RESPONSE_MAPPING)
+    scores = generate_scores(respondents, items, dimensions, levels, missing_rate, seed)
+    sizes = dimension_sizes(items, dimensions)
+
+    names = list(ID_COLUMNS)
+    titles = [None] * len(ID_COLUMNS)
+    for d, size in enumerate(sizes, 1):
+        names += [f"{q}- عبارة {d}.{q}" for q in range(1, size + 1)]
+        titles += [f"البعد {d} / Dimension {d}"] + [None] * (size - 1)
+
+    # Labels by score, index 0 standing for a missing response
+    if responses == 'arabic':
+        by_score = {score: label for label, score in RESPONSE_MAPPING.items()}
+        labels = np.array([None] + [by_score[s] for s in range(1, levels + 1)], dtype=object)
+    else:
+        labels = np.array([None] + list(range(1, levels + 1)), dtype=object)
+    codes = np.nan_to_num(scores, nan=0).astype(np.intp)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    wb = xlsxwriter.Workbook(path, {'constant_memory': True})
+    ws = wb.add_worksheet("Responses")
+    ws.write_row(0, 0, names)
+    row = 1
+    for h in range(header_rows):
+        if h == 0:
+            for col, title in enumerate(titles):
+                if title is not None:
+                    ws.write(row, col, title)
+        row += 1
+
+    for start in range(0, respondents, _WRITE_BATCH):
+        block = labels[codes[start:start + _WRITE_BATCH]]
+        for i, values in enumerate(block, start):
+            ws.write_row(row, 0, (f"طالب {i + 1}", i + 1))
+            for col, value in enumerate(values, len(ID_COLUMNS)):
+                # Missing responses are left as empty cells
+                if value is not None:
+                    ws.write(row, col, value)
+            row += 1
+    wb.close()
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Likert questionnaire workbook")
+    parser.add_argument('output', help="Workbook to create")
+    parser.add_argument('--respondents', type=int, default=1000)
+    parser.add_argument('--items', type=int, default=30)
+    parser.add_argument('--dimensions', type=int, default=3)
+    parser.add_argument('--responses', choices=['arabic', 'numeric'], default='arabic')
+    parser.add_argument('--levels', type=int, default=5, help="Score levels of numeric responses")
+    parser.add_argument('--missing-rate', type=float, default=0.0)
+    parser.add_argument('--header-rows', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    write_survey(args.output, args.respondents, args.items, args.dimensions, args.responses,
+                 args.levels, args.missing_rate, args.header_rows, args.seed)
+    print(f"Wrote {args.respondents} respondents x {args.items} items to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+# src/cli.py
+"""
+Headless batch analysis of questionnaire workbooks.
+
+Every workbook found in the input directory is analysed with
+StatisticalAnalyzer in a pool of worker processes, one output workbook is
+written per input, and a JSON summary of throughput and failures is saved
+next to the outputs. Column positions are 0-based, as in the GUI.
+
+By default only the first sheet of each workbook is analysed. With
+--sheets separate every sheet is analysed on its own and written to its own
+workbook; with --sheets combined the sheets' reports are written into one
+workbook per input, after a summary sheet comparing them. Sheets are spread
+over the same worker pool as files.
+
+    python -m src.cli --questions 2-16 --dimension 2-6 --dimension 7-10 --dimension 11-16
+    python -m src.cli --config analysis.yaml --workers 8
+    python -m src.cli --config analysis.yaml --sheets combined
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from .core.formatters.writers import WRITER_BACKENDS
+from .core.multi_sheet import SHEET_MODES, export_combined, list_sheets, sheet_file_label, summarize_results
+from .core.result_cache import ResultCache
+from .core.statistics.bootstrap import BootstrapEstimator
+from .utils.logger import AppLogger
+from .utils.profiling import RunProfiler
+
+DEFAULT_INPUT_DIR = 'data/input'
+DEFAULT_OUTPUT_DIR = 'data/output'
+SUMMARY_FILE = 'batch_summary.json'
+# Per-file run reports and profiles, inside the output directory
+REPORTS_DIR = 'reports'
+
+def parse_range(text) -> List[int]:
+    """Turn 'start-end' (inclusive) or a [start, end] pair into a list of column positions"""
+    if isinstance(text, str):
+        parts = text.split('-')
+    else:
+        parts = list(text)
+    if len(parts) != 2:
+        raise ValueError(f"Invalid column range: {text!r}, expected start-end")
+    start, end = int(parts[0]), int(parts[1])
+    if start < 0 or end < start:
+        raise ValueError(f"Invalid column range: {text!r}")
+    return list(range(start, end + 1))
+
+def load_config(path: str) -> Dict:
+    """Read a JSON or YAML analysis config"""
+    with open(path, encoding='utf-8') as f:
+        if path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML configs need PyYAML; install it or use a JSON config")
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+def build_settings(args) -> Dict:
+    """Merge the config file with command-line flags; flags win"""
+    config = load_config(args.config) if args.config else {}
+
+    questions = args.questions or config.get('questions')
+    if questions is None:
+        raise ValueError("No question range given; use --questions or a config file")
+
+    if args.dimension:
+        dimension_ranges = {i: r for i, r in enumerate(args.dimension, 1)}
+    else:
+        dimension_ranges = {int(k): v for k, v in (config.get('dimensions') or {}).items()}
+    if not dimension_ranges:
+        raise ValueError("No dimensions given; use --dimension or a config file")
+
+    settings = {
+        'input_dir': args.input_dir or config.get('input_dir', DEFAULT_INPUT_DIR),
+        'output_dir': args.output_dir or config.get('output_dir', DEFAULT_OUTPUT_DIR),
+        'pattern': args.pattern or config.get('pattern', '*.xlsx'),
+        'workers': args.workers or config.get('workers') or os.cpu_count() or 1,
+        'writer_backend': args.backend or config.get('writer_backend', 'xlsxwriter'),
+        'streaming': args.streaming or bool(config.get('streaming', False)),
+        # 'first', 'separate' or 'combined'
+        'sheets': args.sheets or config.get('sheets', 'first'),
+        # {label: score} dict or JSON file path; None keeps the default Arabic table
+        'response_mapping': args.mapping or config.get('response_mapping'),
+        'bootstrap': args.bootstrap or config.get('bootstrap', 0),
+        'bootstrap_seed': args.seed if args.seed is not None else config.get('bootstrap_seed', BootstrapEstimator.DEFAULT_SEED),
+        'bootstrap_workers': args.bootstrap_workers or config.get('bootstrap_workers', 1),
+        # Files already run in parallel, so calculations within a file run one at a time by default
+        'compute_workers': args.compute_workers or config.get('compute_workers', 1),
+        # Converted copies of parsed inputs; None parses every workbook
+        'sidecar_dir': args.sidecar_dir or config.get('sidecar_dir'),
+        # Stage timings are always reported; these add cProfile and tracemalloc dumps
+        'profile': args.profile or bool(config.get('profile', False)),
+        'trace_memory': args.trace_memory or bool(config.get('trace_memory', False)),
+        # None disables the result cache
+        'cache_dir': None if args.no_cache else (args.cache_dir or config.get('cache_dir', ResultCache.DEFAULT_CACHE_DIR)),
+        'selected_columns': parse_range(questions),
+        'dimensions': {dim: parse_range(r) for dim, r in sorted(dimension_ranges.items())}
+    }
+    if settings['writer_backend'] not in WRITER_BACKENDS:
+        raise ValueError(f"Unknown writer backend: {settings['writer_backend']}")
+    if settings['sheets'] not in SHEET_MODES:
+        raise ValueError(f"Unknown sheets mode: {settings['sheets']}, expected one of {', '.join(SHEET_MODES)}")
+    return settings
+
+def find_inputs(input_dir: str, pattern: str) -> List[str]:
+    """Workbooks to process, skipping Excel lock files"""
+    files = glob.glob(os.path.join(input_dir, pattern))
+    return sorted(f for f in files if os.path.isfile(f) and not os.path.basename(f).startswith('~$'))
+
+def find_tasks(files: List[str], sheets_mode: str) -> Tuple[List[Tuple[str, Optional[str]]], List[Dict]]:
+    """
+    (input, sheet) pairs to analyse, with sheet None for the first sheet
+    only, and error results for workbooks whose sheets could not be listed
+    """
+    if sheets_mode == 'first':
+        return [(f, None) for f in files], []
+    tasks, failures = [], []
+    for f in files:
+        try:
+            tasks += [(f, sheet) for sheet in list_sheets(f)]
+        except Exception as e:
+            failures.append({'input': f, 'sheet': None, 'output': None, 'rows': 0,
+                             'status': 'error', 'message': str(e), 'seconds': None})
+    return tasks, failures
+
+def output_name_for(input_file: str, sheet_name: str = None) -> str:
+    stem = os.path.splitext(os.path.basename(input_file))[0]
+    if sheet_name is not None:
+        stem = f"{stem}_{sheet_file_label(sheet_name)}"
+    return f"{stem}_analysis.xlsx"
+
+def report_prefix_for(input_file: str, output_dir: str, sheet_name: str = None) -> str:
+    """Path prefix of the run report and profiles of one input (sheet)"""
+    return os.path.join(output_dir, REPORTS_DIR, os.path.splitext(output_name_for(input_file, sheet_name))[0])
+
+def analyze_file(input_file: str, settings: Dict, sheet_name: str = None) -> Dict:
+    """
+    Analyse one workbook, or one sheet of it; runs in a worker process and
+    never raises. In combined sheets mode nothing is written: the computed
+    results are returned for the parent to combine.
+    """
+    from .core.analyzer import StatisticalAnalyzer
+    from .core.sidecar_cache import SidecarCache
+    from .core.workbook_cache import WorkbookCache
+
+    started = time.perf_counter()
+    combined = settings['sheets'] == 'combined'
+    result = {'input': input_file, 'sheet': sheet_name, 'output': None, 'rows': 0}
+    profiler = RunProfiler(cprofile=settings['profile'], trace_memory=settings['trace_memory'])
+    profiler.start()
+    try:
+        if settings['sidecar_dir']:
+            WorkbookCache.get_instance().set_sidecar_cache(SidecarCache(settings['sidecar_dir']))
+        bootstrap = None
+        if settings['bootstrap']:
+            bootstrap = BootstrapEstimator(settings['bootstrap'], seed=settings['bootstrap_seed'],
+                                           workers=settings['bootstrap_workers'])
+        analyzer = StatisticalAnalyzer(
+            input_file,
+            settings['selected_columns'],
+            settings['dimensions'],
+            streaming=settings['streaming'],
+            mapping=settings['response_mapping'],
+            bootstrap=bootstrap,
+            result_cache=ResultCache(settings['cache_dir']) if settings['cache_dir'] else None,
+            profiler=profiler,
+            sheet_name=sheet_name,
+            workers=settings['compute_workers']
+        )
+        if combined:
+            result['results'] = analyzer.compute_results()
+            result['summary'] = summarize_results(result['results'])
+        else:
+            result['output'] = analyzer.analyze_and_export(
+                settings['output_dir'],
+                settings['writer_backend'],
+                output_name_for(input_file, sheet_name)
+            )
+        result['rows'] = analyzer.n_rows or 0
+        result['cached'] = analyzer.cached is not None
+        result['status'] = 'success'
+    except Exception as e:
+        result['status'] = 'error'
+        result['message'] = str(e)
+    finally:
+        profiler.stop()
+        # A batch reads each input once; keep the parsed frame from piling up in the worker
+        WorkbookCache.get_instance().invalidate(input_file)
+    result['seconds'] = round(time.perf_counter() - started, 3)
+
+    # Reporting problems must not turn a finished analysis into a failure
+    prefix = report_prefix_for(input_file, settings['output_dir'], sheet_name)
+    try:
+        result['report'] = profiler.write_report(
+            f"{prefix}_run_report.json",
+            input=input_file, sheet=sheet_name, output=result['output'], status=result['status'], rows=result['rows']
+        )
+        result['profiles'] = profiler.dump_profiles(prefix)
+    except OSError as e:
+        result['report_error'] = str(e)
+    return result
+
+def combine_sheets(input_file: str, sheet_results: List[Dict], settings: Dict) -> Dict:
+    """Write the combined workbook of one input from its per-sheet results; never raises"""
+    result = {'input': input_file, 'output': None, 'sheets': len(sheet_results)}
+    sheets = [{'sheet': r['sheet'], 'results': r.pop('results', None), 'message': r.get('message')}
+              for r in sheet_results]
+    try:
+        if not any(sheet['results'] for sheet in sheets):
+            raise ValueError("No sheet could be analysed")
+        result['output'] = export_combined(
+            os.path.join(settings['output_dir'], output_name_for(input_file)),
+            sheets, settings['writer_backend']
+        )
+        result['status'] = 'success'
+    except Exception as e:
+        result['status'] = 'error'
+        result['message'] = str(e)
+    return result
+
+def run_batch(settings: Dict, files: List[str]) -> Dict:
+    """Fan the files (or their sheets) out over a process pool and collect a summary"""
+    os.makedirs(settings['output_dir'], exist_ok=True)
+    started = time.perf_counter()
+    tasks, results = find_tasks(files, settings['sheets'])
+    combined = []
+
+    # Sheets still running per input, to combine each workbook as soon as its last sheet is done
+    pending = {}
+    for input_file, _ in tasks:
+        pending[input_file] = pending.get(input_file, 0) + 1
+    by_input = {f: [] for f in pending}
+
+    workers = max(1, min(int(settings['workers']), len(tasks) or 1))
+    # Workers log through this process, which alone writes logs/app.log
+    with ProcessPoolExecutor(max_workers=workers, initializer=AppLogger.attach_worker,
+                             initargs=(AppLogger.worker_queue(),)) as pool:
+        futures = {pool.submit(analyze_file, f, settings, sheet): (i, f, sheet)
+                   for i, (f, sheet) in enumerate(tasks)}
+        for done, future in enumerate(as_completed(futures), 1):
+            position, input_file, sheet = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died
+                result = {'input': input_file, 'sheet': sheet, 'output': None, 'rows': 0,
+                          'status': 'error', 'message': str(e), 'seconds': None}
+            result['position'] = position
+            results.append(result)
+            print(f"[{done}/{len(tasks)}] {result['status']}: {result['input']}"
+                  + (f" [{sheet}]" if sheet is not None else '')
+                  + (f" ({result['message']})" if result['status'] == 'error' else ''))
+
+            if settings['sheets'] == 'combined':
+                by_input[input_file].append(result)
+                pending[input_file] -= 1
+                if pending[input_file] == 0:
+                    sheet_results = sorted(by_input.pop(input_file), key=lambda r: r['position'])
+                    combined.append(combine_sheets(input_file, sheet_results, settings))
+
+    elapsed = time.perf_counter() - started
+    results.sort(key=lambda r: (r['input'], r.get('position', -1)))
+    for result in results:
+        result.pop('position', None)
+    combined.sort(key=lambda r: r['input'])
+    succeeded = [r for r in results if r['status'] == 'success']
+    total_rows = sum(r['rows'] for r in succeeded)
+    failures = [r for r in results + combined if r['status'] != 'success']
+    summary = {
+        'input_dir': settings['input_dir'],
+        'output_dir': settings['output_dir'],
+        'workers': workers,
+        'sheets_mode': settings['sheets'],
+        'files': len(files),
+        'sheets': len(tasks),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'cached': sum(1 for r in succeeded if r.get('cached')),
+        'total_rows': total_rows,
+        'elapsed_seconds': round(elapsed, 3),
+        'files_per_second': round(len(files) / elapsed, 3) if elapsed else None,
+        'rows_per_second': round(total_rows / elapsed, 1) if elapsed else None,
+        'failures': [{'input': r['input'], 'sheet': r.get('sheet'), 'message': r['message']} for r in failures],
+        'results': results
+    }
+    if settings['sheets'] == 'combined':
+        summary['combined'] = combined
+        summary['failed'] += sum(1 for r in combined if r['status'] != 'success')
+    return summary
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description="Analyse every workbook in a directory without the GUI"
+    )
+    parser.add_argument('--config', help="JSON or YAML file with questions, dimensions and other settings")
+    parser.add_argument('--questions', help="Question column range, e.g. 2-16 (0-based, inclusive)")
+    parser.add_argument('--dimension', action='append', metavar='START-END',
+                        help="Column range of one dimension; repeat in dimension order")
+    parser.add_argument('--input-dir', help=f"Directory with input workbooks (default: {DEFAULT_INPUT_DIR})")
+    parser.add_argument('--output-dir', help=f"Directory for output workbooks (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument('--pattern', help="Glob pattern for input files (default: *.xlsx)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--backend', choices=sorted(WRITER_BACKENDS), help="Workbook writer backend")
+    parser.add_argument('--mapping', help="JSON file with the response label to score table")
+    parser.add_argument('--bootstrap', type=int, metavar='N',
+                        help="Add 95%% bootstrap confidence intervals from N replicates (default: off)")
+    parser.add_argument('--seed', type=int, help="Seed for reproducible bootstrap replicates")
+    parser.add_argument('--bootstrap-workers', type=int,
+                        help="Processes per file for bootstrap replicates (default: 1)")
+    parser.add_argument('--compute-workers', type=int,
+                        help="Calculations run at once per file, on threads or, for large inputs, processes (default: 1)")
+    parser.add_argument('--cache-dir', help=f"Result cache directory (default: {ResultCache.DEFAULT_CACHE_DIR})")
+    parser.add_argument('--no-cache', action='store_true', help="Always recompute, ignoring cached results")
+    parser.add_argument('--sidecar-dir', help="Keep converted copies of parsed workbooks here to skip re-parsing")
+    parser.add_argument('--profile', action='store_true',
+                        help=f"Profile each run with cProfile; dumps go to <output-dir>/{REPORTS_DIR}")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Record peak allocations per stage with tracemalloc (slower)")
+    parser.add_argument('--streaming', action='store_true', help="Stream question columns instead of loading whole sheets")
+    parser.add_argument('--sheets', choices=SHEET_MODES,
+                        help="Analyse the first sheet only (default), every sheet to its own workbook, "
+                             "or every sheet into one combined workbook with a summary sheet")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        settings = build_settings(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    files = find_inputs(settings['input_dir'], settings['pattern'])
+    if not files:
+        print(f"No files matching {settings['pattern']} in {settings['input_dir']}")
+        return 1
+
+    summary = run_batch(settings, files)
+    summary_file = os.path.join(settings['output_dir'], SUMMARY_FILE)
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    sheets = f" ({summary['sheets']} sheets)" if settings['sheets'] != 'first' else ''
+    print(f"Processed {summary['files']} files{sheets} in {summary['elapsed_seconds']}s "
+          f"({summary['succeeded']} succeeded, {summary['failed']} failed); summary: {summary_file}")
+    return 0 if summary['failed'] == 0 else 2
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,9 @@
-from .analyzer import StatisticalAnalyzer
+# Heavy analysis modules are imported on first access, so importing a light
+# module such as src.core.progress does not load pandas and the calculators
+__all__ = ['StatisticalAnalyzer']
 
-__all__ = ['StatisticalAnalyzer']
\ No newline at end of file
+def __getattr__(name):
+    if name == 'StatisticalAnalyzer':
+        from .analyzer import StatisticalAnalyzer
+        return StatisticalAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,53 @@
 # src/core/analyzer.py
 from .statistics_manager import StatisticsManager
+from .progress import AnalysisCancelled, ProgressReporter
+from .response_mapping import ResponseMapping
+from .result_cache import RESULT_READ_ERRORS
+from .streaming_reader import StreamingResponseReader
+from .workbook_cache import WorkbookCache
 from ..utils.logger import AppLogger
+from ..utils.profiling import RunProfiler
+import logging
+import numpy as np
 import pandas as pd
 import os
 
 class StatisticalAnalyzer:
-    def __init__(self, data_file, selected_columns, dimensions):
+    def __init__(self, data_file, selected_columns, dimensions, streaming=False, progress=None, mapping=None,
+                 bootstrap=None, result_cache=None, profiler=None, sheet_name=None, workers=1, processes=None):
+        """
+        With streaming=True only the question columns are read, through
+        openpyxl's read-only iterator, directly into a compact numeric matrix
+        instead of loading the whole sheet as a DataFrame. A ProgressReporter
+        receives stage progress and can cancel the run between stages.
+        mapping is the label to score table (a ResponseMapping, a dict or a
+        JSON file path); the default Arabic table is used when omitted.
+        A BootstrapEstimator adds confidence intervals to the alpha and
+        split-half sheets. With a ResultCache, a run identical to a cached
+        one skips loading and computing and restores the stored output.
+        Stages are timed in profiler's spans (a RunProfiler). sheet_name
+        selects the sheet to analyze; the first sheet is used when omitted.
+        workers and processes set how many calculations run at once and
+        whether on processes rather than threads (see StatisticsManager).
+        """
         self.logger = AppLogger.get_logger()
-        self.logger.info(f"Initializing StatisticalAnalyzer with {data_file}")
+        self.logger.info(f"Initializing StatisticalAnalyzer with {data_file}"
+                         + (f", sheet {sheet_name}" if sheet_name else ""))
+        self.sheet_name = sheet_name
+        self.streaming = streaming
+        self.responses = None
+        self.progress = progress or ProgressReporter()
+        self.profiler = profiler or RunProfiler()
+        self.mapping = ResponseMapping.coerce(mapping)
+        self.bootstrap = bootstrap
+        self.workers = workers
+        self.processes = processes
+        self.result_cache = result_cache
+        self.cache_key = None
+        self.cached = None
+        # Kept to load the workbook after all when a cached entry cannot be read
+        self._request = (data_file, selected_columns, dimensions)
+        self.n_rows = None
         
         # Log initial inputs
         self.logger.info("\n" + "="*80)
@@ -17,139 +57,261 @@ class StatisticalAnalyzer:
         self.logger.info("="*80)
         
         try:
-            # Read Excel file
-            xl = pd.ExcelFile(data_file)
-            sheet_name = xl.sheet_names[0]
-            self.data = pd.read_excel(data_file, sheet_name=sheet_name)
-            self.logger.info(f"Successfully loaded data: {len(self.data)} rows, {len(self.data.columns)} columns")
-            
-            # Map questions based on selected range
-            first_question_col = selected_columns[0]
-            last_question_col = selected_columns[-1]
-            self.questions = [self.data.columns[i] for i in range(first_question_col, last_question_col + 1)]
-            
-            # Process dimensions - Map column indices to actual column names
-            self.dimensions = {}
-            sorted_dim_nums = sorted(dimensions.keys())
-            
-            self.logger.info("\n" + "="*80)
-            self.logger.info("DIMENSIONS MAPPING DETAILS")
-            self.logger.info(f"Total number of dimensions to process: {len(sorted_dim_nums)}")
-            self.logger.info("="*80)
-            
-            # Track last processed index
-            last_index = first_question_col
-            
-            for i, dim_num in enumerate(sorted_dim_nums):
-                self.logger.info("\n" + "-"*80)
-                self.logger.info(f"DIMENSION {dim_num} ({i+1}/{len(sorted_dim_nums)})")
-                
-                if i < len(sorted_dim_nums) - 1:
-                    # Check if we need to skip to next sequence start
-                    current_indices = dimensions[dim_num]
-                    if current_indices[0] > last_index:
-                        self.logger.info(f"Skipping gap from {last_index} to {current_indices[0]}")
-                        last_index = current_indices[0]
-                    col_indices = [idx for idx in range(last_index, current_indices[-1] + 1)]
-                    last_index = current_indices[-1] + 1
-                else:
-                    # Last dimension takes all remaining columns
-                    col_indices = list(range(last_index, last_question_col + 1))
-                
-                self.logger.info(f"Processing indices: {','.join(map(str, col_indices))}")
-                dim_cols = [self.data.columns[idx] for idx in col_indices if idx < len(self.data.columns)]
-                
-                if dim_cols:
-                    self.dimensions[dim_num] = dim_cols
-                    self.logger.info(f"Column names ({len(dim_cols)}): {','.join(dim_cols)}")
-                else:
-                    self.logger.warning(f"No valid columns found")
-                
-                self.logger.info("-"*80)
+            if result_cache is not None:
+                with self.profiler.span('result_cache_lookup'):
+                    self.cache_key = result_cache.make_key(data_file, selected_columns, dimensions,
+                                                           self.mapping, bootstrap, sheet_name)
+                    self.cached = result_cache.lookup(self.cache_key)
+            if self.cached is not None:
+                # Nothing to load; analyze_and_export restores the stored output
+                self.data = None
+                self.questions = []
+                self.dimensions = {}
+                self.n_rows = self.cached.get('n_rows')
+                self.progress.report(10, "Found cached results")
+                return
             
-            # Verify mapping
-            total_dim_cols = sum(len(cols) for cols in self.dimensions.values())
-            self.logger.info(f"Total columns in dimensions: {total_dim_cols}")
-            self.logger.info(f"Total question columns: {len(self.questions)}")
-            if total_dim_cols != len(self.questions):
-                self.logger.warning("Mismatch between dimension columns and total questions")
+            self._load(data_file, selected_columns, dimensions)
             
+        except AnalysisCancelled:
+            self.logger.info("Analysis cancelled while loading")
+            raise
         except Exception as e:
             self.logger.error(f"Error initializing analyzer: {str(e)}")
             self.logger.error("Full error details:", exc_info=True)
             raise
        
-    def analyze_and_export(self, output_dir='/app/data/output'):
+    def _load(self, data_file, selected_columns, dimensions):
+        """Read the responses and map the selected column positions to questions and dimensions"""
+        self.progress.report(2, "Loading workbook...")
+        with self.profiler.span('load_workbook') as span:
+            if self.streaming:
+                # Only the header is needed to map columns; responses are streamed below
+                reader = StreamingResponseReader(data_file, mapping=self.mapping, sheet_name=self.sheet_name,
+                                                 progress=self.progress)
+                self.data = None
+                columns = reader.read_header()
+            else:
+                # Read Excel file (shared with the GUI through the workbook cache)
+                self.data = WorkbookCache.get_instance().load(data_file, self.sheet_name).data
+                columns = list(self.data.columns)
+                span.rows = len(self.data)
+                self.logger.info(f"Successfully loaded data: {len(self.data)} rows, {len(self.data.columns)} columns")
+            span.items = len(columns)
+        
+        # Map questions based on selected range
+        first_question_col = selected_columns[0]
+        last_question_col = selected_columns[-1]
+        if last_question_col >= len(columns):
+            raise ValueError(
+                f"Question range ends at column {last_question_col}, but the sheet has only {len(columns)} columns"
+            )
+        self.questions = [columns[i] for i in range(first_question_col, last_question_col + 1)]
+        
+        # Process dimensions - Map column indices to actual column names
+        self.dimensions = {}
+        sorted_dim_nums = sorted(dimensions.keys())
+        
+        self.logger.info("\n" + "="*80)
+        self.logger.info("DIMENSIONS MAPPING DETAILS")
+        self.logger.info(f"Total number of dimensions to process: {len(sorted_dim_nums)}")
+        self.logger.info("="*80)
+        
+        # Track last processed index
+        last_index = first_question_col
+        
+        for i, dim_num in enumerate(sorted_dim_nums):
+            self.logger.info("\n" + "-"*80)
+            self.logger.info(f"DIMENSION {dim_num} ({i+1}/{len(sorted_dim_nums)})")
+            
+            if i < len(sorted_dim_nums) - 1:
+                # Check if we need to skip to next sequence start
+                current_indices = dimensions[dim_num]
+                if current_indices[0] > last_index:
+                    self.logger.info(f"Skipping gap from {last_index} to {current_indices[0]}")
+                    last_index = current_indices[0]
+                col_indices = [idx for idx in range(last_index, current_indices[-1] + 1)]
+                last_index = current_indices[-1] + 1
+            else:
+                # Last dimension takes all remaining columns
+                col_indices = list(range(last_index, last_question_col + 1))
+            
+            self.logger.info(f"Processing indices: {','.join(map(str, col_indices))}")
+            dim_cols = [columns[idx] for idx in col_indices if idx < len(columns)]
+            
+            if dim_cols:
+                self.dimensions[dim_num] = dim_cols
+                self.logger.info(f"Column names ({len(dim_cols)}): {','.join(dim_cols)}")
+            else:
+                self.logger.warning(f"No valid columns found")
+            
+            self.logger.info("-"*80)
+        
+        # Verify mapping
+        total_dim_cols = sum(len(cols) for cols in self.dimensions.values())
+        self.logger.info(f"Total columns in dimensions: {total_dim_cols}")
+        self.logger.info(f"Total question columns: {len(self.questions)}")
+        if total_dim_cols != len(self.questions):
+            self.logger.warning("Mismatch between dimension columns and total questions")
+        
+        if self.streaming:
+            # Stream every column used by a question or a dimension
+            positions = {name: i for i, name in enumerate(columns)}
+            used = [positions[name] for name in self.questions]
+            used += [positions[name] for cols in self.dimensions.values() for name in cols]
+            with self.profiler.span('stream_responses', items=len(used)) as span:
+                # The sidecar holds converted copies of first sheets only
+                sidecar = WorkbookCache.get_instance().sidecar if self.sheet_name is None else None
+                converted = sidecar.load_matrix(data_file, used, self.mapping) if sidecar is not None else None
+                if converted is not None:
+                    self.responses = converted[0]
+                else:
+                    self.responses, _ = reader.read(used)
+                    if sidecar is not None:
+                        sidecar.store_matrix(data_file, used, self.mapping, self.responses, columns)
+                span.rows = self.responses.n_rows
+            self.logger.info(f"Successfully streamed data: {self.responses.n_rows} rows, {len(self.responses.questions)} columns")
+        
+        self.progress.report(10, "Workbook loaded")
+
+    def analyze_and_export(self, output_dir='/app/data/output', writer_backend='xlsxwriter',
+                           output_name='statistical_analysis.xlsx'):
         try:
+            if self.cached is not None:
+                output_file = self._restore_cached(output_dir, writer_backend, output_name)
+                if output_file is not None:
+                    return output_file
+            
             self.logger.info("Starting analysis")
             self.logger.debug(f"Ensuring output directory: {output_dir}")
             
-            # Clean data before analysis
-            self.clean_data()
-            
-            # Create statistics manager and run analysis
-            stats_manager = StatisticsManager(self.data, self.questions, self.dimensions)
-            output_file = stats_manager.analyze_and_export(output_dir)
+            stats_manager = self._statistics_manager()
+            output_file = stats_manager.analyze_and_export(output_dir, writer_backend, output_name)
             
             self.logger.info("Analysis completed successfully")
+            if self.result_cache is not None:
+                with self.profiler.span('result_cache_store'):
+                    self.result_cache.store(self.cache_key, stats_manager.results, output_file,
+                                            writer_backend, self.n_rows)
             
             # Verify file exists
             if os.path.exists(output_file):
                 self.logger.info(f"File successfully created: {output_file}")
+                self.progress.report(100, "Analysis complete!")
                 return output_file
             else:
                 self.logger.error("File was not created")
                 raise FileNotFoundError("Output file was not created")
             
+        except AnalysisCancelled:
+            self.logger.info("Analysis cancelled")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error during analysis: {str(e)}")
+            self.logger.error("Full error details:", exc_info=True)
+            raise
+       
+    def compute_results(self):
+        """
+        Results of the analysis without writing a workbook, for callers that
+        render several analyses together. A cached run returns the stored results.
+        """
+        try:
+            if self.cached is not None:
+                try:
+                    return self.result_cache.load_results(self.cache_key)
+                except RESULT_READ_ERRORS as e:
+                    self._drop_cached(e)
+            
+            self.logger.info("Starting analysis")
+            return self._statistics_manager().compute_results()
+            
+        except AnalysisCancelled:
+            self.logger.info("Analysis cancelled")
+            raise
         except Exception as e:
             self.logger.error(f"Error during analysis: {str(e)}")
             self.logger.error("Full error details:", exc_info=True)
             raise
        
+    def _statistics_manager(self):
+        """Clean the loaded data and hand it to a StatisticsManager"""
+        # Clean data before analysis; streamed responses were cleaned while reading
+        self.progress.report(12, "Cleaning data...")
+        if self.streaming:
+            data = self.responses
+        else:
+            with self.profiler.span('clean_data', len(self.data), len(self.questions)):
+                self.clean_data()
+            data = self.data
+        self.n_rows = data.n_rows if self.streaming else len(data)
+        
+        # Create statistics manager for the analysis
+        self.progress.report(18, "Preparing response matrix...")
+        return StatisticsManager(data, self.questions, self.dimensions, self.progress, self.bootstrap,
+                                 self.profiler, self.workers, self.processes)
+       
+    def _restore_cached(self, output_dir, writer_backend, output_name):
+        """
+        Write the output of an identical earlier run without recomputing it.
+        Returns None, with the workbook loaded for a normal run, when the
+        stored results cannot be read.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, output_name)
+        self.progress.report(50, "Restoring cached results...")
+        
+        def render(results, path):
+            # Stored results written by another backend are exported again
+            return StatisticsManager(None, [], {}, self.progress, profiler=self.profiler).export_results(results, path, writer_backend)
+        
+        with self.profiler.span('restore_cached', rows=self.n_rows):
+            try:
+                self.result_cache.restore(self.cache_key, self.cached, output_file, writer_backend, render)
+            except RESULT_READ_ERRORS as e:
+                self._drop_cached(e)
+                return None
+        self.logger.info(f"Restored cached analysis to {output_file}")
+        self.progress.report(100, "Analysis complete!")
+        return output_file
+       
+    def _drop_cached(self, error):
+        """Forget an unreadable cache entry and load the workbook for a normal run"""
+        self.logger.warning(f"Cached results could not be read, recomputing: {str(error)}")
+        self.result_cache.discard(self.cache_key)
+        self.cached = None
+        self.n_rows = None
+        self._load(*self._request)
+
     def clean_data(self):
         """Clean and prepare data for analysis"""
         try:
             self.logger.info("Starting data cleaning")
             
             self.logger.debug(f"Data shape before cleaning: {self.data.shape}")
-            self.logger.debug(f"Column dtypes before cleaning: {self.data.dtypes}")
-            
-            # Identify the header row
-            def is_header_row(row):
-                # Check if the row contains column-like text in question columns
-                return any(
-                    pd.isna(row[col]) or 
-                    (isinstance(row[col], str) and (
-                        row[col].strip() in ['', 'مكتسبة بشكل كامل', 'مكتسبة بدرجة متوسطة', 'غير مكتسبة']
-                    )) 
-                    for col in self.questions
-                )
-            
-            # Find the first non-header row
-            first_data_row = next((i for i in range(len(self.data)) if not is_header_row(self.data.iloc[i])), 0)
-            
-            # Slice the dataframe from the first non-header row
-            self.data = self.data.iloc[first_data_row:].reset_index(drop=True)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Column dtypes before cleaning: {self.data.dtypes}")
             
-            self.logger.debug(f"Data shape after identifying first data row: {self.data.shape}")
+            # Score the whole question block through its unique values
+            cells = self.data[self.questions].to_numpy(dtype=object)
+            scores, header_like = self.mapping.convert(cells)
             
-            # Convert Arabic text responses to numerical values
-            mapping = {
-                'مكتسبة بشكل كامل': 3,
-                'مكتسبة بدرجة متوسطة': 2,
-                'غير مكتسبة': 1
-            }
+            # The first row without empty or header-like cells starts the data
+            data_rows = np.flatnonzero(~header_like)
+            first_data_row = int(data_rows[0]) if len(data_rows) else 0
             
-            for col in self.questions:
-                if self.data[col].dtype == 'object':
-                    self.logger.debug(f"Converting text responses in column: {col}")
-                    self.logger.debug(f"Unique values before mapping: {self.data[col].unique()}")
-                    self.data[col] = self.data[col].map(mapping)
-                    self.logger.debug(f"Unique values after mapping: {self.data[col].unique()}")
+            self.data = self.data.iloc[first_data_row:].reset_index(drop=True)
+            self.data[self.questions] = scores[first_data_row:]
+            
+            self.logger.debug(f"Data shape after identifying first data row: {self.data.shape}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                unmapped = np.isnan(scores[first_data_row:]) & pd.notna(cells[first_data_row:])
+                self.logger.debug(f"Cells without a score after mapping: {int(unmapped.sum())}")
             
             self.logger.info("Data cleaning completed")
             self.logger.debug(f"Final data shape: {self.data.shape}")
-            self.logger.debug(f"Final column dtypes: {self.data.dtypes}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Final column dtypes: {self.data.dtypes}")
             
         except Exception as e:
             self.logger.error(f"Error during data cleaning: {str(e)}")
@@ -0,0 +1,25 @@
+# src/core/column_names.py
+from typing import List
+
+def make_column_names(header_cells) -> List[str]:
+    """
+    Name header cells the way pd.read_excel does: empty cells become
+    'Unnamed: <position>' and repeated names get '.1', '.2', ... suffixes,
+    skipping suffixed names that already appear in the header
+    """
+    names = [f"Unnamed: {i}" if cell is None else str(cell) for i, cell in enumerate(header_cells)]
+    original = set(names)
+    unnamed = [i for i, cell in enumerate(header_cells) if cell is None]
+    named = [i for i, cell in enumerate(header_cells) if cell is not None]
+    counts = {}
+    # pandas numbers the named columns first, then the unnamed ones
+    for i in named + unnamed:
+        name = base = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
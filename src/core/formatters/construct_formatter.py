@@ -1,121 +1,76 @@
 # src/core/formatters/construct_formatter.py
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from typing import Dict
+from typing import Union
+import numpy as np
+from ..statistics.results import ConstructValidityResult
+from .writers import SheetWriter, WorkbookWriter, as_sheet_writer, column_text_width, titled_sheet
 
 class ConstructValidityFormatter:
     """Formats Construct Validity results into Excel worksheet"""
     
     @staticmethod
-    def format_results(wb: Workbook, results: Dict, prefix: str = "") -> None:
+    def format_results(wb: Union[Workbook, WorkbookWriter], results: ConstructValidityResult, prefix: str = "") -> None:
         """Format results to the active sheet with optional prefix"""
-        ws = wb.active
         title_prefix = f"{prefix} " if prefix else ""
-        ws.title = f"{title_prefix}Construct Validity - الصدق البنائي"
+        ws = titled_sheet(wb, f"{title_prefix}Construct Validity - الصدق البنائي")
         ConstructValidityFormatter.format_results_to_sheet(ws, results)
 
     @staticmethod
-    def format_results_to_sheet(ws: Worksheet, results: Dict) -> None:
+    def format_results_to_sheet(ws: Union[Worksheet, SheetWriter], results: ConstructValidityResult) -> None:
         """Format results to a specific worksheet"""
+        ws = as_sheet_writer(ws)
+        
         # Apply headers for correlation summary
         headers = [
             "Dimension / البعد",
             "Correlation / معامل الارتباط",
             "Interpretation / التفسير"
         ]
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            ConstructValidityFormatter._apply_header_style(cell)
+        ws.write_row(1, headers, style='header')
         
         # Add correlation results
-        correlations = results['correlations']
-        interpretations = results['interpretation']
+        dimensions = results.dimensions
+        summary = zip(dimensions, results.correlations.tolist(), results.interpretations)
         
-        for row, (dim_num, correlation) in enumerate(correlations.items(), 2):
-            ws.cell(row=row, column=1, value=f"Dimension {dim_num} / البعد {dim_num}")
-            ws.cell(row=row, column=2, value=round(correlation, 6))
-            ws.cell(row=row, column=3, value=interpretations[dim_num])
-            
-            for col in range(1, 4):
-                ConstructValidityFormatter._apply_data_style(ws.cell(row=row, column=col))
+        for row, (dim_num, correlation, interpretation) in enumerate(summary, 2):
+            ws.write_row(row, (
+                f"Dimension {dim_num} / البعد {dim_num}",
+                round(correlation, 6),
+                interpretation
+            ), style='data')
         
-        # Add detailed scores table starting at row 8
-        ws.cell(row=7, column=1, value="Participant Scores and Ranks / درجات وترتيب المشاركين")
-        ws.cell(row=8, column=1, value="Participant / المشارك")
-        ws.cell(row=8, column=2, value="Total Score / المجموع الكلي")
-        ws.cell(row=8, column=3, value="Total Rank / الترتيب الكلي")
+        # Detailed scores table below the summary (row 8 unless there are more than five dimensions)
+        title_row = max(7, len(dimensions) + 2)
+        header_row = title_row + 1
+        ws.write(title_row, 1, "Participant Scores and Ranks / درجات وترتيب المشاركين")
         
-        col_offset = 4
-        for dim_num in correlations.keys():
-            ws.cell(row=8, column=col_offset, value=f"Dim {dim_num} Score / درجة البعد {dim_num}")
-            ws.cell(row=8, column=col_offset + 1, value=f"Dim {dim_num} Rank / ترتيب البعد {dim_num}")
-            col_offset += 2
+        table_headers = [
+            "Participant / المشارك",
+            "Total Score / المجموع الكلي",
+            "Total Rank / الترتيب الكلي"
+        ]
+        for dim_num in dimensions:
+            table_headers.append(f"Dim {dim_num} Score / درجة البعد {dim_num}")
+            table_headers.append(f"Dim {dim_num} Rank / ترتيب البعد {dim_num}")
+        ws.write_row(header_row, table_headers, style='header')
         
-        for col in range(1, col_offset):
-            ConstructValidityFormatter._apply_header_style(ws.cell(row=8, column=col))
+        # Participant data as one numeric table: total score/rank, then score/rank for each dimension
+        participants = results.participants.astype(str)
+        table = np.empty((len(participants), 2 + 2 * len(dimensions)))
+        table[:, 0] = results.total_scores
+        table[:, 1] = results.total_ranks
+        table[:, 2::2] = results.dimension_scores
+        table[:, 3::2] = results.dimension_ranks
         
-        # Add participant data
-        total_scores = results['total_scores']
-        total_ranks = results['total_ranks']
-        dimension_results = results['dimension_results']
+        # Column widths come from the source values, not from the written cells
+        column_widths = {1: column_text_width(participants)}
+        for col in range(table.shape[1]):
+            column_widths[col + 2] = column_text_width(table[:, col])
+        ws.note_column_widths(column_widths)
         
-        for idx, (participant, total_score) in enumerate(total_scores.items(), 9):
-            # Add participant and total scores/ranks
-            ws.cell(row=idx, column=1, value=str(participant))
-            ws.cell(row=idx, column=2, value=total_score)
-            ws.cell(row=idx, column=3, value=total_ranks[participant])
-            
-            # Add dimension scores/ranks
-            col_offset = 4
-            for dim_num in correlations.keys():
-                dim_data = dimension_results[dim_num]
-                ws.cell(row=idx, column=col_offset, value=dim_data['scores'][participant])
-                ws.cell(row=idx, column=col_offset + 1, value=dim_data['ranks'][participant])
-                col_offset += 2
-            
-            for col in range(1, col_offset):
-                ConstructValidityFormatter._apply_data_style(ws.cell(row=idx, column=col))
+        for idx, (participant, row) in enumerate(zip(participants, table), header_row + 1):
+            ws.write_row(idx, [participant] + row.tolist(), style='data', track_widths=False)
             
         # Adjust column widths
-        ConstructValidityFormatter._adjust_column_widths(ws)
-        
-    @staticmethod
-    def _apply_header_style(cell):
-        """Apply consistent header styling"""
-        cell.font = Font(bold=True, size=12)
-        cell.fill = PatternFill(start_color="CCE5FF", end_color="CCE5FF", fill_type="solid")
-        cell.border = Border(
-            bottom=Side(style='medium'),
-            top=Side(style='medium'),
-            left=Side(style='thin'),
-            right=Side(style='thin')
-        )
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    @staticmethod
-    def _apply_data_style(cell):
-        """Apply consistent data cell styling"""
-        cell.border = Border(
-            bottom=Side(style='thin'),
-            top=Side(style='thin'),
-            left=Side(style='thin'),
-            right=Side(style='thin')
-        )
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    @staticmethod
-    def _adjust_column_widths(ws):
-        """Adjust column widths based on content"""
-        for column in ws.columns:
-            max_length = 0
-            column = list(column)
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            ws.column_dimensions[column[0].column_letter].width = min(adjusted_width, 40)
\ No newline at end of file
+        ws.adjust_column_widths()
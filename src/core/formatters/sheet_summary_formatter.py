@@ -0,0 +1,71 @@
+# src/core/formatters/sheet_summary_formatter.py
+from openpyxl.worksheet.worksheet import Worksheet
+from typing import Dict, List, Union
+from .writers import SheetWriter, as_sheet_writer
+
+class SheetSummaryFormatter:
+    """Formats the cross-sheet comparison of a multi-sheet analysis into Excel worksheet"""
+
+    @staticmethod
+    def _value(value):
+        if value is None or value != value:
+            return "N/A"
+        return round(value, 6)
+
+    @staticmethod
+    def format_results_to_sheet(ws: Union[Worksheet, SheetWriter], sheets: List[Dict]) -> None:
+        """
+        One row per input sheet with the number of complete responses the
+        coefficients were computed from, Cronbach's Alpha and Spearman-Brown
+        split-half coefficient, overall and for each dimension. Each entry
+        holds 'sheet', 'summary' (None when the analysis failed) and 'message'.
+        """
+        ws = as_sheet_writer(ws)
+
+        # Every sheet is analysed with the same dimensions; collect them in order
+        dimensions = []
+        for sheet in sheets:
+            for dim_num in (sheet['summary'] or {}).get('dimensions', {}):
+                if dim_num not in dimensions:
+                    dimensions.append(dim_num)
+
+        headers = [
+            "# / الرقم",
+            "Sheet / الورقة",
+            "Responses / عدد الاستجابات",
+            "Cronbach's Alpha / معامل ألفا كرونباخ",
+            "Spearman-Brown Coefficient / معامل سبيرمان-براون"
+        ]
+        for dim_num in dimensions:
+            headers += [
+                f"Dimension {dim_num} Alpha / ألفا البعد {dim_num}",
+                f"Dimension {dim_num} Split-Half / التجزئة النصفية للبعد {dim_num}"
+            ]
+        headers.append("Note / ملاحظة")
+        ws.write_row(1, headers, style='header')
+
+        for row, sheet in enumerate(sheets, 2):
+            summary = sheet['summary']
+            if summary is None:
+                values = [row - 1, sheet['sheet'], "N/A", "N/A", "N/A"]
+                values += ["N/A"] * (2 * len(dimensions))
+                values.append(sheet.get('message') or "")
+            else:
+                values = [
+                    row - 1,
+                    sheet['sheet'],
+                    summary['responses'],
+                    SheetSummaryFormatter._value(summary['alpha']),
+                    SheetSummaryFormatter._value(summary['split_half'])
+                ]
+                for dim_num in dimensions:
+                    dim_summary = summary['dimensions'].get(dim_num, {})
+                    values += [
+                        SheetSummaryFormatter._value(dim_summary.get('alpha')),
+                        SheetSummaryFormatter._value(dim_summary.get('split_half'))
+                    ]
+                values.append("")
+            ws.write_row(row, values, style='data')
+
+        # Adjust column widths
+        ws.adjust_column_widths()
@@ -1,23 +1,25 @@
 # src/core/formatters/split_half_formatter.py
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from typing import Dict
+from typing import List, Tuple, Union
+from ..statistics.results import SplitDistributionResult, SplitHalfResult
+from .writers import SheetWriter, WorkbookWriter, as_sheet_writer, column_text_width, titled_sheet
 
 class SplitHalfFormatter:
     """Formats Split-Half reliability results into Excel worksheet"""
     
     @staticmethod
-    def format_results(wb: Workbook, results: Dict, prefix: str = "") -> None:
+    def format_results(wb: Union[Workbook, WorkbookWriter], results: SplitHalfResult, prefix: str = "") -> None:
         """Format results to the active sheet with optional prefix"""
-        ws = wb.active
         title_prefix = f"{prefix} " if prefix else ""
-        ws.title = f"{title_prefix}Split Half - التجزئة النصفية"
+        ws = titled_sheet(wb, f"{title_prefix}Split Half - التجزئة النصفية")
         SplitHalfFormatter.format_results_to_sheet(ws, results)
 
     @staticmethod
-    def format_results_to_sheet(ws: Worksheet, results: Dict) -> None:
+    def format_results_to_sheet(ws: Union[Worksheet, SheetWriter], results: SplitHalfResult) -> None:
         """Format results to a specific worksheet"""
+        ws = as_sheet_writer(ws)
+        
         # Apply headers
         headers = [
             "Metric / المقياس",
@@ -25,92 +27,103 @@ class SplitHalfFormatter:
             "Interpretation / التفسير"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            SplitHalfFormatter._apply_header_style(cell)
+        # Bootstrap interval columns, only when an interval was computed
+        ci = results.spearman_brown_ci
+        if ci is not None:
+            level = f"{ci.confidence:.0%}"
+            headers += [
+                f"{level} CI Lower / الحد الأدنى لفترة الثقة",
+                f"{level} CI Upper / الحد الأعلى لفترة الثقة"
+            ]
+        ws.write_row(1, headers, style='header')
         
         # Add results
         row_data = [
             ("Odd Questions Count / عدد الأسئلة الفردية", 
-             len(results['odd_questions']), 
+             len(results.odd_questions), 
              ""),
             ("Even Questions Count / عدد الأسئلة الزوجية",
-             len(results['even_questions']),
+             len(results.even_questions),
              ""),
             ("Pearson Correlation / معامل ارتباط بيرسون",
-             round(results['pearson_correlation'], 6),
+             round(results.pearson_correlation, 6),
              ""),
             ("Spearman-Brown Coefficient / معامل سبيرمان-براون",
-             round(results['spearman_brown'], 6),
-             results.get('interpretation', ''))
+             round(results.spearman_brown, 6),
+             results.interpretation)
         ]
         
-        for row, (metric, value, interp) in enumerate(row_data, 2):
-            ws.cell(row=row, column=1, value=metric)
-            ws.cell(row=row, column=2, value=value)
-            ws.cell(row=row, column=3, value=interp)
-            SplitHalfFormatter._apply_data_style(ws.cell(row=row, column=1))
-            SplitHalfFormatter._apply_data_style(ws.cell(row=row, column=2))
-            SplitHalfFormatter._apply_data_style(ws.cell(row=row, column=3))
+        if ci is not None:
+            row_data[-1] += (round(ci.lower, 6), round(ci.upper, 6))
+        
+        for row, values in enumerate(row_data, 2):
+            ws.write_row(row, values, style='data')
             
         # Add participant sums table starting at row 8
-        ws.cell(row=7, column=1, value="Participant Sums / مجموع درجات المشاركين")
-        ws.cell(row=8, column=1, value="Participant / المشارك")
-        ws.cell(row=8, column=2, value="Odd Sum / مجموع الأسئلة الفردية")
-        ws.cell(row=8, column=3, value="Even Sum / مجموع الأسئلة الزوجية")
+        ws.write(7, 1, "Participant Sums / مجموع درجات المشاركين")
+        ws.write_row(8, [
+            "Participant / المشارك",
+            "Odd Sum / مجموع الأسئلة الفردية",
+            "Even Sum / مجموع الأسئلة الزوجية"
+        ], style='header')
         
-        for col in range(1, 4):
-            SplitHalfFormatter._apply_header_style(ws.cell(row=8, column=col))
+        participants = results.participants.astype(str)
+        odd_sums = results.odd_sums
+        even_sums = results.even_sums
         
-        odd_sums = results['odd_sums']
-        even_sums = results['even_sums']
+        # Column widths come from the source values, not from the written cells
+        ws.note_column_widths({
+            1: column_text_width(participants),
+            2: column_text_width(odd_sums),
+            3: column_text_width(even_sums)
+        })
         
-        for idx, (participant, odd_sum) in enumerate(odd_sums.items(), 9):
-            ws.cell(row=idx, column=1, value=str(participant))
-            ws.cell(row=idx, column=2, value=odd_sum)
-            ws.cell(row=idx, column=3, value=even_sums[participant])
-            
-            for col in range(1, 4):
-                SplitHalfFormatter._apply_data_style(ws.cell(row=idx, column=col))
+        # Rows are read by position from the aligned arrays
+        for idx, row_values in enumerate(zip(participants, odd_sums.tolist(), even_sums.tolist()), 9):
+            ws.write_row(idx, row_values, style='data', track_widths=False)
             
         # Adjust column widths
-        SplitHalfFormatter._adjust_column_widths(ws)
-        
-    @staticmethod
-    def _apply_header_style(cell):
-        """Apply consistent header styling"""
-        cell.font = Font(bold=True, size=12)
-        cell.fill = PatternFill(start_color="CCE5FF", end_color="CCE5FF", fill_type="solid")
-        cell.border = Border(
-            bottom=Side(style='medium'),
-            top=Side(style='medium'),
-            left=Side(style='thin'),
-            right=Side(style='thin')
-        )
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    @staticmethod
-    def _apply_data_style(cell):
-        """Apply consistent data cell styling"""
-        cell.border = Border(
-            bottom=Side(style='thin'),
-            top=Side(style='thin'),
-            left=Side(style='thin'),
-            right=Side(style='thin')
-        )
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        ws.adjust_column_widths()
 
     @staticmethod
-    def _adjust_column_widths(ws):
-        """Adjust column widths based on content"""
-        for column in ws.columns:
-            max_length = 0
-            column = list(column)
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            ws.column_dimensions[column[0].column_letter].width = min(adjusted_width, 40)
\ No newline at end of file
+    def format_distribution_to_sheet(ws: Union[Worksheet, SheetWriter],
+                                     distributions: List[Tuple[str, SplitDistributionResult]]) -> None:
+        """Format split-half distributions, one row per question set"""
+        ws = as_sheet_writer(ws)
+        
+        headers = [
+            "Scope / النطاق",
+            "Items / عدد الأسئلة",
+            "Splits / عدد التجزئات",
+            "Method / الطريقة",
+            "Guttman Min / أدنى معامل جتمان",
+            "Guttman Mean / متوسط معامل جتمان",
+            "Lambda 4 (Guttman Max) / لامدا 4",
+            "Spearman-Brown Min / أدنى سبيرمان-براون",
+            "Spearman-Brown Mean / متوسط سبيرمان-براون",
+            "Spearman-Brown Max / أعلى سبيرمان-براون",
+            "Lambda 4 First Half / النصف الأول للامدا 4"
+        ]
+        ws.write_row(1, headers, style='header')
+        
+        for row, (scope, result) in enumerate(distributions, 2):
+            if result.status != 'success':
+                ws.write_row(row, (scope, len(result.questions), 0, result.message), style='data')
+                continue
+            method = "All splits / جميع التجزئات" if result.exhaustive else "Random splits / تجزئات عشوائية"
+            ws.write_row(row, (
+                scope,
+                len(result.questions),
+                result.n_splits,
+                method,
+                round(result.guttman_min, 6),
+                round(result.guttman_mean, 6),
+                round(result.guttman_max, 6),
+                round(result.spearman_brown_min, 6),
+                round(result.spearman_brown_mean, 6),
+                round(result.spearman_brown_max, 6),
+                ", ".join(result.best_split)
+            ), style='data')
+        
+        # Adjust column widths
+        ws.adjust_column_widths()
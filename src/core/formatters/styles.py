@@ -0,0 +1,73 @@
+# src/core/formatters/styles.py
+from typing import Dict
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+
+HEADER = 'header'
+DATA = 'data'
+
+# Names under which the styles are registered in openpyxl workbooks
+NAMED_STYLES = {
+    HEADER: 'AutoRanker Header',
+    DATA: 'AutoRanker Data'
+}
+
+# XlsxWriter equivalents of the named styles
+XLSXWRITER_FORMATS = {
+    HEADER: {
+        'bold': True, 'font_size': 12, 'bg_color': '#CCE5FF', 'pattern': 1,
+        'top': 2, 'bottom': 2, 'left': 1, 'right': 1,
+        'align': 'center', 'valign': 'vcenter', 'text_wrap': True
+    },
+    DATA: {
+        'top': 1, 'bottom': 1, 'left': 1, 'right': 1,
+        'align': 'center', 'valign': 'vcenter', 'text_wrap': True
+    }
+}
+
+def _build_named_style(style: str) -> NamedStyle:
+    alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    if style == HEADER:
+        return NamedStyle(
+            name=NAMED_STYLES[HEADER],
+            font=Font(bold=True, size=12),
+            fill=PatternFill(start_color="CCE5FF", end_color="CCE5FF", fill_type="solid"),
+            border=Border(
+                bottom=Side(style='medium'),
+                top=Side(style='medium'),
+                left=Side(style='thin'),
+                right=Side(style='thin')
+            ),
+            alignment=alignment
+        )
+    return NamedStyle(
+        name=NAMED_STYLES[DATA],
+        border=Border(
+            bottom=Side(style='thin'),
+            top=Side(style='thin'),
+            left=Side(style='thin'),
+            right=Side(style='thin')
+        ),
+        alignment=alignment
+    )
+
+class StyleRegistry:
+    """
+    Workbook-level cell styles shared by every formatter.
+
+    Each style is created once per workbook, as a NamedStyle for openpyxl or
+    a Format for XlsxWriter; cells then only reference it by name or handle.
+    """
+
+    @staticmethod
+    def openpyxl_styles(wb) -> Dict[str, str]:
+        """Register the named styles in an openpyxl workbook once and return their names"""
+        registered = set(wb.named_styles)
+        for style, name in NAMED_STYLES.items():
+            if name not in registered:
+                wb.add_named_style(_build_named_style(style))
+        return dict(NAMED_STYLES)
+
+    @staticmethod
+    def xlsxwriter_formats(wb) -> Dict[str, object]:
+        """Create one Format per style for an XlsxWriter workbook"""
+        return {style: wb.add_format(spec) for style, spec in XLSXWRITER_FORMATS.items()}
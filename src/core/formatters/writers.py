@@ -0,0 +1,264 @@
+# src/core/formatters/writers.py
+import os
+import tempfile
+import numpy as np
+import xlsxwriter
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+from .styles import StyleRegistry
+
+# Widest column produced by the width adjustment
+MAX_COLUMN_WIDTH = 40
+
+# Rows written between two cancellation checks
+CANCEL_CHECK_ROWS = 2000
+
+# Longest sheet title Excel accepts
+MAX_SHEET_TITLE = 31
+
+def column_text_width(values) -> int:
+    """Longest rendered text in a column of values, computed with vectorized string lengths"""
+    values = np.asarray(values)
+    if values.size == 0:
+        return 0
+    if values.dtype.kind == 'f':
+        # Empty and NaN cells are not rendered
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return 0
+    return int(np.char.str_len(values.astype(str)).max())
+
+class SheetWriter:
+    """
+    Worksheet interface used by the formatters.
+
+    Rows and columns are 1-based as in openpyxl. Backends that stream to
+    disk require rows of a sheet to be written in ascending order. The
+    widest rendered value of each column is tracked as cells are written,
+    so fitting column widths never rescans the finished sheet.
+    """
+
+    def __init__(self, progress=None):
+        self.widths = {}
+        self.progress = progress
+        self._rows_until_check = CANCEL_CHECK_ROWS
+
+    def _checkpoint(self) -> None:
+        """Give a pending cancellation a chance to stop the export every few thousand rows"""
+        self._rows_until_check -= 1
+        if self._rows_until_check <= 0:
+            self._rows_until_check = CANCEL_CHECK_ROWS
+            if self.progress is not None:
+                self.progress.check_cancelled()
+
+    def _write_cell(self, row: int, col: int, value, style: str = None) -> None:
+        raise NotImplementedError
+
+    def _set_column_width(self, col: int, width: float) -> None:
+        raise NotImplementedError
+
+    def write(self, row: int, col: int, value, style: str = None) -> None:
+        self._write_cell(row, col, value, style)
+        if value:
+            self.widths[col] = max(self.widths.get(col, 0), len(str(value)))
+
+    def write_row(self, row: int, values, style: str = None, start_col: int = 1,
+                  track_widths: bool = True) -> None:
+        """
+        Write consecutive cells of a row. Pass track_widths=False when the
+        column widths were already reported through note_column_widths.
+        """
+        for col, value in enumerate(values, start_col):
+            self._write_cell(row, col, value, style)
+        if track_widths:
+            self._track_row(values, start_col)
+
+    def _track_row(self, values, start_col: int) -> None:
+        widths = self.widths
+        for col, value in enumerate(values, start_col):
+            if value:
+                widths[col] = max(widths.get(col, 0), len(str(value)))
+
+    def note_column_widths(self, column_widths: dict) -> None:
+        """Record widths computed from the source data, keyed by 1-based column"""
+        for col, width in column_widths.items():
+            self.widths[col] = max(self.widths.get(col, 0), width)
+
+    def adjust_column_widths(self) -> None:
+        """Adjust column widths based on content"""
+        for col, max_length in self.widths.items():
+            self._set_column_width(col, min(max_length + 2, MAX_COLUMN_WIDTH))
+
+class WorkbookWriter:
+    """Workbook interface used by StatisticsManager; the output path is fixed at creation"""
+
+    def __init__(self, output_file: str, progress=None):
+        self.output_file = output_file
+        self.progress = progress
+
+    def add_sheet(self, title: str) -> SheetWriter:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def discard(self) -> None:
+        """Abandon a partially written workbook, leaving any existing output file untouched"""
+
+class OpenpyxlSheetWriter(SheetWriter):
+    """Writes into an in-memory openpyxl worksheet"""
+
+    def __init__(self, ws: Worksheet, progress=None):
+        super().__init__(progress)
+        self.ws = ws
+        self.styles = StyleRegistry.openpyxl_styles(ws.parent)
+
+    def _write_cell(self, row, col, value, style=None):
+        if isinstance(value, np.generic):
+            value = value.item()
+        cell = self.ws.cell(row=row, column=col, value=value)
+        if style is not None:
+            cell.style = self.styles[style]
+
+    def write_row(self, row, values, style=None, start_col=1, track_widths=True):
+        self._checkpoint()
+        # Resolve the named style once for the whole row
+        style_name = self.styles[style] if style is not None else None
+        for col, value in enumerate(values, start_col):
+            if isinstance(value, np.generic):
+                value = value.item()
+            cell = self.ws.cell(row=row, column=col, value=value)
+            if style_name is not None:
+                cell.style = style_name
+        if track_widths:
+            self._track_row(values, start_col)
+
+    def _set_column_width(self, col, width):
+        self.ws.column_dimensions[get_column_letter(col)].width = width
+
+class OpenpyxlWorkbookWriter(WorkbookWriter):
+    """Builds the whole workbook in memory with openpyxl and saves it on close"""
+
+    def __init__(self, output_file: str, progress=None):
+        super().__init__(output_file, progress)
+        self.wb = Workbook()
+        self._default_sheet_used = False
+
+    def add_sheet(self, title):
+        if not self._default_sheet_used:
+            # Reuse the sheet openpyxl creates with every workbook
+            ws = self.wb.active
+            ws.title = title
+            self._default_sheet_used = True
+        else:
+            ws = self.wb.create_sheet(title=title)
+        return OpenpyxlSheetWriter(ws, self.progress)
+
+    def close(self):
+        self.wb.save(self.output_file)
+
+class XlsxWriterSheetWriter(SheetWriter):
+    """Streams rows to disk through an XlsxWriter worksheet in constant_memory mode"""
+
+    def __init__(self, ws, formats, progress=None):
+        super().__init__(progress)
+        self.ws = ws
+        self.formats = formats
+
+    def _write_cell(self, row, col, value, style=None):
+        self.ws.write(row - 1, col - 1, value, self.formats.get(style))
+
+    def write_row(self, row, values, style=None, start_col=1, track_widths=True):
+        self._checkpoint()
+        # One shared Format for every cell of the row
+        self.ws.write_row(row - 1, start_col - 1, values, self.formats.get(style))
+        if track_widths:
+            self._track_row(values, start_col)
+
+    def _set_column_width(self, col, width):
+        self.ws.set_column(col - 1, col - 1, width)
+
+class XlsxWriterWorkbookWriter(WorkbookWriter):
+    """Writes the workbook with XlsxWriter, keeping only the current row of each sheet in memory"""
+
+    def __init__(self, output_file: str, progress=None):
+        super().__init__(output_file, progress)
+        # Build the workbook next to the target and move it into place on
+        # close, so a cancelled or failed export leaves the previous file alone
+        fd, self.temp_file = tempfile.mkstemp(suffix='.xlsx', prefix='.~',
+                                              dir=os.path.dirname(os.path.abspath(output_file)))
+        os.close(fd)
+        self.wb = xlsxwriter.Workbook(self.temp_file, {'constant_memory': True, 'nan_inf_to_errors': True})
+        self.formats = StyleRegistry.xlsxwriter_formats(self.wb)
+
+    def add_sheet(self, title):
+        return XlsxWriterSheetWriter(self.wb.add_worksheet(title), self.formats, self.progress)
+
+    def close(self):
+        try:
+            self.wb.close()
+            os.replace(self.temp_file, self.output_file)
+        except BaseException:
+            self._remove(self.temp_file)
+            raise
+
+    def discard(self):
+        # Finish the temporary workbook through the public API, which also
+        # removes the row data XlsxWriter spooled for each sheet, then drop it
+        try:
+            self.wb.close()
+        except Exception:
+            # Discarding runs while another error propagates; keep that one
+            pass
+        finally:
+            self._remove(self.temp_file)
+
+    @staticmethod
+    def _remove(path):
+        if path and os.path.exists(path):
+            os.remove(path)
+
+class PrefixedWorkbookWriter(WorkbookWriter):
+    """
+    Adds sheets to another writer with a title prefix, so the reports of
+    several analyses can share one workbook. The owner of the target writer
+    closes it.
+    """
+
+    def __init__(self, target: WorkbookWriter, prefix: str):
+        super().__init__(target.output_file, target.progress)
+        self.target = target
+        self.prefix = prefix
+
+    def add_sheet(self, title):
+        # Excel limits sheet titles to 31 characters
+        return self.target.add_sheet(f"{self.prefix}{title}"[:MAX_SHEET_TITLE])
+
+    def close(self):
+        pass
+
+WRITER_BACKENDS = {
+    'openpyxl': OpenpyxlWorkbookWriter,
+    'xlsxwriter': XlsxWriterWorkbookWriter
+}
+
+def create_workbook_writer(output_file: str, backend: str = 'xlsxwriter', progress=None) -> WorkbookWriter:
+    """Create a workbook writer for the named backend; progress is checked for cancellation"""
+    if backend not in WRITER_BACKENDS:
+        raise ValueError(f"Unknown writer backend: {backend}. Choose from {', '.join(WRITER_BACKENDS)}")
+    return WRITER_BACKENDS[backend](output_file, progress)
+
+def as_sheet_writer(ws) -> SheetWriter:
+    """Wrap a plain openpyxl worksheet so formatters can write to it"""
+    if isinstance(ws, SheetWriter):
+        return ws
+    return OpenpyxlSheetWriter(ws)
+
+def titled_sheet(wb, title: str) -> SheetWriter:
+    """New sheet from a WorkbookWriter, or the retitled active sheet of an openpyxl Workbook"""
+    if isinstance(wb, WorkbookWriter):
+        return wb.add_sheet(title)
+    ws = wb.active
+    ws.title = title
+    return OpenpyxlSheetWriter(ws)
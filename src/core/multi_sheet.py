@@ -0,0 +1,76 @@
+# src/core/multi_sheet.py
+import re
+from typing import Dict, List
+from .formatters.sheet_summary_formatter import SheetSummaryFormatter
+from .formatters.writers import PrefixedWorkbookWriter, create_workbook_writer
+from .schema_inference import SchemaCache
+from .statistics_manager import StatisticsManager
+from ..utils.logger import AppLogger
+
+# How the sheets of a workbook are analysed: only the first one, each into
+# its own output workbook, or all of them into one workbook with a summary
+SHEET_MODES = ('first', 'separate', 'combined')
+
+SUMMARY_SHEET = "Summary - ملخص"
+
+def list_sheets(file_path: str) -> List[str]:
+    """Sheet names of a workbook in workbook order, without parsing the sheets"""
+    return list(SchemaCache.get_instance().infer(file_path).sheet_names)
+
+def sheet_file_label(sheet_name: str) -> str:
+    """Sheet name made safe to use inside a file name"""
+    return re.sub(r'[^\w\-. ]+', '_', str(sheet_name)).strip() or 'sheet'
+
+def summarize_results(results: Dict) -> Dict:
+    """
+    Complete-case response count, alpha and split-half values of one
+    analysis, overall and for each dimension
+    """
+    return {
+        'responses': len(results['split_half'].participants),
+        'alpha': results['total_alpha'].alpha,
+        'split_half': results['split_half'].spearman_brown,
+        'dimensions': {
+            dim_num: {
+                'alpha': dim_results['alpha'].alpha,
+                'split_half': dim_results['split_half'].spearman_brown
+            }
+            for dim_num, dim_results in results['dimensions'].items()
+        }
+    }
+
+def export_combined(output_file: str, sheets: List[Dict], writer_backend: str = 'xlsxwriter',
+                    progress=None, profiler=None) -> str:
+    """
+    Write the analyses of several sheets into one workbook.
+
+    The first sheet compares alpha and split-half values across the input
+    sheets; the full report of every analysed sheet follows, its sheet
+    titles prefixed with the sheet's number in the summary. sheets holds
+    one entry per input sheet in workbook order, with 'sheet', 'results'
+    and 'message'; entries without results (failed sheets) only
+    appear in the summary.
+    """
+    logger = AppLogger.get_logger()
+    manager = StatisticsManager(None, [], {}, progress, profiler=profiler)
+    entries = [dict(sheet, summary=summarize_results(sheet['results']) if sheet.get('results') else None)
+               for sheet in sheets]
+
+    wb = create_workbook_writer(output_file, writer_backend, manager.progress)
+    span = manager.profiler.span
+    with span('export_combined', items=len(entries)):
+        try:
+            with span('sheet_summary'):
+                SheetSummaryFormatter.format_results_to_sheet(wb.add_sheet(SUMMARY_SHEET), entries)
+            for position, entry in enumerate(entries, 1):
+                if entry['summary'] is not None:
+                    manager.write_results(PrefixedWorkbookWriter(wb, f"{position} "), entry['results'])
+        except BaseException:
+            # Leave no partial workbook behind on errors or cancellation
+            wb.discard()
+            raise
+
+        with span('save_workbook'):
+            wb.close()
+    logger.info(f"Combined analysis of {len(entries)} sheets exported to {output_file}")
+    return output_file
@@ -0,0 +1,45 @@
+# src/core/progress.py
+import threading
+from typing import Callable, Optional
+
+class AnalysisCancelled(Exception):
+    """Raised inside an analysis run once cancellation has been requested"""
+
+class ProgressReporter:
+    """
+    Forwards stage progress from the analysis to a callback and stops the
+    run at the next checkpoint after cancel() is called.
+
+    The callback receives (percent, message) and is invoked on the thread
+    running the analysis.
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, str], None]] = None):
+        self.callback = callback
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise AnalysisCancelled("Analysis cancelled")
+
+    def report(self, percent: int, message: str) -> None:
+        """Check for cancellation, then publish the stage"""
+        self.check_cancelled()
+        if self.callback is not None:
+            self.callback(int(percent), message)
+
+    def stage_range(self, start: int, end: int, total_steps: int):
+        """Return report(step, message) mapping step 0..total_steps onto start..end percent"""
+        total_steps = max(total_steps, 1)
+
+        def report_step(step: int, message: str) -> None:
+            self.report(start + (end - start) * step / total_steps, message)
+
+        return report_step
@@ -0,0 +1,92 @@
+# src/core/response_mapping.py
+import json
+import numbers
+import re
+from typing import Dict, Tuple
+import numpy as np
+import pandas as pd
+
+# Arabic response labels and their scores
+RESPONSE_MAPPING = {
+    'مكتسبة بشكل كامل': 3,
+    'مكتسبة بدرجة متوسطة': 2,
+    'غير مكتسبة': 1
+}
+
+# Harakat, superscript alef and tatweel are dropped before matching
+_DIACRITICS = re.compile('[\u064B-\u0652\u0670\u0640]')
+_WHITESPACE = re.compile(r'\s+')
+_LETTER_VARIANTS = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي'
+})
+
+def normalize_label(text: str) -> str:
+    """Fold whitespace, diacritics and alef/yaa spelling variants so equivalent labels compare equal"""
+    text = _DIACRITICS.sub('', text)
+    text = _WHITESPACE.sub(' ', text).strip()
+    return text.translate(_LETTER_VARIANTS)
+
+class ResponseMapping:
+    """
+    Label to score table used to clean questionnaire responses.
+
+    Labels are matched after normalize_label, so differences in spacing,
+    diacritics or alef/yaa spelling do not lose responses. Cells are
+    converted through their unique values only: a block is factorized once,
+    each distinct value is normalized and scored, and the scores are
+    broadcast back through the codes. Numeric cells keep their value.
+    """
+
+    def __init__(self, labels: Dict[str, float] = None, normalize: bool = True):
+        self.labels = dict(RESPONSE_MAPPING if labels is None else labels)
+        self.normalize = normalize
+        self._scores = {self._key(label): float(score) for label, score in self.labels.items()}
+        # Stripped cell texts that mark a row as part of the header block
+        self.header_markers = frozenset([''] + list(self._scores))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ResponseMapping':
+        """Load a {label: score} table from a JSON file"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def coerce(cls, mapping) -> 'ResponseMapping':
+        """Accept a ResponseMapping, a {label: score} dict, a JSON file path, or None for the default table"""
+        if isinstance(mapping, cls):
+            return mapping
+        if isinstance(mapping, str):
+            return cls.from_file(mapping)
+        return cls(mapping)
+
+    def _key(self, text: str) -> str:
+        return normalize_label(text) if self.normalize else text.strip()
+
+    def score_uniques(self, uniques) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores and header-marker flags for distinct cell values"""
+        scores = np.full(len(uniques), np.nan)
+        markers = np.zeros(len(uniques), dtype=bool)
+        for i, value in enumerate(uniques):
+            if isinstance(value, str):
+                key = self._key(value)
+                scores[i] = self._scores.get(key, np.nan)
+                markers[i] = key in self.header_markers
+            elif isinstance(value, numbers.Number):
+                scores[i] = value
+        return scores, markers
+
+    def convert(self, cells: np.ndarray, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a 2-D block of raw cells. Returns the scores and, per row,
+        whether any cell is empty or header-like text.
+        """
+        codes, uniques = pd.factorize(cells.ravel(), use_na_sentinel=True)
+        unique_scores, unique_markers = self.score_uniques(uniques)
+        # Code -1 marks an empty cell: no score, counts as header-like
+        unique_scores = np.append(unique_scores, np.nan).astype(dtype)
+        unique_markers = np.append(unique_markers, True)
+
+        scores = unique_scores[codes].reshape(cells.shape)
+        header_like = unique_markers[codes].reshape(cells.shape).any(axis=1)
+        return scores, header_like
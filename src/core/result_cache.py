@@ -0,0 +1,176 @@
+# src/core/result_cache.py
+import glob
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+from .. import __version__
+from ..utils.logger import AppLogger
+
+# Bump when the stored layout changes
+CACHE_FORMAT = 1
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Errors from reading back stored results, e.g. a truncated entry or one
+# pickled by other library versions; the run is then computed again
+RESULT_READ_ERRORS = (pickle.UnpicklingError, AttributeError, ImportError, EOFError, OSError, ValueError)
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+_code_version = None
+
+def code_version() -> str:
+    """Package version plus a digest of the analysis sources, so code changes never reuse old results"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(f"{__version__}:{CACHE_FORMAT}".encode())
+        core_dir = os.path.dirname(os.path.abspath(__file__))
+        for path in sorted(glob.glob(os.path.join(core_dir, '**', '*.py'), recursive=True)):
+            digest.update(os.path.relpath(path, core_dir).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of analysis runs.
+
+    An entry is keyed on the SHA-256 of the input workbook bytes, the sheet,
+    the selected columns, the dimension map, the response mapping, the
+    bootstrap settings and the code version. It holds the computed results (pickled,
+    for re-rendering with another writer backend) and the workbook that was
+    produced from them. Entries are written to a temporary directory and
+    renamed into place, so concurrent processes never see partial entries.
+    The least recently used entries are removed once the directory exceeds
+    max_bytes.
+    """
+    DEFAULT_CACHE_DIR = os.path.join('data', 'cache', 'results')
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+    # Input digests memoized per (path, mtime, size) for the life of the process
+    _file_digests: Dict[tuple, str] = {}
+    _digest_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.logger = AppLogger.get_logger()
+        self.cache_dir = cache_dir or self.DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def file_digest(cls, file_path: str) -> str:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        memo_key = (path, stat.st_mtime_ns, stat.st_size)
+        with cls._digest_lock:
+            digest = cls._file_digests.get(memo_key)
+        if digest is None:
+            digest = _hash_file(path)
+            with cls._digest_lock:
+                cls._file_digests[memo_key] = digest
+        return digest
+
+    def make_key(self, data_file: str, selected_columns, dimensions: Dict, mapping=None, bootstrap=None,
+                 sheet_name: str = None) -> str:
+        """Cache key for one analysis run; equal keys produce identical results"""
+        # The stored results pickle pandas and NumPy objects
+        import numpy as np
+        import pandas as pd
+        
+        description = {
+            'input': self.file_digest(data_file),
+            'sheet': sheet_name,
+            'selected_columns': [int(c) for c in selected_columns],
+            'dimensions': [[str(dim), [int(c) for c in cols]] for dim, cols in sorted(dimensions.items())],
+            'mapping': None if mapping is None else [sorted(mapping.labels.items()), mapping.normalize],
+            'bootstrap': None if bootstrap is None else [bootstrap.n_replicates, bootstrap.confidence, bootstrap.seed],
+            'code': code_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__
+        }
+        encoded = json.dumps(description, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Metadata of a stored entry, or None; a hit marks the entry as recently used"""
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            os.utime(entry_dir)
+        except (OSError, ValueError):
+            return None
+        self.logger.info(f"Result cache hit: {key[:12]}")
+        return meta
+
+    def load_results(self, key: str) -> Dict:
+        with open(os.path.join(self._entry_dir(key), 'results.pkl'), 'rb') as f:
+            return pickle.load(f)
+
+    def discard(self, key: str) -> None:
+        """Remove an entry, so that the next run stores a fresh one"""
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def restore(self, key: str, meta: Dict, output_file: str, writer_backend: str,
+                render: Callable[[Dict, str], str]) -> str:
+        """
+        Recreate the output of a cached run: copy the stored workbook when it
+        was written by the same backend, otherwise render the stored results
+        """
+        workbook = os.path.join(self._entry_dir(key), 'output.xlsx')
+        if meta.get('writer_backend') == writer_backend and os.path.exists(workbook):
+            shutil.copyfile(workbook, output_file)
+            return output_file
+        return render(self.load_results(key), output_file)
+
+    def store(self, key: str, results: Dict, output_file: str, writer_backend: str, n_rows: int) -> None:
+        """Save the results and workbook of a finished run; failures only cost the cache entry"""
+        entry_dir = self._entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.cache_dir)
+        try:
+            with open(os.path.join(tmp_dir, 'results.pkl'), 'wb') as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            shutil.copyfile(output_file, os.path.join(tmp_dir, 'output.xlsx'))
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump({'writer_backend': writer_backend, 'n_rows': n_rows, 'created': time.time()}, f)
+            os.replace(tmp_dir, entry_dir)
+        except OSError as e:
+            # Another process stored the same key first, or the disk is full
+            self.logger.warning(f"Could not store result cache entry: {str(e)}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, name)
+            if name.startswith('.') or not os.path.isdir(entry_dir):
+                continue
+            size = sum(e.stat().st_size for e in os.scandir(entry_dir) if e.is_file())
+            entries.append((os.stat(entry_dir).st_mtime, size, entry_dir))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            self.logger.debug(f"Evicted result cache entry: {os.path.basename(entry_dir)}")
@@ -0,0 +1,110 @@
+# src/core/schema_inference.py
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+from .workbook_preview import read_preview
+from ..utils.logger import AppLogger
+
+# Rows read below the header, enough to tell whether the sheet has data
+SCHEMA_SAMPLE_ROWS = 5
+
+_QUESTION_NUMBER = re.compile(r'^\d+')
+
+def detect_dimensions(columns: List[str]) -> Dict[int, List[int]]:
+    """
+    Group numbered question columns into dimensions: a dimension starts
+    wherever the number restarts at 1 or drops below the previous one.
+    Columns whose name does not start with a number are skipped.
+    """
+    dimensions = {}
+    current_dimension = []
+    last_number = None
+
+    for col_idx, col_name in enumerate(columns):
+        match = _QUESTION_NUMBER.search(str(col_name))
+        if not match:
+            continue
+
+        number = int(match.group())
+        if number == 1 or (last_number and number < last_number):
+            if current_dimension:
+                dimensions[len(dimensions) + 1] = current_dimension
+                current_dimension = []
+
+        current_dimension.append(col_idx)
+        last_number = number
+
+    # Add final dimension
+    if current_dimension:
+        dimensions[len(dimensions) + 1] = current_dimension
+    return dimensions
+
+class WorkbookSchema:
+    """
+    Column layout of a workbook's first sheet, inferred from its header:
+    column names, the guessed question columns (first to last numbered
+    column) and the dimension boundaries within them.
+    """
+
+    def __init__(self, file_path: str, columns: List[str], sheet_names: List[str], has_data: bool):
+        self.file_path = file_path
+        self.columns = columns
+        self.sheet_names = sheet_names
+        self.has_data = has_data
+        self.dimensions = detect_dimensions(columns)
+
+        numbered = [idx for cols in self.dimensions.values() for idx in cols]
+        self.question_columns = list(range(numbered[0], numbered[-1] + 1)) if numbered else []
+
+class SchemaCache:
+    """
+    Process-wide cache of inferred workbook schemas.
+
+    Only the header and a few rows are read, through the same read-only
+    cursor as the preview dialogs, so choosing a file does not parse the
+    sheet. Entries are keyed on path, modification time and size, like
+    the WorkbookCache.
+    """
+    MAX_ENTRIES = 64
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SchemaCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.logger = AppLogger.get_logger()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'SchemaCache':
+        return cls()
+
+    def infer(self, file_path: str) -> WorkbookSchema:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            schema = self._entries.get(key)
+            if schema is not None:
+                self._entries.move_to_end(key)
+                return schema
+
+        preview = read_preview(path, SCHEMA_SAMPLE_ROWS)
+        schema = WorkbookSchema(path, preview.header, preview.sheet_names, preview.n_rows > 0)
+        self.logger.info(
+            f"Inferred schema of {path}: {len(schema.columns)} columns, "
+            f"{len(schema.question_columns)} question columns, {len(schema.dimensions)} dimensions"
+        )
+
+        with self._lock:
+            self._entries[key] = schema
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return schema
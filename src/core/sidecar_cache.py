@@ -0,0 +1,184 @@
+# src/core/sidecar_cache.py
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .statistics.response_matrix import ResponseMatrix
+from ..utils.logger import AppLogger
+
+try:
+    import pyarrow  # noqa: F401  (Feather support for pandas)
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+# Bump when the stored layout changes
+SIDECAR_FORMAT = 1
+
+class SidecarCache:
+    """
+    Converted copies of parsed workbooks, so reopening an unchanged file
+    skips the Excel parser.
+
+    Two forms are kept, each with a metadata JSON recording the source size
+    and modification time:
+
+    - the parsed first sheet as a Feather file (needs pyarrow; sheets with
+      non-text headers or mixed-type columns that Arrow cannot store are
+      simply not cached), used by WorkbookCache for the GUI and the analyzer
+    - the cleaned numeric question matrix as a memory-mappable .npy, used
+      by the streaming analyzer path, keyed on the columns and the response
+      mapping
+
+    Files are kept in cache_dir, or in a hidden folder next to each source
+    when alongside_source is set. No pickles are stored, so a cache directory
+    shared with others cannot run code on load. A cache folder that cannot
+    be created, read or written is logged and treated as a miss, so callers
+    fall back to parsing the workbook.
+    """
+    DEFAULT_CACHE_DIR = os.path.join('data', 'cache', 'workbooks')
+    SIDECAR_FOLDER = '.autoranker_cache'
+
+    def __init__(self, cache_dir: str = None, alongside_source: bool = False):
+        self.logger = AppLogger.get_logger()
+        self.cache_dir = cache_dir or self.DEFAULT_CACHE_DIR
+        self.alongside_source = alongside_source
+
+    def _base_path(self, file_path: str) -> str:
+        path = os.path.abspath(file_path)
+        if self.alongside_source:
+            folder = os.path.join(os.path.dirname(path), self.SIDECAR_FOLDER)
+            name = os.path.basename(path)
+        else:
+            folder = self.cache_dir
+            name = f"{os.path.splitext(os.path.basename(path))[0]}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]}"
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, name)
+
+    @staticmethod
+    def _source_signature(file_path: str) -> dict:
+        stat = os.stat(file_path)
+        return {'format': SIDECAR_FORMAT, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _read_meta(self, meta_path: str, file_path: str) -> Optional[dict]:
+        """Stored metadata, or None when missing or written for another version of the source"""
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        signature = self._source_signature(file_path)
+        if any(meta.get(k) != v for k, v in signature.items()):
+            return None
+        return meta
+
+    @staticmethod
+    def _write_atomic(path: str, write) -> None:
+        """Write through a temporary file in the same folder so readers never see partial files"""
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_meta(self, meta_path: str, file_path: str, extra: dict) -> None:
+        meta = dict(self._source_signature(file_path), **extra)
+
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+        self._write_atomic(meta_path, write)
+
+    def load_frame(self, file_path: str) -> Optional[Tuple[pd.DataFrame, List[str]]]:
+        """Parsed first sheet and sheet names, or None when there is no current copy"""
+        if not HAS_ARROW:
+            return None
+        try:
+            base = self._base_path(file_path)
+            meta = self._read_meta(f"{base}.frame.json", file_path)
+        except OSError as e:
+            self.logger.warning(f"Sidecar cache unavailable for {file_path}: {str(e)}")
+            return None
+        if meta is None:
+            return None
+        try:
+            data = pd.read_feather(f"{base}.feather")
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable sidecar {base}.feather: {str(e)}")
+            return None
+        self.logger.info(f"Loaded {file_path} from sidecar cache")
+        return data, meta['sheet_names']
+
+    def store_frame(self, file_path: str, data: pd.DataFrame, sheet_names: List[str]) -> bool:
+        """Store a parsed sheet; returns False when Arrow is missing or cannot represent it"""
+        if not HAS_ARROW:
+            return False
+        if not all(isinstance(col, str) for col in data.columns) or not isinstance(data.index, pd.RangeIndex):
+            self.logger.debug(f"Not caching {file_path}: headers are not all text")
+            return False
+        try:
+            base = self._base_path(file_path)
+        except OSError as e:
+            self.logger.warning(f"Sidecar cache unavailable for {file_path}: {str(e)}")
+            return False
+        try:
+            self._write_atomic(f"{base}.feather", lambda path: data.to_feather(path))
+        except OSError as e:
+            self.logger.warning(f"Could not write sidecar {base}.feather: {str(e)}")
+            return False
+        except Exception as e:
+            # Typically a column mixing numbers and text
+            self.logger.debug(f"Not caching {file_path}: {str(e)}")
+            return False
+        try:
+            self._write_meta(f"{base}.frame.json", file_path, {'sheet_names': list(sheet_names)})
+        except OSError as e:
+            self.logger.warning(f"Could not write sidecar {base}.frame.json: {str(e)}")
+            return False
+        return True
+
+    @staticmethod
+    def _matrix_key(columns: List[int], mapping) -> str:
+        description = json.dumps([list(map(int, columns)), sorted(mapping.labels.items()), mapping.normalize],
+                                 ensure_ascii=False)
+        return hashlib.sha1(description.encode('utf-8')).hexdigest()[:16]
+
+    def load_matrix(self, file_path: str, columns: List[int], mapping) -> Optional[Tuple[ResponseMatrix, List[str]]]:
+        """Memory-mapped numeric matrix for the given column positions and mapping, and the header"""
+        try:
+            base = f"{self._base_path(file_path)}.{self._matrix_key(columns, mapping)}"
+            meta = self._read_meta(f"{base}.json", file_path)
+        except OSError as e:
+            self.logger.warning(f"Sidecar cache unavailable for {file_path}: {str(e)}")
+            return None
+        if meta is None:
+            return None
+        try:
+            values = np.load(f"{base}.npy", mmap_mode='r')
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable sidecar {base}.npy: {str(e)}")
+            return None
+        self.logger.info(f"Memory-mapped {values.shape[0]} response rows of {file_path} from sidecar cache")
+        return ResponseMatrix(values, meta['questions'], pd.RangeIndex(values.shape[0])), meta['header']
+
+    def store_matrix(self, file_path: str, columns: List[int], mapping,
+                     matrix: ResponseMatrix, header: List[str]) -> bool:
+        """Store a cleaned numeric matrix; returns False when the cache cannot be written"""
+        def write(path):
+            with open(path, 'wb') as f:
+                np.save(f, matrix.values)
+        try:
+            base = f"{self._base_path(file_path)}.{self._matrix_key(columns, mapping)}"
+            self._write_atomic(f"{base}.npy", write)
+            self._write_meta(f"{base}.json", file_path, {'questions': matrix.questions, 'header': list(header)})
+        except OSError as e:
+            self.logger.warning(f"Could not write sidecar matrix for {file_path}: {str(e)}")
+            return False
+        return True
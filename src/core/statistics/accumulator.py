@@ -0,0 +1,80 @@
+# src/core/statistics/accumulator.py
+from typing import List
+import numpy as np
+
+class ResponseAccumulator:
+    """
+    Mergeable sufficient statistics of a response block: row count, item
+    means and the matrix of co-moments (sums of products of deviations).
+
+    Chunks are folded in with the pairwise update of Chan et al., so the
+    result equals a single pass over all rows without keeping them and
+    without the cancellation of raw sums of squares. Accumulators built on
+    separate chunks, files or workers can be merged in any order. Alpha,
+    odd-even split-half, alpha-if-deleted and the split-half distribution
+    only need the covariance matrix, so they can be computed from here.
+
+    Only complete rows, with a response to every question, are counted.
+    That matches the complete-case rule of the calculators when run on the
+    full question set.
+    """
+
+    def __init__(self, questions: List[str]):
+        self.questions = list(questions)
+        self.positions = {question: i for i, question in enumerate(self.questions)}
+        k = len(self.questions)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoments = np.zeros((k, k))
+
+    def update(self, chunk: np.ndarray) -> 'ResponseAccumulator':
+        """Fold a (rows x questions) block in; rows with a missing response are skipped"""
+        chunk = np.asarray(chunk, dtype=np.float64)
+        chunk = chunk[~np.isnan(chunk).any(axis=1)]
+        if len(chunk) == 0:
+            return self
+        chunk_mean = chunk.mean(axis=0)
+        centered = chunk - chunk_mean
+        self._combine(len(chunk), chunk_mean, centered.T @ centered)
+        return self
+
+    def merge(self, other: 'ResponseAccumulator') -> 'ResponseAccumulator':
+        """Fold another accumulator over the same questions into this one"""
+        if other.questions != self.questions:
+            raise ValueError("Cannot merge accumulators over different questions")
+        if other.n:
+            self._combine(other.n, other.mean, other.comoments)
+        return self
+
+    def _combine(self, n_b: int, mean_b: np.ndarray, comoments_b: np.ndarray) -> None:
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.comoments = self.comoments + comoments_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.mean = self.mean + delta * (n_b / n)
+        self.n = n
+
+    def covariance(self, questions: List[str] = None, ddof: int = 1) -> np.ndarray:
+        """Sample covariance matrix of all questions, or of the given subset in that order"""
+        if self.n <= ddof:
+            raise ValueError("Not enough complete responses for a covariance matrix")
+        comoments = self.comoments
+        if questions is not None:
+            cols = [self.positions[q] for q in questions]
+            comoments = comoments[np.ix_(cols, cols)]
+        return comoments / (self.n - ddof)
+
+    def save(self, path: str) -> None:
+        """Store the statistics so later chunks can be added without rereading earlier rows"""
+        with open(path, 'wb') as f:
+            np.savez(f, questions=np.array(self.questions, dtype=str), n=self.n,
+                     mean=self.mean, comoments=self.comoments)
+
+    @classmethod
+    def load(cls, path: str) -> 'ResponseAccumulator':
+        with np.load(path) as stored:
+            accumulator = cls(stored['questions'].tolist())
+            accumulator.n = int(stored['n'])
+            accumulator.mean = stored['mean']
+            accumulator.comoments = stored['comoments']
+        return accumulator
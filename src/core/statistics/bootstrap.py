@@ -0,0 +1,131 @@
+# src/core/statistics/bootstrap.py
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+import numpy as np
+from .results import ConfidenceInterval
+from ...utils.logger import AppLogger
+
+# Upper bound on resample weights (replicates x rows) held at once per block
+BOOTSTRAP_BLOCK_ELEMENTS = 4_000_000
+MAX_BLOCK_REPLICATES = 250
+
+def resample_weights(rng: np.random.Generator, n_rows: int, n_replicates: int) -> np.ndarray:
+    """
+    Draw n_rows row indices with replacement for each replicate and return
+    how often every row was drawn, as a (replicates, rows) matrix.
+    """
+    indices = rng.integers(0, n_rows, size=(n_replicates, n_rows))
+    indices += np.arange(n_replicates)[:, None] * n_rows
+    counts = np.bincount(indices.ravel(), minlength=n_replicates * n_rows)
+    return counts.reshape(n_replicates, n_rows).astype(np.float64)
+
+def weighted_covariances(weights: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Sample covariance (ddof=1) of matching columns of x and y in every
+    replicate, shape (replicates, columns). Columns are centered on the full
+    sample first so the sums of products do not lose precision.
+    """
+    n = weights.shape[1]
+    same = y is x
+    x = x - x.mean(axis=0)
+    y = x if same else y - y.mean(axis=0)
+    x_sums = weights @ x
+    y_sums = x_sums if same else weights @ y
+    return (weights @ (x * y) - x_sums * y_sums / n) / (n - 1)
+
+def alpha_replicates(weights: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Cronbach's alpha of every replicate from its item and total score variances"""
+    k = values.shape[1]
+    totals = values.sum(axis=1, dtype=np.float64)[:, None]
+    item_variance_sums = weighted_covariances(weights, values, values).sum(axis=1)
+    total_variances = weighted_covariances(weights, totals, totals)[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alphas = (k / (k - 1)) * (1 - item_variance_sums / total_variances)
+    return np.where(total_variances > 0, alphas, np.nan)
+
+def split_half_replicates(weights: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Odd-even Spearman-Brown coefficient of every replicate"""
+    halves = np.column_stack([
+        values[:, 0::2].sum(axis=1, dtype=np.float64),
+        values[:, 1::2].sum(axis=1, dtype=np.float64)
+    ])
+    variances = weighted_covariances(weights, halves, halves)
+    covariances = weighted_covariances(weights, halves[:, :1], halves[:, 1:])[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = covariances / np.sqrt(variances[:, 0] * variances[:, 1])
+        return (2 * r) / (1 + r)
+
+STATISTICS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    'alpha': alpha_replicates,
+    'split_half': split_half_replicates
+}
+
+_worker_values = None
+
+def _set_worker_values(values: np.ndarray, log_queue) -> None:
+    # Ship the responses to each worker process once rather than with every block
+    AppLogger.attach_worker(log_queue)
+    global _worker_values
+    _worker_values = values
+
+def _replicate_block(statistic: str, n_replicates: int, seed: np.random.SeedSequence,
+                     values: np.ndarray = None) -> np.ndarray:
+    values = _worker_values if values is None else values
+    weights = resample_weights(np.random.default_rng(seed), values.shape[0], n_replicates)
+    return STATISTICS[statistic](weights, values)
+
+class BootstrapEstimator:
+    """
+    Percentile bootstrap confidence intervals for alpha and split-half.
+
+    Replicates are drawn in blocks. Each block is one matrix of resample
+    counts, and every replicate's variances come from a few matrix products
+    with it. Block sizes depend only on the data size, and each block has its
+    own child of a SeedSequence, so results for a seed are the same for any
+    number of workers. Blocks run in a process pool when workers > 1.
+    """
+    DEFAULT_REPLICATES = 2000
+    DEFAULT_SEED = 0
+
+    def __init__(self, n_replicates: int = DEFAULT_REPLICATES, confidence: float = 0.95,
+                 seed: int = DEFAULT_SEED, workers: int = 1):
+        if n_replicates < 2:
+            raise ValueError("At least two bootstrap replicates are needed")
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence level must be between 0 and 1")
+        self.n_replicates = n_replicates
+        self.confidence = confidence
+        self.seed = seed
+        self.workers = max(1, workers)
+
+    def _block_sizes(self, n_rows: int) -> List[int]:
+        block = max(1, min(MAX_BLOCK_REPLICATES, BOOTSTRAP_BLOCK_ELEMENTS // max(n_rows, 1)))
+        sizes = [block] * (self.n_replicates // block)
+        if self.n_replicates % block:
+            sizes.append(self.n_replicates % block)
+        return sizes
+
+    def replicates(self, statistic: str, values: np.ndarray) -> np.ndarray:
+        """All replicate values of 'alpha' or 'split_half' for a complete-case response block"""
+        values = np.asarray(values, dtype=np.float64)
+        sizes = self._block_sizes(values.shape[0])
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+
+        if self.workers == 1 or len(sizes) == 1:
+            blocks = [_replicate_block(statistic, size, seed, values) for size, seed in zip(sizes, seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(sizes)),
+                                     initializer=_set_worker_values,
+                                     initargs=(values, AppLogger.worker_queue())) as pool:
+                blocks = list(pool.map(_replicate_block, [statistic] * len(sizes), sizes, seeds))
+        return np.concatenate(blocks)
+
+    def interval(self, statistic: str, values: np.ndarray) -> ConfidenceInterval:
+        """Percentile interval; replicates with an undefined coefficient are left out"""
+        estimates = self.replicates(statistic, values)
+        valid = estimates[~np.isnan(estimates)]
+        if len(valid) == 0:
+            return ConfidenceInterval(np.nan, np.nan, self.confidence, 0)
+        tail = (1 - self.confidence) / 2 * 100
+        lower, upper = np.percentile(valid, [tail, 100 - tail])
+        return ConfidenceInterval(float(lower), float(upper), self.confidence, len(valid))
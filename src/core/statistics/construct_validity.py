@@ -1,34 +1,20 @@
 # src/core/statistics/construct_validity.py
 import pandas as pd
 import numpy as np
-import logging
-from datetime import datetime
-import os
-from typing import Dict, List
+from scipy.stats import rankdata
+from typing import Dict, List, Union
+from .kernels import item_rest_spearman, pearson_correlation
+from .response_matrix import ResponseMatrix
+from .results import ConstructValidityResult
+from ...utils.logger import AppLogger
 
 class ConstructValidityCalculator:
     def __init__(self):
-        self._setup_logger()
-        
-    def _setup_logger(self):
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
-        self.logger = logging.getLogger('ConstructValidity')
-        self.logger.setLevel(logging.DEBUG)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = f'logs/construct_validity_{timestamp}.log'
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        
-        self.logger.addHandler(file_handler)
+        # Records go through the shared application log rather than a file per instance
+        self.logger = AppLogger.get_logger('construct_validity')
 
-    def calculate(self, data: pd.DataFrame, questions: List[str], dimensions: Dict[str, List[str]]) -> Dict:
+    def calculate(self, data: Union[pd.DataFrame, ResponseMatrix], questions: List[str],
+                  dimensions: Dict[str, List[str]]) -> ConstructValidityResult:
         """
         Calculate Spearman's Construct Validity
         """
@@ -37,64 +23,96 @@ class ConstructValidityCalculator:
         self.logger.debug(f"Number of dimensions: {len(dimensions)}")
 
         try:
-            # Convert to numeric and handle missing values
-            df = data[questions].apply(pd.to_numeric, errors='coerce')
-            df_clean = df.dropna()
+            # Complete-case responses from the shared numeric matrix
+            responses = ResponseMatrix.ensure(data, questions)
+            rows = responses.row_mask(questions)
+            participants = responses.participants(questions)
             
             # Calculate total scores and ranks for each participant
-            total_scores = df_clean[questions].sum(axis=1)
-            total_ranks = total_scores.rank(method='average')
+            total_scores = responses.block(questions, rows).sum(axis=1, dtype=np.float64)
+            total_ranks = rankdata(total_scores, method='average')
             
-            dimension_results = {}
-            correlations = {}
+            # One column per dimension, in dimension order
+            dim_nums = list(dimensions)
+            dimension_scores = np.empty((len(total_scores), len(dim_nums)))
+            dimension_ranks = np.empty((len(total_scores), len(dim_nums)))
+            correlations = np.empty(len(dim_nums))
             
             # Calculate dimension scores, ranks and correlations
-            for dim_num, dim_questions in dimensions.items():
+            for i, dim_num in enumerate(dim_nums):
                 self.logger.debug(f"Processing dimension {dim_num}")
                 
                 # Calculate dimension scores and ranks
-                dim_scores = df_clean[dim_questions].sum(axis=1)
-                dim_ranks = dim_scores.rank(method='average')
+                dim_scores = responses.block(dimensions[dim_num], rows).sum(axis=1, dtype=np.float64)
+                dim_ranks = rankdata(dim_scores, method='average')
                 
-                # Calculate Spearman correlation with total ranks
-                correlation = total_ranks.corr(dim_ranks, method='spearman')
+                # Spearman correlation is the Pearson correlation of the ranks
+                correlation = pearson_correlation(total_ranks, dim_ranks)
                 
-                dimension_results[dim_num] = {
-                    'scores': dim_scores.to_dict(),
-                    'ranks': dim_ranks.to_dict()
-                }
-                correlations[dim_num] = correlation
+                dimension_scores[:, i] = dim_scores
+                dimension_ranks[:, i] = dim_ranks
+                correlations[i] = correlation
                 
                 self.logger.info(f"Dimension {dim_num} correlation: {correlation:.4f}")
             
+            return ConstructValidityResult(
+                participants=participants,
+                total_scores=total_scores,
+                total_ranks=total_ranks,
+                dimensions=dim_nums,
+                dimension_scores=dimension_scores,
+                dimension_ranks=dimension_ranks,
+                correlations=correlations,
+                interpretations=self._get_interpretation(correlations),
+                status="success",
+                message=""
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in Construct Validity calculation: {str(e)}", exc_info=True)
+            return ConstructValidityResult.error(str(e))
+
+    def calculate_item_rest(self, data: Union[pd.DataFrame, ResponseMatrix], questions: List[str],
+                            dimensions: Dict[str, List[str]]) -> Dict:
+        """
+        Calculate the Spearman correlation of each question with the rest of its dimension
+        """
+        self.logger.info(f"Starting item-rest correlation calculation for {len(questions)} questions")
+
+        try:
+            responses = ResponseMatrix.ensure(data, questions)
+            rows = responses.row_mask(questions)
+
+            correlations = {}
+            for dim_num, dim_questions in dimensions.items():
+                dim_correlations = item_rest_spearman(responses.block(dim_questions, rows))
+                correlations[dim_num] = dict(zip(dim_questions, dim_correlations.tolist()))
+                self.logger.debug(f"Dimension {dim_num}: {len(dim_questions)} item-rest correlations")
+
             return {
-                "total_scores": total_scores.to_dict(),
-                "total_ranks": total_ranks.to_dict(),
-                "dimension_results": dimension_results,
                 "correlations": correlations,
-                "status": "success",
-                "interpretation": self._get_interpretation(correlations)
+                "status": "success"
             }
 
         except Exception as e:
-            self.logger.error(f"Error in Construct Validity calculation: {str(e)}", exc_info=True)
+            self.logger.error(f"Error in item-rest correlation calculation: {str(e)}", exc_info=True)
             return {
                 "status": "error",
                 "message": str(e)
             }
 
-    def _get_interpretation(self, correlations: Dict[str, float]) -> Dict[str, str]:
+    def _get_interpretation(self, correlations: np.ndarray) -> List[str]:
         """
         Get bilingual interpretation of correlation coefficients
         """
-        interpretations = {}
-        for dim, corr in correlations.items():
+        interpretations = []
+        for corr in correlations:
             if corr > 0.7:
-                interpretations[dim] = "Strong / قوي"
+                interpretations.append("Strong / قوي")
             elif corr > 0.5:
-                interpretations[dim] = "Moderate / متوسط"
+                interpretations.append("Moderate / متوسط")
             elif corr > 0.3:
-                interpretations[dim] = "Weak / ضعيف"
+                interpretations.append("Weak / ضعيف")
             else:
-                interpretations[dim] = "Very Weak / ضعيف جداً"
+                interpretations.append("Very Weak / ضعيف جداً")
         return interpretations
\ No newline at end of file
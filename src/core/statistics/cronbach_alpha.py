@@ -2,92 +2,127 @@
 import pandas as pd
 import numpy as np
 import logging
-from datetime import datetime
-import os
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+from .accumulator import ResponseAccumulator
+from .bootstrap import BootstrapEstimator
+from .kernels import item_deletion_statistics
+from .response_matrix import ResponseMatrix
+from .results import CronbachResult
+from ...utils.logger import AppLogger
 
 class CronbachAlphaCalculator:
     def __init__(self):
-        self._setup_logger()
-        
-    def _setup_logger(self):
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
-        self.logger = logging.getLogger('CronbachAlpha')
-        self.logger.setLevel(logging.DEBUG)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = f'logs/cronbach_alpha_{timestamp}.log'
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        
-        self.logger.addHandler(file_handler)
+        # Records go through the shared application log rather than a file per instance
+        self.logger = AppLogger.get_logger('cronbach_alpha')
 
-    def calculate(self, data: pd.DataFrame, questions: List[str]) -> Dict:
+    def calculate(self, data: Union[pd.DataFrame, ResponseMatrix, ResponseAccumulator], questions: List[str],
+                  bootstrap: Optional[BootstrapEstimator] = None) -> CronbachResult:
         """
-        Calculate Cronbach's Alpha for given questions
+        Calculate Cronbach's Alpha for given questions, with a bootstrap
+        confidence interval when an estimator is given. An accumulator
+        yields the same alpha from its covariance matrix, without the
+        interval, since no rows are kept to resample.
         """
         self.logger.info(f"Starting Cronbach's Alpha calculation for {len(questions)} questions")
-        self.logger.debug(f"Question columns: {questions}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Question columns: {questions}")
 
         try:
-            # Convert to numeric and handle missing values
-            df = data[questions].apply(pd.to_numeric, errors='coerce')
-            df_clean = df.dropna()
-            
-            self.logger.debug(f"Data shape after cleaning: {df_clean.shape}")
-            
             n_items = len(questions)
             if n_items < 2:
                 self.logger.warning("Insufficient items for reliability analysis")
-                return {
-                    "alpha": None,
-                    "n_items": n_items,
-                    "status": "error",
-                    "message": "Insufficient items for analysis"
-                }
+                return CronbachResult.error(questions, "Insufficient items for analysis")
 
-            # Calculate variances
-            item_variances = df_clean.var()
-            total_scores = df_clean.sum(axis=1)
-            total_variance = total_scores.var()
+            if isinstance(data, ResponseAccumulator):
+                # Item variances are the diagonal, the total variance is the sum of all covariances
+                values = None
+                covariance = data.covariance(questions)
+                item_variances = np.diag(covariance).copy()
+                total_variance = covariance.sum()
+            else:
+                # Complete-case responses from the shared numeric matrix
+                responses = ResponseMatrix.ensure(data, questions)
+                values, _ = responses.select(questions)
+                
+                self.logger.debug(f"Data shape after cleaning: {values.shape}")
+                
+                # Calculate variances
+                item_variances = values.var(axis=0, ddof=1, dtype=np.float64)
+                total_scores = values.sum(axis=1, dtype=np.float64)
+                total_variance = total_scores.var(ddof=1)
 
-            self.logger.debug(f"Item variances: {item_variances.to_dict()}")
-            self.logger.debug(f"Total variance: {total_variance}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Item variances: {dict(zip(questions, item_variances.tolist()))}")
+                self.logger.debug(f"Total variance: {total_variance}")
 
             if total_variance == 0:
                 self.logger.warning("Total variance is zero")
-                return {
-                    "alpha": 0.0,
-                    "n_items": n_items,
-                    "status": "error",
-                    "message": "Zero total variance"
-                }
+                return CronbachResult.error(questions, "Zero total variance", alpha=0.0)
 
             # Calculate alpha
             alpha = (n_items / (n_items - 1)) * (1 - (item_variances.sum() / total_variance))
             
             self.logger.info(f"Successfully calculated Cronbach's Alpha: {alpha:.4f}")
             
+            alpha_ci = None
+            if bootstrap is not None and values is not None:
+                alpha_ci = bootstrap.interval('alpha', values)
+                self.logger.info(f"Alpha {bootstrap.confidence:.0%} CI: [{alpha_ci.lower:.4f}, {alpha_ci.upper:.4f}]")
+            
+            return CronbachResult(
+                questions=list(questions),
+                n_items=n_items,
+                alpha=float(alpha),
+                item_variances=item_variances,
+                total_variance=float(total_variance),
+                interpretation=self._get_interpretation(alpha),
+                alpha_ci=alpha_ci,
+                status="success",
+                message=""
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in alpha calculation: {str(e)}", exc_info=True)
+            return CronbachResult.error(questions, str(e))
+
+    def calculate_item_deletion(self, data: Union[pd.DataFrame, ResponseMatrix, ResponseAccumulator],
+                                questions: List[str]) -> Dict:
+        """
+        Calculate alpha if item deleted and corrected item-total correlations
+        for every question from a single covariance matrix
+        """
+        self.logger.info(f"Starting alpha-if-deleted calculation for {len(questions)} questions")
+
+        try:
+            if len(questions) < 2:
+                self.logger.warning("Insufficient items for reliability analysis")
+                return {
+                    "status": "error",
+                    "message": "Insufficient items for analysis"
+                }
+
+            if isinstance(data, ResponseAccumulator):
+                covariance = data.covariance(questions)
+            else:
+                responses = ResponseMatrix.ensure(data, questions)
+                values, _ = responses.select(questions)
+                covariance = np.cov(values, rowvar=False, ddof=1)
+            statistics = item_deletion_statistics(covariance)
+
+            self.logger.info(f"Baseline alpha for item deletion: {statistics['alpha']:.4f}")
+
             return {
-                "alpha": alpha,
-                "n_items": n_items,
-                "item_variances": item_variances.to_dict(),
-                "total_variance": total_variance,
-                "status": "success",
-                "interpretation": self._get_interpretation(alpha)
+                "questions": list(questions),
+                "alpha": statistics["alpha"],
+                "alpha_if_deleted": statistics["alpha_if_deleted"],
+                "alpha_change": statistics["alpha_if_deleted"] - statistics["alpha"],
+                "corrected_item_total": statistics["corrected_item_total"],
+                "status": "success"
             }
 
         except Exception as e:
-            self.logger.error(f"Error in alpha calculation: {str(e)}", exc_info=True)
+            self.logger.error(f"Error in alpha-if-deleted calculation: {str(e)}", exc_info=True)
             return {
-                "alpha": None,
-                "n_items": len(questions),
                 "status": "error",
                 "message": str(e)
             }
@@ -0,0 +1,115 @@
+# src/core/statistics/kernels.py
+import numpy as np
+from scipy.stats import rankdata
+
+# Upper bound on the elements ranked at once by the batched kernels
+RANK_CHUNK_ELEMENTS = 8_000_000
+
+def pearson_correlation(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two vectors, NaN when undefined"""
+    if len(x) < 2:
+        return np.nan
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
+    denominator = np.sqrt((x_centered @ x_centered) * (y_centered @ y_centered))
+    if denominator == 0:
+        return np.nan
+    return float((x_centered @ y_centered) / denominator)
+
+def columnwise_pearson(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pearson correlation between matching columns of two equally shaped matrices"""
+    a_centered = a - a.mean(axis=0)
+    b_centered = b - b.mean(axis=0)
+    numerator = np.einsum('ij,ij->j', a_centered, b_centered)
+    denominator = np.sqrt(np.einsum('ij,ij->j', a_centered, a_centered) *
+                          np.einsum('ij,ij->j', b_centered, b_centered))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, np.nan, numerator / denominator)
+
+def item_rest_spearman(items: np.ndarray, chunk_elements: int = RANK_CHUNK_ELEMENTS) -> np.ndarray:
+    """
+    Spearman correlation of every item with the sum of the remaining items.
+
+    All rest-scores of a column block are formed at once as total - items,
+    both blocks are ranked column-wise, and the coefficients are the
+    column-wise Pearson correlations of the ranks. Columns are processed in
+    blocks so memory stays bounded for very wide instruments.
+    """
+    n, k = items.shape
+    correlations = np.full(k, np.nan)
+    if n < 2:
+        return correlations
+
+    total = items.sum(axis=1, dtype=np.float64)
+    step = max(1, chunk_elements // max(n, 1))
+    for start in range(0, k, step):
+        block = items[:, start:start + step]
+        rest = total[:, None] - block
+        correlations[start:start + step] = columnwise_pearson(
+            rankdata(block, method='average', axis=0),
+            rankdata(rest, method='average', axis=0)
+        )
+    return correlations
+
+def item_deletion_statistics(covariance: np.ndarray) -> dict:
+    """
+    Baseline alpha, alpha if each item is deleted and corrected item-total
+    correlations, all derived from one item covariance matrix.
+
+    Deleting item i removes its variance from the item variance sum and
+    2*rowsum_i - var_i from the total score variance, so every k-1 item
+    alpha follows from the row sums without touching the responses again.
+    """
+    k = covariance.shape[0]
+    item_variances = np.diag(covariance)
+    row_sums = covariance.sum(axis=1)
+    total_variance = row_sums.sum()
+    item_variance_sum = item_variances.sum()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = (k / (k - 1)) * (1 - item_variance_sum / total_variance) if total_variance else 0.0
+
+        rest_variances = total_variance - 2 * row_sums + item_variances
+        if k > 2:
+            alpha_if_deleted = ((k - 1) / (k - 2)) * (1 - (item_variance_sum - item_variances) / rest_variances)
+            alpha_if_deleted = np.where(rest_variances == 0, 0.0, alpha_if_deleted)
+        else:
+            alpha_if_deleted = np.full(k, np.nan)
+
+        # Covariance of each item with the sum of the remaining items
+        item_rest_covariances = row_sums - item_variances
+        corrected_item_total = item_rest_covariances / np.sqrt(item_variances * rest_variances)
+
+    return {
+        "alpha": float(alpha),
+        "alpha_if_deleted": alpha_if_deleted,
+        "corrected_item_total": corrected_item_total,
+    }
+
+def split_half_coefficients(covariance: np.ndarray, splits: np.ndarray) -> dict:
+    """
+    Guttman split-half (lambda 4 for the best split) and Spearman-Brown
+    coefficients for a batch of splits, each given as a 0/1 row marking the
+    items of the first half.
+
+    With s the split vector and C the item covariance matrix, the half
+    variances are s'Cs and (1-s)'C(1-s) and their covariance is s'C(1-s),
+    so a whole batch is evaluated from one (splits x items) product with C.
+    """
+    splits = splits.astype(np.float64, copy=False)
+    row_sums = covariance.sum(axis=1)
+    total_variance = row_sums.sum()
+
+    first_variances = np.einsum('ij,ij->i', splits @ covariance, splits)
+    first_with_total = splits @ row_sums
+    covariances = first_with_total - first_variances
+    second_variances = total_variance - 2 * first_with_total + first_variances
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        guttman = 4 * covariances / total_variance
+        r = covariances / np.sqrt(first_variances * second_variances)
+        spearman_brown = (2 * r) / (1 + r)
+    return {
+        "guttman": guttman,
+        "spearman_brown": spearman_brown
+    }
@@ -0,0 +1,97 @@
+# src/core/statistics/response_matrix.py
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple, Union
+
+class ResponseMatrix:
+    """
+    Numeric responses for one analysis run.
+
+    The selected question columns are coerced to numbers once and stored as a
+    single C-contiguous float array (float64, or float32 from the streaming
+    reader). Calculators read column blocks from it by position; contiguous
+    question ranges are returned as views, so no conversion or copy happens
+    per calculation. Reductions are accumulated in float64 by the callers.
+    The values are never modified after construction, so calculators may
+    read one matrix from several threads at once.
+    """
+
+    def __init__(self, values: np.ndarray, questions: List[str], index: pd.Index):
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
+        self.values = np.ascontiguousarray(values)
+        self.questions = list(questions)
+        self.index = index
+        self.positions = {question: i for i, question in enumerate(self.questions)}
+        # Rows with a response for every question
+        self.valid = ~np.isnan(self.values).any(axis=1)
+        self._all_valid = bool(self.valid.all())
+        self._row_masks: Dict[Tuple[int, ...], np.ndarray] = {}
+        self._participants: Dict[Tuple[int, ...], pd.Index] = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, questions: List[str]) -> 'ResponseMatrix':
+        """Convert the question columns of a DataFrame, coercing invalid entries to NaN"""
+        values = data[questions].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        return cls(values, questions, data.index)
+
+    @classmethod
+    def ensure(cls, data: Union[pd.DataFrame, 'ResponseMatrix'], questions: List[str]) -> 'ResponseMatrix':
+        """Return data unchanged if it is already a ResponseMatrix, otherwise convert it"""
+        if isinstance(data, cls):
+            return data
+        return cls.from_frame(data, questions)
+
+    @property
+    def n_rows(self) -> int:
+        return self.values.shape[0]
+
+    def column_indices(self, questions: List[str]) -> np.ndarray:
+        return np.fromiter((self.positions[q] for q in questions), dtype=np.intp, count=len(questions))
+
+    def _column_selector(self, questions: List[str]):
+        """Use a slice for contiguous ranges so that indexing yields a view"""
+        cols = self.column_indices(questions)
+        if len(cols) and np.array_equal(cols, np.arange(cols[0], cols[0] + len(cols))):
+            return slice(int(cols[0]), int(cols[0]) + len(cols))
+        return cols
+
+    def row_mask(self, questions: List[str]) -> np.ndarray:
+        """Rows with a response for every one of the given questions"""
+        if self._all_valid:
+            return self.valid
+        key = tuple(self.column_indices(questions))
+        mask = self._row_masks.get(key)
+        if mask is None:
+            # setdefault keeps the first mask stored when threads race on the same key
+            mask = ~np.isnan(self.values[:, self._column_selector(questions)]).any(axis=1)
+            mask = self._row_masks.setdefault(key, mask)
+        return mask
+
+    def participants(self, questions: List[str]) -> pd.Index:
+        """
+        Labels of the complete-case rows for the given questions. The same
+        Index object is returned for every calculation on the same rows.
+        """
+        if self._all_valid:
+            return self.index
+        key = tuple(self.column_indices(questions))
+        labels = self._participants.get(key)
+        if labels is None:
+            labels = self.index[self.row_mask(questions)]
+            labels = self._participants.setdefault(key, labels)
+        return labels
+
+    def block(self, questions: List[str], rows: np.ndarray = None) -> np.ndarray:
+        """Values of the given questions, restricted to rows when a mask is given"""
+        cols = self._column_selector(questions)
+        if rows is None or (rows is self.valid and self._all_valid):
+            return self.values[:, cols]
+        if isinstance(cols, slice):
+            return self.values[rows, cols]
+        return self.values[np.ix_(rows, cols)]
+
+    def select(self, questions: List[str]) -> Tuple[np.ndarray, pd.Index]:
+        """Complete-case block for the given questions and the matching participant labels"""
+        rows = self.row_mask(questions)
+        return self.block(questions, rows), self.participants(questions)
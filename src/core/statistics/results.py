@@ -0,0 +1,113 @@
+# src/core/statistics/results.py
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+# Per-participant values are kept as NumPy arrays aligned with a participant
+# index shared through ResponseMatrix.select, and formatters read them by
+# position. Calculators report failures with status "error" and a message
+# instead of raising.
+
+@dataclass
+class ConfidenceInterval:
+    """Bootstrap percentile interval and the number of replicates it was taken from"""
+    __slots__ = ('lower', 'upper', 'confidence', 'n_replicates')
+    lower: float
+    upper: float
+    confidence: float
+    n_replicates: int
+
+@dataclass
+class CronbachResult:
+    """Cronbach's Alpha for one set of questions"""
+    __slots__ = ('questions', 'n_items', 'alpha', 'item_variances', 'total_variance',
+                 'interpretation', 'alpha_ci', 'status', 'message')
+    questions: List[str]
+    n_items: int
+    alpha: Optional[float]
+    item_variances: np.ndarray
+    total_variance: Optional[float]
+    interpretation: str
+    alpha_ci: Optional[ConfidenceInterval]
+    status: str
+    message: str
+
+    @classmethod
+    def error(cls, questions: List[str], message: str, alpha: float = None) -> 'CronbachResult':
+        return cls(list(questions), len(questions), alpha, np.empty(0), None, "", None, "error", message)
+
+@dataclass
+class SplitHalfResult:
+    """Odd-even split-half reliability with the half sums of each participant"""
+    __slots__ = ('participants', 'odd_questions', 'even_questions', 'pearson_correlation',
+                 'spearman_brown', 'odd_sums', 'even_sums', 'interpretation', 'spearman_brown_ci',
+                 'status', 'message')
+    participants: pd.Index
+    odd_questions: List[str]
+    even_questions: List[str]
+    pearson_correlation: Optional[float]
+    spearman_brown: Optional[float]
+    odd_sums: np.ndarray
+    even_sums: np.ndarray
+    interpretation: str
+    spearman_brown_ci: Optional[ConfidenceInterval]
+    status: str
+    message: str
+
+    @classmethod
+    def error(cls, message: str) -> 'SplitHalfResult':
+        return cls(pd.Index([]), [], [], None, None, np.empty(0), np.empty(0), "", None, "error", message)
+
+@dataclass
+class ConstructValidityResult:
+    """
+    Spearman correlation of each dimension score with the total score.
+
+    dimension_scores and dimension_ranks have one column per entry of
+    dimensions, in the same order as correlations and interpretations.
+    """
+    __slots__ = ('participants', 'total_scores', 'total_ranks', 'dimensions', 'dimension_scores',
+                 'dimension_ranks', 'correlations', 'interpretations', 'status', 'message')
+    participants: pd.Index
+    total_scores: np.ndarray
+    total_ranks: np.ndarray
+    dimensions: list
+    dimension_scores: np.ndarray
+    dimension_ranks: np.ndarray
+    correlations: np.ndarray
+    interpretations: List[str]
+    status: str
+    message: str
+
+    @classmethod
+    def error(cls, message: str) -> 'ConstructValidityResult':
+        empty = np.empty((0, 0))
+        return cls(pd.Index([]), np.empty(0), np.empty(0), [], empty, empty, np.empty(0), [], "error", message)
+
+@dataclass
+class SplitDistributionResult:
+    """
+    Guttman and Spearman-Brown coefficients over many half-splits of one set
+    of questions. guttman_max is Guttman's lambda 4 when every split was
+    evaluated, and a lower bound for it when splits were sampled.
+    """
+    __slots__ = ('questions', 'n_splits', 'exhaustive', 'guttman_min', 'guttman_mean', 'guttman_max',
+                 'spearman_brown_min', 'spearman_brown_mean', 'spearman_brown_max', 'best_split',
+                 'status', 'message')
+    questions: List[str]
+    n_splits: int
+    exhaustive: bool
+    guttman_min: Optional[float]
+    guttman_mean: Optional[float]
+    guttman_max: Optional[float]
+    spearman_brown_min: Optional[float]
+    spearman_brown_mean: Optional[float]
+    spearman_brown_max: Optional[float]
+    best_split: List[str]
+    status: str
+    message: str
+
+    @classmethod
+    def error(cls, questions: List[str], message: str) -> 'SplitDistributionResult':
+        return cls(list(questions), 0, False, None, None, None, None, None, None, [], "error", message)
@@ -2,59 +2,91 @@
 import pandas as pd
 import numpy as np
 import logging
-from datetime import datetime
-import os
-from typing import Dict, List
+from itertools import combinations, islice
+from typing import Dict, Iterator, List, Optional, Union
+from .accumulator import ResponseAccumulator
+from .bootstrap import BootstrapEstimator
+from .kernels import pearson_correlation, split_half_coefficients
+from .response_matrix import ResponseMatrix
+from .results import SplitDistributionResult, SplitHalfResult
+from ...utils.logger import AppLogger
+
+# Item counts up to this evaluate every distinct half-split (92,378 splits at 20 items)
+MAX_EXHAUSTIVE_ITEMS = 20
+DEFAULT_RANDOM_SPLITS = 20000
+SPLIT_BATCH_SIZE = 16384
+
+def exhaustive_splits(n_items: int, batch_size: int = SPLIT_BATCH_SIZE) -> Iterator[np.ndarray]:
+    """
+    Every distinct split into halves of n_items // 2 and the remaining
+    items, as batches of 0/1 rows. With an even item count the first item
+    is kept in the first half so each split appears once, not twice.
+    """
+    half = n_items // 2
+    if n_items % 2 == 0:
+        combos = ((0,) + rest for rest in combinations(range(1, n_items), half - 1))
+    else:
+        combos = combinations(range(n_items), half)
+    while True:
+        batch = np.array(list(islice(combos, batch_size)), dtype=np.intp).reshape(-1, half)
+        if len(batch) == 0:
+            return
+        splits = np.zeros((len(batch), n_items), dtype=np.float64)
+        np.put_along_axis(splits, batch, 1.0, axis=1)
+        yield splits
+
+def random_splits(n_items: int, n_splits: int, rng: np.random.Generator,
+                  batch_size: int = SPLIT_BATCH_SIZE) -> Iterator[np.ndarray]:
+    """Uniformly drawn splits into halves of n_items // 2 and the remaining items"""
+    half = n_items // 2
+    for start in range(0, n_splits, batch_size):
+        count = min(batch_size, n_splits - start)
+        first_half = np.argsort(rng.random((count, n_items)), axis=1)[:, :half]
+        splits = np.zeros((count, n_items), dtype=np.float64)
+        np.put_along_axis(splits, first_half, 1.0, axis=1)
+        yield splits
 
 class SplitHalfCalculator:
     def __init__(self):
-        self._setup_logger()
-        
-    def _setup_logger(self):
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
-        self.logger = logging.getLogger('SplitHalf')
-        self.logger.setLevel(logging.DEBUG)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = f'logs/split_half_{timestamp}.log'
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        
-        self.logger.addHandler(file_handler)
-
-    def calculate(self, data: pd.DataFrame, questions: List[str]) -> Dict:
+        # Records go through the shared application log rather than a file per instance
+        self.logger = AppLogger.get_logger('split_half')
+
+    def calculate(self, data: Union[pd.DataFrame, ResponseMatrix, ResponseAccumulator], questions: List[str],
+                  bootstrap: Optional[BootstrapEstimator] = None) -> SplitHalfResult:
         """
-        Calculate Split-Half reliability using odd-even method
+        Calculate Split-Half reliability using odd-even method, with a
+        bootstrap confidence interval when an estimator is given. From an
+        accumulator the coefficients come from its covariance matrix and
+        no per-participant sums or interval are reported.
         """
+        if isinstance(data, ResponseAccumulator):
+            return self._calculate_from_accumulator(data, questions)
+
         self.logger.info(f"Starting Split-Half calculation for {len(questions)} questions")
-        self.logger.debug(f"Question columns: {questions}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Question columns: {questions}")
 
         try:
-            # Convert to numeric and handle missing values
-            df = data[questions].apply(pd.to_numeric, errors='coerce')
-            df_clean = df.dropna()
+            # Complete-case responses from the shared numeric matrix
+            responses = ResponseMatrix.ensure(data, questions)
+            values, participants = responses.select(questions)
             
-            self.logger.debug(f"Data shape after cleaning: {df_clean.shape}")
+            self.logger.debug(f"Data shape after cleaning: {values.shape}")
             
             # Split questions into odd and even
             odd_questions = questions[::2]  # Get items at odd indices (0, 2, 4, ...)
             even_questions = questions[1::2]  # Get items at even indices (1, 3, 5, ...)
             
-            self.logger.debug(f"Odd questions: {odd_questions}")
-            self.logger.debug(f"Even questions: {even_questions}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Odd questions: {odd_questions}")
+                self.logger.debug(f"Even questions: {even_questions}")
             
             # Calculate sums for each participant
-            odd_sums = df_clean[odd_questions].sum(axis=1)
-            even_sums = df_clean[even_questions].sum(axis=1)
+            odd_sums = values[:, 0::2].sum(axis=1, dtype=np.float64)
+            even_sums = values[:, 1::2].sum(axis=1, dtype=np.float64)
             
             # Calculate Pearson correlation
-            pearson_corr = odd_sums.corr(even_sums)
+            pearson_corr = pearson_correlation(odd_sums, even_sums)
             
             # Calculate Spearman-Brown coefficient
             spearman_brown = (2 * pearson_corr) / (1 + pearson_corr)
@@ -63,23 +95,141 @@ class SplitHalfCalculator:
             self.logger.info(f"Pearson correlation: {pearson_corr:.4f}")
             self.logger.info(f"Spearman-Brown coefficient: {spearman_brown:.4f}")
             
-            return {
-                "odd_questions": odd_questions,
-                "even_questions": even_questions,
-                "pearson_correlation": pearson_corr,
-                "spearman_brown": spearman_brown,
-                "odd_sums": odd_sums.to_dict(),
-                "even_sums": even_sums.to_dict(),
-                "status": "success",
-                "interpretation": self._get_interpretation(spearman_brown)
-            }
+            spearman_brown_ci = None
+            if bootstrap is not None:
+                spearman_brown_ci = bootstrap.interval('split_half', values)
+                self.logger.info(f"Spearman-Brown {bootstrap.confidence:.0%} CI: "
+                                 f"[{spearman_brown_ci.lower:.4f}, {spearman_brown_ci.upper:.4f}]")
+            
+            return SplitHalfResult(
+                participants=participants,
+                odd_questions=odd_questions,
+                even_questions=even_questions,
+                pearson_correlation=pearson_corr,
+                spearman_brown=spearman_brown,
+                odd_sums=odd_sums,
+                even_sums=even_sums,
+                interpretation=self._get_interpretation(spearman_brown),
+                spearman_brown_ci=spearman_brown_ci,
+                status="success",
+                message=""
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in Split-Half calculation: {str(e)}", exc_info=True)
+            return SplitHalfResult.error(str(e))
+
+    def _calculate_from_accumulator(self, accumulator: ResponseAccumulator, questions: List[str]) -> SplitHalfResult:
+        """Odd-even split-half from block sums of the covariance matrix"""
+        try:
+            covariance = accumulator.covariance(questions)
+            odd = np.arange(0, len(questions), 2)
+            even = np.arange(1, len(questions), 2)
+            odd_variance = covariance[np.ix_(odd, odd)].sum()
+            even_variance = covariance[np.ix_(even, even)].sum()
+            odd_even_covariance = covariance[np.ix_(odd, even)].sum()
+            
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pearson_corr = float(odd_even_covariance / np.sqrt(odd_variance * even_variance))
+            spearman_brown = (2 * pearson_corr) / (1 + pearson_corr)
+            
+            self.logger.info(f"Spearman-Brown coefficient from accumulated statistics: {spearman_brown:.4f}")
+            
+            return SplitHalfResult(
+                participants=pd.Index([]),
+                odd_questions=questions[::2],
+                even_questions=questions[1::2],
+                pearson_correlation=pearson_corr,
+                spearman_brown=spearman_brown,
+                odd_sums=np.empty(0),
+                even_sums=np.empty(0),
+                interpretation=self._get_interpretation(spearman_brown),
+                spearman_brown_ci=None,
+                status="success",
+                message=""
+            )
 
         except Exception as e:
             self.logger.error(f"Error in Split-Half calculation: {str(e)}", exc_info=True)
-            return {
-                "status": "error",
-                "message": str(e)
-            }
+            return SplitHalfResult.error(str(e))
+
+    def calculate_distribution(self, data: Union[pd.DataFrame, ResponseMatrix, ResponseAccumulator],
+                               questions: List[str],
+                               max_exhaustive_items: int = MAX_EXHAUSTIVE_ITEMS,
+                               n_random_splits: int = DEFAULT_RANDOM_SPLITS,
+                               seed: int = 0) -> SplitDistributionResult:
+        """
+        Distribution of split-half coefficients over all distinct half-splits,
+        or over n_random_splits seeded random splits for larger item sets
+        """
+        self.logger.info(f"Starting split-half distribution for {len(questions)} questions")
+
+        try:
+            n_items = len(questions)
+            if n_items < 2:
+                self.logger.warning("Insufficient items for split-half distribution")
+                return SplitDistributionResult.error(questions, "Insufficient items for analysis")
+
+            if isinstance(data, ResponseAccumulator):
+                covariance = data.covariance(questions)
+            else:
+                responses = ResponseMatrix.ensure(data, questions)
+                values, _ = responses.select(questions)
+                covariance = np.cov(values, rowvar=False, ddof=1)
+            exhaustive = n_items <= max_exhaustive_items
+            if exhaustive:
+                batches = exhaustive_splits(n_items)
+            else:
+                batches = random_splits(n_items, n_random_splits, np.random.default_rng(seed))
+
+            # Running summaries, so only one batch of splits is held at a time
+            n_splits = n_guttman = n_spearman_brown = 0
+            guttman_sum = spearman_brown_sum = 0.0
+            guttman_min = spearman_brown_min = np.inf
+            guttman_max = spearman_brown_max = -np.inf
+            best_split = None
+            for splits in batches:
+                coefficients = split_half_coefficients(covariance, splits)
+                guttman = coefficients["guttman"]
+                spearman_brown = coefficients["spearman_brown"]
+                n_splits += len(splits)
+                n_guttman += int(np.count_nonzero(~np.isnan(guttman)))
+                n_spearman_brown += int(np.count_nonzero(~np.isnan(spearman_brown)))
+                guttman_sum += np.nansum(guttman)
+                spearman_brown_sum += np.nansum(spearman_brown)
+                guttman_min = np.fmin(guttman_min, np.nanmin(guttman, initial=np.inf))
+                spearman_brown_min = np.fmin(spearman_brown_min, np.nanmin(spearman_brown, initial=np.inf))
+                spearman_brown_max = np.fmax(spearman_brown_max, np.nanmax(spearman_brown, initial=-np.inf))
+                batch_max = np.nanmax(guttman, initial=-np.inf)
+                if batch_max > guttman_max:
+                    guttman_max = batch_max
+                    best_split = splits[np.nanargmax(guttman)]
+
+            if best_split is None:
+                self.logger.warning("Split-half coefficients are undefined (zero total variance)")
+                return SplitDistributionResult.error(questions, "Zero total variance")
+
+            self.logger.info(f"Evaluated {n_splits} {'exhaustive' if exhaustive else 'random'} splits, "
+                             f"lambda 4 = {guttman_max:.4f}")
+
+            return SplitDistributionResult(
+                questions=list(questions),
+                n_splits=n_splits,
+                exhaustive=exhaustive,
+                guttman_min=float(guttman_min),
+                guttman_mean=float(guttman_sum / n_guttman),
+                guttman_max=float(guttman_max),
+                spearman_brown_min=float(spearman_brown_min),
+                spearman_brown_mean=float(spearman_brown_sum / n_spearman_brown) if n_spearman_brown else np.nan,
+                spearman_brown_max=float(spearman_brown_max),
+                best_split=[q for q, in_first in zip(questions, best_split) if in_first],
+                status="success",
+                message=""
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in split-half distribution: {str(e)}", exc_info=True)
+            return SplitDistributionResult.error(questions, str(e))
 
     def _get_interpretation(self, coefficient: float) -> str:
         """
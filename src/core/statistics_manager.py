@@ -1,22 +1,99 @@
 # src/core/statistics_manager.py
-from openpyxl import Workbook
 import pandas as pd
 import logging
-from typing import List, Dict
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple, Union
 import os
 from .statistics.cronbach_alpha import CronbachAlphaCalculator
 from .statistics.split_half import SplitHalfCalculator
 from .statistics.construct_validity import ConstructValidityCalculator
+from .statistics.response_matrix import ResponseMatrix
+from .statistics.bootstrap import BootstrapEstimator
 from .formatters.cronbach_formatter import CronbachFormatter
 from .formatters.split_half_formatter import SplitHalfFormatter
 from .formatters.construct_formatter import ConstructValidityFormatter
+from .formatters.writers import WorkbookWriter, as_sheet_writer, create_workbook_writer
+from .progress import AnalysisCancelled, ProgressReporter
+from ..utils.logger import AppLogger
+from ..utils.profiling import RunProfiler
+
+# Calculations of a report by kind, as (calculator class, method); every method
+# takes the response matrix first. Looked up by name so pool processes can run them.
+CALCULATIONS = {
+    'alpha': (CronbachAlphaCalculator, 'calculate'),
+    'item_deletion': (CronbachAlphaCalculator, 'calculate_item_deletion'),
+    'split_half': (SplitHalfCalculator, 'calculate'),
+    'split_distribution': (SplitHalfCalculator, 'calculate_distribution'),
+    'construct_validity': (ConstructValidityCalculator, 'calculate'),
+    'item_rest': (ConstructValidityCalculator, 'calculate_item_rest')
+}
+
+@dataclass
+class Calculation:
+    """One independent calculation of a report: its result key, span name, item count, kind and arguments"""
+    __slots__ = ('key', 'span', 'items', 'kind', 'args', 'message')
+    key: Any
+    span: str
+    items: int
+    kind: str
+    args: Tuple
+    message: str
+
+def run_calculation(kind: str, args: Tuple, responses: ResponseMatrix):
+    # Calculators keep no state between calls, so a new one per call is cheap and never shared
+    calculator, method = CALCULATIONS[kind]
+    return getattr(calculator(), method)(responses, *args)
+
+_worker_responses = None
+
+def _set_worker_responses(responses: ResponseMatrix, log_queue) -> None:
+    # Ship the responses to each pool process once rather than with every calculation
+    AppLogger.attach_worker(log_queue)
+    global _worker_responses
+    _worker_responses = responses
+
+def _run_timed_calculation(kind: str, args: Tuple):
+    """Run a calculation in a pool process; returns the result, its perf_counter start and its duration"""
+    started = time.perf_counter()
+    result = run_calculation(kind, args, _worker_responses)
+    return result, started, time.perf_counter() - started
 
 class StatisticsManager:
-    def __init__(self, data: pd.DataFrame, questions: List[str], dimensions: Dict[str, List[str]]):
-        self.logger = logging.getLogger('ExcelAutoRanker')
+    # Inputs with at least this many response cells use processes instead of threads
+    PROCESS_POOL_MIN_CELLS = 20_000_000
+
+    def __init__(self, data: Optional[Union[pd.DataFrame, ResponseMatrix]], questions: List[str],
+                 dimensions: Dict[str, List[str]], progress: ProgressReporter = None,
+                 bootstrap: BootstrapEstimator = None, profiler: RunProfiler = None,
+                 workers: int = 1, processes: Optional[bool] = None):
+        """
+        With workers > 1 the independent calculations of the report run
+        concurrently: on threads, where NumPy releases the GIL, or on
+        processes when processes is True, or by default when the responses
+        have at least PROCESS_POOL_MIN_CELLS cells.
+        """
+        self.logger = AppLogger.get_logger()
+        self.progress = progress or ProgressReporter()
+        self.profiler = profiler or RunProfiler()
+        # Confidence intervals for alpha and split-half are only computed when an estimator is given
+        self.bootstrap = bootstrap
+        self.workers = max(1, workers or 1)
+        self.processes = processes
+        self.results = None
         self.data = data
         self.questions = questions
         self.dimensions = dimensions
+        # Convert responses to numbers once and share them with every calculator;
+        # without data the manager can only export results computed earlier
+        columns = list(dict.fromkeys(questions + [q for cols in dimensions.values() for q in cols]))
+        self.responses = None
+        if data is not None:
+            with self.profiler.span('response_matrix', items=len(columns)) as span:
+                self.responses = ResponseMatrix.ensure(data, columns)
+                span.rows = self.responses.n_rows
         self.cronbach = CronbachAlphaCalculator()
         self.split_half = SplitHalfCalculator()
         self.construct_validity = ConstructValidityCalculator()
@@ -25,6 +102,8 @@ class StatisticsManager:
         self.logger.info("STATISTICS CALCULATION SETUP")
         self.logger.info(f"Total questions: {len(questions)}")
         self.logger.info(f"Total dimensions: {len(dimensions)}")
+        if self.responses is not None:
+            self.logger.info(f"Complete response rows: {int(self.responses.valid.sum())} of {self.responses.n_rows}")
         self.logger.info("-"*80)
         self.logger.info("DIMENSIONS BREAKDOWN:")
         for dim_num, dim_cols in dimensions.items():
@@ -34,73 +113,104 @@ class StatisticsManager:
 
     def calculate_per_question_alpha(self) -> Dict:
         """Calculate Cronbach's Alpha excluding each question one at a time"""
-        per_question_results = {}
-        
         self.logger.info("Calculating per-question Cronbach's Alpha")
         
-        # Calculate baseline alpha with all questions
-        baseline_alpha = self.cronbach.calculate(self.data, self.questions)['alpha']
+        # One covariance pass for the whole instrument gives every alpha-if-deleted value
+        overall = self.cronbach.calculate_item_deletion(self.responses, self.questions)
+        by_dimension = {
+            dim_num: self.cronbach.calculate_item_deletion(self.responses, dim_questions)
+            for dim_num, dim_questions in self.dimensions.items()
+        }
+        return self._per_question_alpha(overall, by_dimension)
+
+    def _per_question_alpha(self, overall: Dict, by_dimension: Dict) -> Dict:
+        """Per-question rows from the item-deletion statistics of the instrument and of each dimension"""
+        per_question_results = {}
+        if overall['status'] != 'success':
+            self.logger.error(f"Per-question alpha failed: {overall.get('message')}")
+            return per_question_results
         
-        for question in self.questions:
-            # Create list of questions excluding current one
-            remaining_questions = [q for q in self.questions if q != question]
-            
-            # Calculate alpha without this question
-            alpha_without = self.cronbach.calculate(self.data, remaining_questions)['alpha']
-            
-            # Store results
+        for i, question in enumerate(self.questions):
             per_question_results[question] = {
-                'alpha_if_deleted': alpha_without,
-                'alpha_change': alpha_without - baseline_alpha
+                'alpha_if_deleted': float(overall['alpha_if_deleted'][i]),
+                'alpha_change': float(overall['alpha_change'][i]),
+                'item_total_correlation': float(overall['corrected_item_total'][i]),
+                'dimension': None,
+                'dimension_alpha_if_deleted': None,
+                'dimension_alpha_change': None
             }
-            
-            self.logger.debug(f"Question {question}: Alpha if deleted = {alpha_without:.4f}, Change = {alpha_without - baseline_alpha:.4f}")
+        
+        # Same statistics within each dimension
+        for dim_num, dim_questions in self.dimensions.items():
+            dim_results = by_dimension[dim_num]
+            for i, question in enumerate(dim_questions):
+                if question not in per_question_results:
+                    continue
+                entry = per_question_results[question]
+                entry['dimension'] = dim_num
+                if dim_results['status'] == 'success':
+                    entry['dimension_alpha_if_deleted'] = float(dim_results['alpha_if_deleted'][i])
+                    entry['dimension_alpha_change'] = float(dim_results['alpha_change'][i])
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for question, data in per_question_results.items():
+                self.logger.debug(f"Question {question}: Alpha if deleted = {data['alpha_if_deleted']:.4f}, Change = {data['alpha_change']:.4f}")
         
         return per_question_results
 
     def calculate_per_question_construct_validity(self) -> Dict:
         """Calculate Construct Validity for each question within its dimension"""
-        per_question_results = {}
-        
         self.logger.info("Calculating per-question Construct Validity")
         
-        try:
-            # Convert to numeric and handle missing values
-            df = self.data[self.questions].apply(pd.to_numeric, errors='coerce')
-            df_clean = df.dropna()
-            
-            # Process each dimension
-            for dim_num, dim_questions in self.dimensions.items():
-                self.logger.debug(f"Processing dimension {dim_num}")
-                
-                # Calculate dimension total score
-                dim_total = df_clean[dim_questions].sum(axis=1)
-                
-                # Calculate correlation for each question in the dimension
-                for question in dim_questions:
-                    # Calculate dimension total without current question
-                    remaining_questions = [q for q in dim_questions if q != question]
-                    dim_total_without = df_clean[remaining_questions].sum(axis=1)
-                    
-                    # Calculate correlation between question and dimension total (without the question)
-                    question_scores = df_clean[question]
-                    correlation = question_scores.corr(dim_total_without, method='spearman')
-                    
-                    # Store results
-                    per_question_results[question] = {
-                        'dimension': dim_num,
-                        'correlation': correlation,
-                        'interpretation': self._get_correlation_interpretation(correlation)
-                    }
-                    
-                    self.logger.debug(f"Question {question}: Correlation = {correlation:.4f}")
-            
-            return per_question_results
-            
-        except Exception as e:
-            self.logger.error(f"Error in per-question construct validity calculation: {str(e)}")
-            self.logger.error("Full error details:", exc_info=True)
+        # Batched rank kernel: one call per dimension instead of one per question
+        results = self.construct_validity.calculate_item_rest(self.responses, self.questions, self.dimensions)
+        return self._per_question_construct_validity(results)
+
+    def _per_question_construct_validity(self, results: Dict) -> Dict:
+        """Per-question rows from the item-rest correlations of every dimension"""
+        per_question_results = {}
+        if results['status'] != 'success':
+            self.logger.error(f"Error in per-question construct validity calculation: {results.get('message')}")
             return {}
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for dim_num, dim_correlations in results['correlations'].items():
+            for question, correlation in dim_correlations.items():
+                per_question_results[question] = {
+                    'dimension': dim_num,
+                    'correlation': correlation,
+                    'interpretation': self._get_correlation_interpretation(correlation)
+                }
+                if debug:
+                    self.logger.debug(f"Question {question}: Correlation = {correlation:.4f}")
+        
+        return per_question_results
+
+    def calculate_split_distributions(self) -> List:
+        """Split-half coefficient distribution for all questions and for each dimension"""
+        self.logger.info("Calculating split-half distributions")
+        return self._split_distributions(
+            self.split_half.calculate_distribution(self.responses, self.questions),
+            {
+                dim_num: self.split_half.calculate_distribution(self.responses, dim_questions)
+                for dim_num, dim_questions in self.dimensions.items()
+            }
+        )
+
+    @staticmethod
+    def _split_distributions(overall, by_dimension: Dict) -> List:
+        """Labelled distribution rows, all questions first, then dimensions in order"""
+        distributions = [("All Questions / جميع الأسئلة", overall)]
+        for dim_num, distribution in by_dimension.items():
+            distributions.append((f"Dimension {dim_num} / البعد {dim_num}", distribution))
+        return distributions
+
+    @staticmethod
+    def _round_or_na(value):
+        """Round a statistic for display, or N/A when it is undefined"""
+        if value is None or pd.isna(value):
+            return "N/A"
+        return round(value, 6)
 
     def _get_correlation_interpretation(self, correlation: float) -> str:
         """Get bilingual interpretation of correlation coefficient"""
@@ -114,44 +224,58 @@ class StatisticsManager:
         else:
             return "Very Weak / ضعيف جداً"
 
-    def format_per_question_results(self, ws):
+    def format_per_question_results(self, ws, results: Dict = None):
         """Format per-question Cronbach's Alpha analysis results in worksheet"""
         # Headers
         headers = [
             "Question / السؤال",
             "Alpha if Deleted / معامل ألفا عند الحذف",
             "Change in Alpha / التغير في معامل ألفا",
-            "Impact / التأثير"
+            "Impact / التأثير",
+            "Corrected Item-Total Correlation / الارتباط المصحح بالمجموع",
+            "Dimension / البعد",
+            "Dimension Alpha if Deleted / ألفا البعد عند الحذف",
+            "Change in Dimension Alpha / التغير في ألفا البعد"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            CronbachFormatter._apply_header_style(cell)
+        ws = as_sheet_writer(ws)
+        ws.write_row(1, headers, style='header')
         
-        # Calculate per-question results
-        results = self.calculate_per_question_alpha()
+        # Calculate per-question results unless they were computed already
+        if results is None:
+            results = self.calculate_per_question_alpha()
         
         # Add data rows
         for row, (question, data) in enumerate(results.items(), 2):
-            ws.cell(row=row, column=1, value=question)
-            ws.cell(row=row, column=2, value=round(data['alpha_if_deleted'], 6))
             change = data['alpha_change']
-            ws.cell(row=row, column=3, value=round(change, 6))
             
             # Add impact interpretation
             impact = ("Improves reliability / يحسن الثبات" if change > 0 else 
                      "Reduces reliability / يقلل الثبات" if change < 0 else 
                      "No impact / لا تأثير")
-            ws.cell(row=row, column=4, value=impact)
+            row_values = [
+                question,
+                round(data['alpha_if_deleted'], 6),
+                round(change, 6),
+                impact,
+                self._round_or_na(data['item_total_correlation']),
+                None, None, None
+            ]
             
-            # Apply styling to all cells in row
-            for col in range(1, 5):
-                CronbachFormatter._apply_data_style(ws.cell(row=row, column=col))
+            # Same statistics within the question's own dimension
+            if data['dimension'] is not None:
+                row_values[5:] = [
+                    f"Dimension {data['dimension']}",
+                    self._round_or_na(data['dimension_alpha_if_deleted']),
+                    self._round_or_na(data['dimension_alpha_change'])
+                ]
+            
+            ws.write_row(row, row_values, style='data')
         
         # Adjust column widths
-        CronbachFormatter._adjust_column_widths(ws)
+        ws.adjust_column_widths()
 
-    def format_per_question_construct_validity(self, ws):
+    def format_per_question_construct_validity(self, ws, results: Dict = None):
         """Format per-question construct validity results in worksheet"""
         # Headers
         headers = [
@@ -161,93 +285,261 @@ class StatisticsManager:
             "Interpretation / التفسير"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            ConstructValidityFormatter._apply_header_style(cell)
+        ws = as_sheet_writer(ws)
+        ws.write_row(1, headers, style='header')
         
-        # Calculate per-question results
-        results = self.calculate_per_question_construct_validity()
+        # Calculate per-question results unless they were computed already
+        if results is None:
+            results = self.calculate_per_question_construct_validity()
         
         # Add data rows
         for row, (question, data) in enumerate(results.items(), 2):
-            ws.cell(row=row, column=1, value=question)
-            ws.cell(row=row, column=2, value=f"Dimension {data['dimension']}")
-            ws.cell(row=row, column=3, value=round(data['correlation'], 6))
-            ws.cell(row=row, column=4, value=data['interpretation'])
-            
-            # Apply styling to all cells in row
-            for col in range(1, 5):
-                ConstructValidityFormatter._apply_data_style(ws.cell(row=row, column=col))
+            ws.write_row(row, (
+                question,
+                f"Dimension {data['dimension']}",
+                round(data['correlation'], 6),
+                data['interpretation']
+            ), style='data')
         
         # Adjust column widths
-        ConstructValidityFormatter._adjust_column_widths(ws)
+        ws.adjust_column_widths()
 
-    def analyze_and_export(self, output_dir: str = '/app/data/output') -> str:
-        """Run statistical analysis and export to Excel"""
-        try:
-            # Ensure output directory exists
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Create workbook
-            wb = Workbook()
+    def _calculations(self) -> List['Calculation']:
+        """
+        The independent calculations of a report. The split-half
+        distributions take longest and are listed first, so a pool starts
+        them first.
+        """
+        n_items = len(self.questions)
+        calculations = [
+            Calculation('distribution', 'split_distribution', n_items, 'split_distribution',
+                        (self.questions,), "split-half distribution")
+        ]
+        for dim_num, dim_questions in self.dimensions.items():
+            calculations.append(Calculation(
+                ('distribution', dim_num), f'split_distribution_{dim_num}', len(dim_questions),
+                'split_distribution', (dim_questions,), f"dimension {dim_num} split-half distribution"
+            ))
+        calculations += [
+            Calculation('total_alpha', 'cronbach_alpha', n_items, 'alpha',
+                        (self.questions, self.bootstrap), "total Cronbach's Alpha"),
+            Calculation('split_half', 'split_half', n_items, 'split_half',
+                        (self.questions, self.bootstrap), "Split-Half reliability"),
+            Calculation('construct_validity', 'construct_validity', n_items, 'construct_validity',
+                        (self.questions, self.dimensions), "Construct Validity"),
+            Calculation('item_rest', 'per_question_construct_validity', n_items, 'item_rest',
+                        (self.questions, self.dimensions), "per-question Construct Validity"),
+            Calculation('item_deletion', 'per_question_alpha', n_items, 'item_deletion',
+                        (self.questions,), "per-question Cronbach's Alpha")
+        ]
+        for dim_num, dim_questions in self.dimensions.items():
+            calculations += [
+                Calculation(('alpha', dim_num), f'dimension_{dim_num}_alpha', len(dim_questions), 'alpha',
+                            (dim_questions, self.bootstrap), f"dimension {dim_num} Cronbach's Alpha"),
+                Calculation(('split_half', dim_num), f'dimension_{dim_num}_split_half', len(dim_questions),
+                            'split_half', (dim_questions, self.bootstrap), f"dimension {dim_num} Split-Half"),
+                Calculation(('item_deletion', dim_num), f'dimension_{dim_num}_item_deletion', len(dim_questions),
+                            'item_deletion', (dim_questions,), f"dimension {dim_num} per-question alpha")
+            ]
+        return calculations
+
+    def _use_processes(self) -> bool:
+        if self.processes is not None:
+            return self.processes
+        return self.responses.values.size >= self.PROCESS_POOL_MIN_CELLS
+
+    def _run_calculations(self, calculations: List['Calculation']) -> Dict:
+        """
+        Run the calculations and return their results by key. With more than
+        one worker they run concurrently; results are keyed, so completion
+        order never changes the report.
+        """
+        report_step = self.progress.stage_range(20, 60, len(calculations))
+        n_rows = self.responses.n_rows
+        outputs = {}
+        
+        workers = min(self.workers, len(calculations))
+        if workers > 1 and tracemalloc.is_tracing():
+            # tracemalloc peaks are process-wide; overlapping stages would share them
+            self.logger.info("Memory tracing is on; running calculations one at a time")
+            workers = 1
+        
+        if workers == 1:
+            for step, calculation in enumerate(calculations):
+                report_step(step, f"Calculating {calculation.message}...")
+                with self.profiler.span(calculation.span, n_rows, calculation.items):
+                    outputs[calculation.key] = run_calculation(calculation.kind, calculation.args, self.responses)
+            return outputs
+        
+        if self._use_processes():
+            self.logger.info(f"Running {len(calculations)} calculations in {workers} processes")
+            # Pool processes receive the responses once, in their initializer
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_responses,
+                                       initargs=(self.responses, AppLogger.worker_queue()))
+            submit = lambda calculation: pool.submit(_run_timed_calculation, calculation.kind, calculation.args)
+        else:
+            self.logger.info(f"Running {len(calculations)} calculations on {workers} threads")
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='statistics')
+            submit = lambda calculation: pool.submit(self._run_on_thread, calculation)
+        
+        with pool:
+            futures = {submit(calculation): calculation for calculation in calculations}
+            try:
+                report_step(0, "Calculating statistics...")
+                for step, future in enumerate(as_completed(futures), 1):
+                    calculation = futures[future]
+                    result = future.result()
+                    if isinstance(pool, ProcessPoolExecutor):
+                        result, started, seconds = result
+                        self.profiler.record(calculation.span, started, seconds, n_rows, calculation.items,
+                                             parent='compute')
+                    outputs[calculation.key] = result
+                    report_step(step, f"Calculated {calculation.message}")
+            except BaseException:
+                # Do not start calculations that are still queued
+                for future in futures:
+                    future.cancel()
+                raise
+        return outputs
+
+    def _run_on_thread(self, calculation: 'Calculation'):
+        with self.profiler.span(calculation.span, self.responses.n_rows, calculation.items, parent='compute'):
+            return run_calculation(calculation.kind, calculation.args, self.responses)
+
+    def compute_results(self) -> Dict:
+        """
+        Run every calculation needed for the report, without writing anything.
+        The calculations are independent of each other and run on the
+        manager's workers; their results are then assembled in report order.
+        """
+        with self.profiler.span('compute', self.responses.n_rows, len(self.questions)):
+            outputs = self._run_calculations(self._calculations())
             
-            # Calculate and format overall Cronbach's Alpha
-            self.logger.info("Calculating total Cronbach's Alpha")
-            total_alpha_results = self.cronbach.calculate(self.data, self.questions)
-            self.logger.info(f"Total Cronbach's Alpha: {total_alpha_results.get('alpha', 'N/A')}")
-            CronbachFormatter.format_results(wb, total_alpha_results)
+            results = {
+                'total_alpha': outputs['total_alpha'],
+                'split_half': outputs['split_half'],
+                'construct_validity': outputs['construct_validity'],
+                'per_question_construct_validity': self._per_question_construct_validity(outputs['item_rest'])
+            }
+            self.logger.info(f"Total Cronbach's Alpha: {results['total_alpha'].alpha}")
             
-            # Calculate and format Split-Half reliability
-            self.logger.info("Calculating Split-Half reliability")
-            split_half_results = self.split_half.calculate(self.data, self.questions)
-            split_half_sheet = wb.create_sheet(title="Split Half")
-            SplitHalfFormatter.format_results_to_sheet(split_half_sheet, split_half_results)
+            # Both Cronbach's Alpha and Split-Half for each dimension
+            results['dimensions'] = {}
+            for dim_num in self.dimensions:
+                dim_alpha_results = outputs[('alpha', dim_num)]
+                dim_split_half_results = outputs[('split_half', dim_num)]
+                self.logger.info(f"Dimension {dim_num} Cronbach's Alpha: {dim_alpha_results.alpha}")
+                self.logger.info(f"Dimension {dim_num} Split-Half: {dim_split_half_results.spearman_brown}")
+                results['dimensions'][dim_num] = {
+                    'alpha': dim_alpha_results,
+                    'split_half': dim_split_half_results
+                }
             
-            # Calculate and format Construct Validity
-            self.logger.info("Calculating Construct Validity")
-            construct_validity_results = self.construct_validity.calculate(
-                self.data, self.questions, self.dimensions
+            results['per_question_alpha'] = self._per_question_alpha(
+                outputs['item_deletion'],
+                {dim_num: outputs[('item_deletion', dim_num)] for dim_num in self.dimensions}
             )
-            construct_validity_sheet = wb.create_sheet(title="Construct Validity")
-            ConstructValidityFormatter.format_results_to_sheet(construct_validity_sheet, construct_validity_results)
-            
-            # Add per-question construct validity analysis sheet
-            per_question_cv_sheet = wb.create_sheet(title="Question Construct Validity")
-            self.format_per_question_construct_validity(per_question_cv_sheet)
-            
-            # Calculate and format dimensional statistics
-            self.logger.info("Calculating dimensional statistics")
-            for dim_num, dim_questions in self.dimensions.items():
-                self.logger.debug(f"Processing dimension {dim_num} with {len(dim_questions)} questions")
-                
-                # Calculate both Cronbach's Alpha and Split-Half for each dimension
-                dim_alpha_results = self.cronbach.calculate(self.data, dim_questions)
-                dim_split_half_results = self.split_half.calculate(self.data, dim_questions)
-                
-                self.logger.info(f"Dimension {dim_num} Cronbach's Alpha: {dim_alpha_results.get('alpha', 'N/A')}")
-                self.logger.info(f"Dimension {dim_num} Split-Half: {dim_split_half_results.get('spearman_brown', 'N/A')}")
-                
-                if dim_alpha_results['status'] == 'success':
-                    # Create sheets for both analyses
-                    alpha_sheet = wb.create_sheet(title=f"Dimension {dim_num} Alpha")
-                    split_half_sheet = wb.create_sheet(title=f"Dimension {dim_num} Split")
-                    
-                    CronbachFormatter.format_results_to_sheet(alpha_sheet, dim_alpha_results)
-                    SplitHalfFormatter.format_results_to_sheet(split_half_sheet, dim_split_half_results)
-                else:
-                    self.logger.error(f"Failed to calculate statistics for dimension {dim_num}")
-
-            # Add per-question Cronbach's alpha analysis sheet
-            per_question_sheet = wb.create_sheet(title="Question Analysis")
-            self.format_per_question_results(per_question_sheet)
+            results['split_distribution'] = self._split_distributions(
+                outputs['distribution'],
+                {dim_num: outputs[('distribution', dim_num)] for dim_num in self.dimensions}
+            )
+        
+        return results
+
+    def export_results(self, results: Dict, output_file: str, writer_backend: str = 'xlsxwriter') -> str:
+        """Write computed results to an Excel workbook, one sheet at a time"""
+        wb = create_workbook_writer(output_file, writer_backend, self.progress)
+        span = self.profiler.span
+        
+        with span('export'):
+            try:
+                self.write_results(wb, results)
+                self.progress.report(95, "Saving workbook...")
+            except BaseException:
+                # Leave no partial workbook behind on errors or cancellation
+                wb.discard()
+                raise
             
             # Save workbook
-            output_file = os.path.join(output_dir, 'statistical_analysis.xlsx')
-            wb.save(output_file)
-            self.logger.info(f"Analysis exported to {output_file}")
+            with span('save_workbook'):
+                wb.close()
+        self.logger.info(f"Analysis exported to {output_file}")
+        return output_file
+
+    def write_results(self, wb: WorkbookWriter, results: Dict) -> None:
+        """Add the report sheets for computed results to an open workbook"""
+        report_step = self.progress.stage_range(60, 95, 6 + 2 * len(results['dimensions']))
+        span = self.profiler.span
+        
+        report_step(0, "Writing Cronbach's Alpha sheet...")
+        with span('sheet_cronbach_alpha'):
+            CronbachFormatter.format_results(wb, results['total_alpha'])
+        
+        report_step(1, "Writing Split Half sheet...")
+        with span('sheet_split_half'):
+            SplitHalfFormatter.format_results_to_sheet(wb.add_sheet("Split Half"), results['split_half'])
+        
+        report_step(2, "Writing Construct Validity sheet...")
+        with span('sheet_construct_validity'):
+            ConstructValidityFormatter.format_results_to_sheet(
+                wb.add_sheet("Construct Validity"), results['construct_validity']
+            )
+        
+        report_step(3, "Writing Question Construct Validity sheet...")
+        with span('sheet_question_construct_validity'):
+            self.format_per_question_construct_validity(
+                wb.add_sheet("Question Construct Validity"), results['per_question_construct_validity']
+            )
+        
+        step = 4
+        for dim_num, dim_results in results['dimensions'].items():
+            if dim_results['alpha'].status == 'success':
+                # Create sheets for both analyses
+                report_step(step, f"Writing dimension {dim_num} Alpha sheet...")
+                with span(f'sheet_dimension_{dim_num}'):
+                    CronbachFormatter.format_results_to_sheet(
+                        wb.add_sheet(f"Dimension {dim_num} Alpha"), dim_results['alpha']
+                    )
+                    report_step(step + 1, f"Writing dimension {dim_num} Split sheet...")
+                    SplitHalfFormatter.format_results_to_sheet(
+                        wb.add_sheet(f"Dimension {dim_num} Split"), dim_results['split_half']
+                    )
+            else:
+                self.logger.error(f"Failed to calculate statistics for dimension {dim_num}")
+            step += 2
+        
+        report_step(step, "Writing Question Analysis sheet...")
+        with span('sheet_question_analysis'):
+            self.format_per_question_results(wb.add_sheet("Question Analysis"), results['per_question_alpha'])
+        
+        report_step(step + 1, "Writing Split-Half Distribution sheet...")
+        with span('sheet_split_distribution'):
+            SplitHalfFormatter.format_distribution_to_sheet(
+                wb.add_sheet("Split-Half Distribution"), results['split_distribution']
+            )
+
+    def analyze_and_export(self, output_dir: str = '/app/data/output', writer_backend: str = 'xlsxwriter',
+                           output_name: str = 'statistical_analysis.xlsx') -> str:
+        """
+        Run statistical analysis and export to Excel.
+
+        writer_backend selects how the workbook is written: 'xlsxwriter'
+        streams rows to disk in constant memory, 'openpyxl' builds the
+        workbook in memory before saving. output_name is the file name
+        created inside output_dir.
+        """
+        try:
+            # Ensure output directory exists
+            os.makedirs(output_dir, exist_ok=True)
+            output_file = os.path.join(output_dir, output_name)
             
-            return output_file
+            # Kept so callers can cache or re-render them
+            self.results = self.compute_results()
+            return self.export_results(self.results, output_file, writer_backend)
             
+        except AnalysisCancelled:
+            self.logger.info("Analysis cancelled")
+            raise
         except Exception as e:
             self.logger.error(f"Error in analyze_and_export: {str(e)}")
-            raise
\ No newline at end of file
+            raise
@@ -0,0 +1,161 @@
+# src/core/streaming_reader.py
+from typing import Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from .column_names import make_column_names
+from .response_mapping import ResponseMapping
+from .statistics.accumulator import ResponseAccumulator
+from .statistics.response_matrix import ResponseMatrix
+from ..utils.logger import AppLogger
+
+class StreamingResponseReader:
+    """
+    Read the selected question columns of a workbook straight into a numeric matrix.
+
+    The sheet is walked with openpyxl's read-only row iterator, restricted to
+    the question columns. Each chunk of rows is mapped and converted through
+    its unique cell values only (see ResponseMapping.convert), then copied into a preallocated float32
+    array, so peak memory follows the numeric matrix rather than the raw
+    workbook. Leading header-like rows are dropped with the same rule as
+    StatisticalAnalyzer.clean_data. Numeric cells are kept as numbers and
+    text cells are scored through the mapping; anything else becomes NaN.
+    """
+    DEFAULT_CHUNK_ROWS = 5000
+
+    def __init__(self, file_path: str, mapping: Union[ResponseMapping, Dict[str, float]] = None,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS, sheet_name: str = None, progress=None):
+        self.logger = AppLogger.get_logger()
+        self.progress = progress
+        self.file_path = file_path
+        self.mapping = ResponseMapping.coerce(mapping)
+        self.chunk_rows = chunk_rows
+        self.sheet_name = sheet_name
+
+    def _open_sheet(self):
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        ws = wb[self.sheet_name] if self.sheet_name else wb.worksheets[0]
+        # The stored <dimension> tag can be stale; keep its row count only as a
+        # buffer size hint and let iteration find the real extent, as pandas does
+        self._row_hint = ws.max_row
+        ws.reset_dimensions()
+        return wb, ws
+
+    def read_header(self) -> List[str]:
+        """Column names of the first row"""
+        wb, ws = self._open_sheet()
+        try:
+            header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            return make_column_names(header)
+        finally:
+            wb.close()
+
+    def _convert_chunk(self, rows: List[tuple], n_cols: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores and header-like flags for a chunk, computed on unique cell values"""
+        cells = np.empty((len(rows), n_cols), dtype=object)
+        for i, row in enumerate(rows):
+            cells[i, :len(row)] = row
+        return self.mapping.convert(cells, dtype=np.float32)
+
+    def read(self, question_columns: List[int]) -> Tuple[ResponseMatrix, List[str]]:
+        """Stream the given column positions into a ResponseMatrix; also returns all column names"""
+        first_col, last_col = min(question_columns), max(question_columns)
+        n_cols = last_col - first_col + 1
+
+        wb, ws = self._open_sheet()
+        try:
+            header = make_column_names(next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+            capacity = max((self._row_hint or 1) - 1, self.chunk_rows)
+            values = np.empty((capacity, n_cols), dtype=np.float32)
+            header_like = np.empty(capacity, dtype=bool)
+            n_rows = 0
+
+            self.logger.info(f"Streaming {n_cols} question columns from {self.file_path}")
+            for chunk in self._iter_chunks(ws, first_col, last_col):
+                values, header_like = self._append(values, header_like, n_rows, chunk, n_cols)
+                n_rows += len(chunk)
+        finally:
+            wb.close()
+
+        # Drop leading header-like rows, as clean_data does for the DataFrame path
+        data_rows = np.flatnonzero(~header_like[:n_rows])
+        first_data_row = int(data_rows[0]) if len(data_rows) else 0
+        buffer_rows = len(values)
+        values = values[first_data_row:n_rows]
+        if len(values) < buffer_rows:
+            # Release the unused tail of the preallocated buffer
+            values = values.copy()
+
+        questions = [header[i] for i in range(first_col, last_col + 1)]
+        self.logger.info(f"Streamed {len(values)} response rows ({values.nbytes} bytes)")
+        return ResponseMatrix(values, questions, pd.RangeIndex(len(values))), header
+
+    def accumulate(self, question_columns: List[int],
+                   accumulator: ResponseAccumulator = None) -> Tuple[ResponseAccumulator, List[str]]:
+        """
+        Stream the given column positions into a ResponseAccumulator, one
+        chunk at a time, so the rows are never held together. Pass an
+        existing accumulator to add the rows of this file to it.
+        """
+        columns = sorted(set(question_columns))
+        first_col, last_col = columns[0], columns[-1]
+        n_cols = last_col - first_col + 1
+        selected = np.array(columns) - first_col
+
+        wb, ws = self._open_sheet()
+        try:
+            header = make_column_names(next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+            if accumulator is None:
+                accumulator = ResponseAccumulator([header[i] for i in columns])
+            n_before = accumulator.n
+
+            self.logger.info(f"Accumulating {len(columns)} question columns from {self.file_path}")
+            # Leading header-like rows are held aside and dropped once a data row
+            # appears; if none ever does they are kept, as read() does
+            leading = ResponseAccumulator(accumulator.questions)
+            in_data = False
+            for chunk in self._iter_chunks(ws, first_col, last_col):
+                if self.progress is not None:
+                    self.progress.check_cancelled()
+                scores, header_like = self._convert_chunk(chunk, n_cols)
+                if not in_data:
+                    data_rows = np.flatnonzero(~header_like)
+                    if len(data_rows) == 0:
+                        leading.update(scores[:, selected])
+                        continue
+                    scores = scores[data_rows[0]:]
+                    in_data = True
+                accumulator.update(scores[:, selected])
+            if not in_data:
+                accumulator.merge(leading)
+        finally:
+            wb.close()
+
+        self.logger.info(f"Accumulated {accumulator.n - n_before} complete response rows")
+        return accumulator, header
+
+    def _iter_chunks(self, ws, first_col: int, last_col: int):
+        """Data rows below the header, restricted to first_col..last_col, in lists of chunk_rows"""
+        row_iter = ws.iter_rows(min_row=2, min_col=first_col + 1, max_col=last_col + 1, values_only=True)
+        chunk = []
+        for row in row_iter:
+            chunk.append(row)
+            if len(chunk) == self.chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _append(self, values, header_like, start, chunk, n_cols):
+        """Convert a chunk into the preallocated buffers, growing them when needed"""
+        if self.progress is not None:
+            self.progress.check_cancelled()
+        end = start + len(chunk)
+        if end > len(values):
+            new_capacity = max(end, 2 * len(values))
+            values = np.resize(values, (new_capacity, n_cols))
+            header_like = np.resize(header_like, new_capacity)
+        scores, chunk_header_like = self._convert_chunk(chunk, n_cols)
+        values[start:end] = scores
+        header_like[start:end] = chunk_header_like
+        return values, header_like
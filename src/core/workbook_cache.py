@@ -0,0 +1,164 @@
+# src/core/workbook_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from ..utils.logger import AppLogger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class CachedWorkbook:
+    """Parsed sheet of a workbook (the first unless named) together with its sheet list and header row"""
+
+    def __init__(self, file_path: str, data: 'pd.DataFrame', sheet_names: List[str], sheet_name: str = None):
+        self.file_path = file_path
+        self.data = data
+        self.sheet_names = sheet_names
+        self.sheet_name = sheet_name or (sheet_names[0] if sheet_names else None)
+        self.header = [str(col) for col in data.columns]
+        self.nbytes = int(data.memory_usage(index=True, deep=True).sum())
+
+class WorkbookCache:
+    """
+    Process-wide cache of parsed workbooks.
+
+    Entries are keyed on absolute path, modification time, size and sheet,
+    so an edited file is parsed again on its next lookup. Least recently used
+    entries are evicted once the cached frames exceed the memory budget.
+    The cached DataFrame is shared by every consumer and must not be
+    modified in place. With a SidecarCache set, a file that is not in
+    memory is read from its converted copy on disk when it is unchanged.
+    """
+    DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(WorkbookCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.logger = AppLogger.get_logger()
+        self.memory_budget = self.DEFAULT_MEMORY_BUDGET
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        # Per-key locks of the loads in progress
+        self._loading = {}
+        self.sidecar = None
+
+    @classmethod
+    def get_instance(cls) -> 'WorkbookCache':
+        return cls()
+
+    def set_sidecar_cache(self, sidecar) -> None:
+        """Use a SidecarCache below the in-memory cache, or None to always parse"""
+        with self._lock:
+            self.sidecar = sidecar
+
+    @staticmethod
+    def _make_key(file_path: str, sheet_name: str = None) -> Tuple[str, int, int, Optional[str]]:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size, sheet_name
+
+    def peek(self, file_path: str, sheet_name: str = None) -> Optional[CachedWorkbook]:
+        """The parsed workbook if it is already in memory, without reading anything"""
+        key = self._make_key(file_path, sheet_name)
+        with self._lock:
+            return self._entries.get(key)
+
+    def _lookup(self, key) -> Optional[CachedWorkbook]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.logger.debug(f"Workbook cache hit: {key[0]}")
+            return entry
+
+    def load(self, file_path: str, sheet_name: str = None) -> CachedWorkbook:
+        """
+        Return the parsed workbook, reading it from disk only on a cache miss.
+        Only the named sheet is parsed, or the first one when no name is given.
+
+        The file is parsed without holding the cache lock, so peek() and
+        loads of other files never wait on it; concurrent loads of the same
+        file wait for the first one instead of parsing it again.
+        """
+        key = self._make_key(file_path, sheet_name)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+            sidecar = self.sidecar
+        try:
+            with key_lock:
+                entry = self._lookup(key)
+                if entry is None:
+                    entry = self._parse(key, sheet_name, sidecar)
+                    self._insert(key, entry)
+                return entry
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def _insert(self, key, entry: CachedWorkbook) -> None:
+        if entry.nbytes > self.memory_budget:
+            self.logger.warning(
+                f"Workbook {key[0]} needs {entry.nbytes} bytes, more than the "
+                f"cache budget of {self.memory_budget} bytes; not caching it"
+            )
+            return
+
+        with self._lock:
+            # Drop entries for older versions of the same file
+            for stale_key in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                del self._entries[stale_key]
+            self._entries[key] = entry
+            self._evict()
+
+    def _parse(self, key, sheet_name: Optional[str], sidecar) -> CachedWorkbook:
+        # The sidecar holds converted copies of first sheets only
+        use_sidecar = sidecar is not None and sheet_name is None
+        converted = sidecar.load_frame(key[0]) if use_sidecar else None
+        if converted is not None:
+            data, sheet_names = converted
+        else:
+            # Imported on first use so the GUI can start without pandas
+            import pandas as pd
+            
+            self.logger.info(f"Parsing workbook: {key[0]}" + (f" (sheet {sheet_name})" if sheet_name else ""))
+            xl = pd.ExcelFile(key[0])
+            sheet_names = list(xl.sheet_names)
+            data = xl.parse(sheet_name if sheet_name is not None else sheet_names[0])
+            xl.close()
+            if use_sidecar:
+                sidecar.store_frame(key[0], data, sheet_names)
+        return CachedWorkbook(key[0], data, sheet_names, sheet_name)
+
+    def set_memory_budget(self, memory_budget: int) -> None:
+        """Change the memory budget in bytes and evict entries that no longer fit"""
+        with self._lock:
+            self.memory_budget = memory_budget
+            self._evict()
+
+    def invalidate(self, file_path: str = None) -> None:
+        """Drop all entries for a file, or the whole cache when no path is given"""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(file_path)
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+    def _evict(self):
+        total = sum(entry.nbytes for entry in self._entries.values())
+        while total > self.memory_budget and self._entries:
+            key, entry = self._entries.popitem(last=False)
+            total -= entry.nbytes
+            self.logger.debug(f"Evicted workbook from cache: {key[0]}")
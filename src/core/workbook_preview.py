@@ -0,0 +1,93 @@
+# src/core/workbook_preview.py
+import os
+from typing import List
+from .column_names import make_column_names
+from .workbook_cache import WorkbookCache
+from ..utils.logger import AppLogger
+
+# Rows shown by the preview dialogs
+PREVIEW_ROWS = 100
+
+class WorkbookPreview:
+    """
+    Header and first rows of a workbook's first sheet, stored column by
+    column as raw cell values (None for empty cells)
+    """
+
+    def __init__(self, file_path: str, header: List[str], columns: List[list], n_rows: int,
+                 sheet_names: List[str] = None):
+        self.file_path = file_path
+        self.header = header
+        self.columns = columns
+        self.n_rows = n_rows
+        self.sheet_names = sheet_names or []
+
+    @property
+    def n_columns(self) -> int:
+        return len(self.header)
+
+    def value(self, row: int, col: int):
+        return self.columns[col][row]
+
+    @classmethod
+    def from_rows(cls, file_path: str, rows: List[tuple], max_rows: int,
+                  sheet_names: List[str] = None) -> 'WorkbookPreview':
+        """Build a preview from raw sheet rows, the first being the header"""
+        # Trailing empty cells do not make columns, as when pandas reads the sheet
+        width = 0
+        for row in rows:
+            filled = [i for i, value in enumerate(row) if value is not None]
+            if filled:
+                width = max(width, filled[-1] + 1)
+        padded = [list(row[:width]) + [None] * (width - len(row[:width])) for row in rows]
+
+        header = make_column_names(padded[0]) if padded else []
+        body = padded[1:max_rows + 1]
+        columns = [[row[col] for row in body] for col in range(width)]
+        return cls(file_path, header, columns, len(body), sheet_names)
+
+    @classmethod
+    def from_frame(cls, file_path: str, data, max_rows: int, sheet_names: List[str] = None) -> 'WorkbookPreview':
+        """Preview of an already parsed sheet; missing values become empty cells"""
+        head = data.head(max_rows)
+        columns = [[None if value != value else value for value in head.iloc[:, col].tolist()]
+                   for col in range(head.shape[1])]
+        return cls(file_path, [str(col) for col in data.columns], columns, len(head), sheet_names)
+
+def read_preview(file_path: str, max_rows: int = PREVIEW_ROWS) -> WorkbookPreview:
+    """
+    Header and first max_rows rows of the first sheet.
+
+    A workbook already parsed in the WorkbookCache is reused. Otherwise .xlsx
+    files are read through openpyxl's read-only cursor, which stops after
+    the requested rows, so the time does not grow with the size of the
+    sheet. Other formats are read by pandas with an nrows limit.
+    """
+    cached = WorkbookCache.get_instance().peek(file_path)
+    if cached is not None:
+        return WorkbookPreview.from_frame(file_path, cached.data, max_rows, cached.sheet_names)
+
+    logger = AppLogger.get_logger()
+    if os.path.splitext(file_path)[1].lower() in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            # Ignore a stale stored <dimension> tag and read the cells that are there
+            ws.reset_dimensions()
+            rows = list(ws.iter_rows(max_row=max_rows + 1, values_only=True))
+            sheet_names = list(wb.sheetnames)
+        finally:
+            # Read-only workbooks keep the file open until closed
+            wb.close()
+        preview = WorkbookPreview.from_rows(file_path, rows, max_rows, sheet_names)
+    else:
+        import pandas as pd
+
+        with pd.ExcelFile(file_path) as xl:
+            data = xl.parse(xl.sheet_names[0], nrows=max_rows)
+            preview = WorkbookPreview.from_frame(file_path, data, max_rows, list(xl.sheet_names))
+
+    logger.debug(f"Read preview of {file_path}: {preview.n_rows} rows, {preview.n_columns} columns")
+    return preview
@@ -2,11 +2,11 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel,
                           QDialog, QTabWidget, QTextEdit, QHBoxLayout,
                           QMessageBox)
 from ...utils.logger import AppLogger
-import pandas as pd
+from ...core.schema_inference import SchemaCache
 import re
 
 class DimensionPreviewDialog(QDialog):
-   def __init__(self, dimensions_data, df, parent=None):
+   def __init__(self, dimensions_data, columns, parent=None):
        super().__init__(parent)
        self.setWindowTitle("Dimensions Preview / معاينة الأبعاد")
        self.setMinimumSize(800, 600)
@@ -17,7 +17,7 @@ class DimensionPreviewDialog(QDialog):
        tabs = QTabWidget()
        
        # Create a tab for each dimension
-       for dim_num, columns in dimensions_data.items():
+       for dim_num, col_indices in dimensions_data.items():
            tab = QWidget()
            tab_layout = QVBoxLayout()
            
@@ -27,9 +27,9 @@ class DimensionPreviewDialog(QDialog):
            
            # Add questions without the original numbering
            content = ""
-           for i, col_idx in enumerate(columns, 1):
+           for i, col_idx in enumerate(col_indices, 1):
                # Clean up the column name by removing leading numbers
-               col_name = df.columns[col_idx]
+               col_name = columns[col_idx]
                cleaned_name = re.sub(r'^\d+[\-\.\)]\s*', '', str(col_name).strip())
                content += f"{i}. {cleaned_name}\n"
            
@@ -54,7 +54,7 @@ class DimensionConfig(QWidget):
        self.logger = AppLogger.get_logger()
        self.file_path = None
        self.dimension_data = {}
-       self.df = None
+       self.schema = None
        self.setupUI()
        self.setEnabled(False)
        
@@ -73,8 +73,9 @@ class DimensionConfig(QWidget):
        self.logger.info(f"Setting file path: {file_path}")
        self.file_path = file_path
        try:
-           self.df = pd.read_excel(file_path)
-           self.logger.info(f"Successfully loaded Excel file with {len(self.df.columns)} columns")
+           # Dimensions are detected from the header alone
+           self.schema = SchemaCache.get_instance().infer(file_path)
+           self.logger.info(f"Successfully read header with {len(self.schema.columns)} columns")
            self.detect_dimensions()
        except Exception as e:
            self.logger.error(f"Error loading file: {str(e)}")
@@ -82,34 +83,11 @@ class DimensionConfig(QWidget):
 
    def detect_dimensions(self):
        try:
-           if self.df is None:
+           if self.schema is None:
                return
-
-           self.dimension_data.clear()
-           current_dimension = []
-           last_number = None
-           
-           for col_idx, col_name in enumerate(self.df.columns):
-               # Extract first number from column name
-               match = re.search(r'^\d+', str(col_name))
-               if not match:
-                   continue
-                   
-               number = int(match.group())
-               
-               if number == 1 or (last_number and number < last_number):
-                   if current_dimension:
-                       dim_number = len(self.dimension_data) + 1
-                       self.dimension_data[dim_number] = current_dimension
-                       current_dimension = []
-               
-               current_dimension.append(col_idx)
-               last_number = number
            
-           # Add final dimension
-           if current_dimension:
-               dim_number = len(self.dimension_data) + 1
-               self.dimension_data[dim_number] = current_dimension
+           # Question numbers restarting at 1 mark the start of each dimension
+           self.dimension_data = {dim: list(cols) for dim, cols in self.schema.dimensions.items()}
            
            self.preview_button.setEnabled(True)
            self.logger.info(f"Detected {len(self.dimension_data)} dimensions")
@@ -123,7 +101,7 @@ class DimensionConfig(QWidget):
            if not self.dimension_data:
                return
                
-           dialog = DimensionPreviewDialog(self.dimension_data, self.df, self)
+           dialog = DimensionPreviewDialog(self.dimension_data, self.schema.columns, self)
            dialog.exec_()
            
        except Exception as e:
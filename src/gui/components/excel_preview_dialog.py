@@ -1,14 +1,16 @@
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QPushButton, QHBoxLayout,
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTableView, 
+                             QPushButton, QHBoxLayout,
                              QLabel, QHeaderView)
 from PyQt5.QtCore import Qt
-import pandas as pd
+from ...core.workbook_preview import read_preview
+from ..utils.preview_model import PreviewTableModel
 
 class ExcelPreviewDialog(QDialog):
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
         self.file_path = file_path
         self.selected_columns = []
+        self.model = None
         self.setupUI()
         
     def setupUI(self):
@@ -26,7 +28,7 @@ class ExcelPreviewDialog(QDialog):
         layout.addWidget(instructions)
         
         # Excel preview table
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.loadExcelData()
         layout.addWidget(self.table)
         
@@ -46,26 +48,17 @@ class ExcelPreviewDialog(QDialog):
         
     def loadExcelData(self):
         try:
-            df = pd.read_excel(self.file_path)
-            
-            # Set up table
-            self.table.setRowCount(min(100, len(df)))  # Show first 100 rows
-            self.table.setColumnCount(len(df.columns))
+            # Header and first 100 rows only; cells are rendered as they are painted
+            self.model = PreviewTableModel(read_preview(self.file_path), self)
+            self.table.setModel(self.model)
             
             # Set headers
-            self.table.setHorizontalHeaderLabels(df.columns)
             header = self.table.horizontalHeader()
             header.setSectionsClickable(True)
             header.sectionClicked.connect(self.handleHeaderClick)
             
-            # Populate data
-            for row in range(min(100, len(df))):
-                for col in range(len(df.columns)):
-                    item = QTableWidgetItem(str(df.iloc[row, col]))
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-                    self.table.setItem(row, col, item)
-            
-            # Auto-adjust columns
+            # Auto-adjust columns from the visible rows
+            header.setResizeContentsPrecision(0)
             self.table.resizeColumnsToContents()
             
         except Exception as e:
@@ -87,8 +80,4 @@ class ExcelPreviewDialog(QDialog):
             header.setSectionResizeMode(column_index, QHeaderView.Fixed)
         
         # Update visual feedback
-        for col in range(self.table.columnCount()):
-            if col in self.selected_columns:
-                self.table.horizontalHeaderItem(col).setBackground(Qt.lightGray)
-            else:
-                self.table.horizontalHeaderItem(col).setBackground(Qt.white)
\ No newline at end of file
+        self.model.set_header_backgrounds(self.selected_columns, Qt.lightGray)
\ No newline at end of file
@@ -1,6 +1,9 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QProgressBar, QLabel
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QProgressBar, QLabel, QPushButton
+from PyQt5.QtCore import pyqtSignal
 
 class ProgressIndicator(QWidget):
+    cancel_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout()
@@ -10,10 +13,27 @@ class ProgressIndicator(QWidget):
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
         
+        # Cancel button, only enabled while an analysis is running
+        self.cancel_button = QPushButton("Cancel / إلغاء")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.request_cancel)
+        
+        bar_layout = QHBoxLayout()
+        bar_layout.addWidget(self.progress_bar)
+        bar_layout.addWidget(self.cancel_button)
+        
         layout.addWidget(self.status_label)
-        layout.addWidget(self.progress_bar)
+        layout.addLayout(bar_layout)
         self.setLayout(layout)
     
     def update_progress(self, value, status):
         self.progress_bar.setValue(value)
-        self.status_label.setText(status)
\ No newline at end of file
+        self.status_label.setText(status)
+    
+    def set_running(self, running):
+        self.cancel_button.setEnabled(running)
+    
+    def request_cancel(self):
+        self.cancel_button.setEnabled(False)
+        self.status_label.setText("Cancelling... / جاري الإلغاء...")
+        self.cancel_requested.emit()
@@ -3,7 +3,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel,
 from PyQt5.QtCore import Qt
 from ..dialogs.question_preview import QuestionPreviewDialog
 from ...utils.logger import AppLogger
-import pandas as pd
+from ...core.schema_inference import SchemaCache
 
 class QuestionRangeSelector(QWidget):
     def __init__(self):
@@ -11,7 +11,7 @@ class QuestionRangeSelector(QWidget):
         self.logger = AppLogger.get_logger()
         self.file_path = None
         self.selected_questions = []
-        self.df = None
+        self.schema = None
         self.setupUI()
         self.setEnabled(False)
         
@@ -66,7 +66,9 @@ class QuestionRangeSelector(QWidget):
             return
             
         try:
-            dialog = QuestionPreviewDialog(self.file_path, self)
+            # Start from the current selection, or the numbered columns of the header
+            initial_columns = self.selected_questions or (self.schema.question_columns if self.schema else [])
+            dialog = QuestionPreviewDialog(self.file_path, self, initial_columns)
             if dialog.exec_() == QuestionPreviewDialog.Accepted:
                 self.selected_questions = dialog.selected_columns
                 self.update_selection_label()
@@ -78,8 +80,10 @@ class QuestionRangeSelector(QWidget):
         self.logger.info(f"Setting file path: {file_path}")
         self.file_path = file_path
         try:
-            self.df = pd.read_excel(file_path)
-            self.logger.info(f"Successfully loaded Excel file with {len(self.df.columns)} columns")
+            # Header only; the preview dialog reads the first rows itself
+            self.schema = SchemaCache.get_instance().infer(file_path)
+            self.selected_questions = []
+            self.logger.info(f"Successfully read header with {len(self.schema.columns)} columns")
             self.show_config()
         except Exception as e:
             self.logger.error(f"Error loading file: {str(e)}")
@@ -89,7 +93,7 @@ class QuestionRangeSelector(QWidget):
         try:
             if self.selected_questions:
                 count = len(self.selected_questions)
-                selected_cols = [self.df.columns[i] for i in self.selected_questions]
+                selected_cols = [self.schema.columns[i] for i in self.selected_questions]
                 cleaned_cols = [self.clean_question_text(col) for col in selected_cols]
                 
                 self.selection_label.setText(
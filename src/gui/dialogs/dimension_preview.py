@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTableWidget,
                              QTableWidgetItem, QPushButton, QHBoxLayout,
                              QLabel, QHeaderView, QSpinBox)
 from PyQt5.QtCore import Qt
-import pandas as pd
+from ...core.workbook_cache import WorkbookCache
 
 class DimensionPreviewDialog(QDialog):
     def __init__(self, file_path, dimension_number=None, parent=None):
@@ -49,7 +49,7 @@ class DimensionPreviewDialog(QDialog):
     
     def loadExcelData(self):
         try:
-            self.df = pd.read_excel(self.file_path)
+            self.df = WorkbookCache.get_instance().load(self.file_path).data
             
             self.table.setRowCount(min(100, len(self.df)))
             self.table.setColumnCount(len(self.df.columns))
@@ -1,22 +1,28 @@
 # src/gui/dialogs/question_preview.py
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTableWidget, 
-                           QTableWidgetItem, QPushButton, QHBoxLayout,
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTableView, 
+                           QPushButton, QHBoxLayout,
                            QLabel, QHeaderView, QMessageBox)
 from PyQt5.QtCore import Qt
 from ...utils.logger import AppLogger
-import pandas as pd
+from ...core.workbook_preview import read_preview
+from ..utils.preview_model import PreviewTableModel
 
 class QuestionPreviewDialog(QDialog):
-    def __init__(self, file_path, parent=None):
+    def __init__(self, file_path, parent=None, initial_columns=None):
         super().__init__(parent)
         self.logger = AppLogger.get_logger()
         self.file_path = file_path
         self.selected_columns = []
-        self.df = None
+        self.preview = None
+        self.model = None
         self.range_start = None
         self.range_complete = False
         self.setupUI()
         
+        # Preselect a suggested range, e.g. the numbered question columns
+        if initial_columns and self.model is not None:
+            self.selectRange(initial_columns[0], initial_columns[-1])
+        
     def setupUI(self):
         self.setWindowTitle("Select Questions / اختيار الأسئلة")
         self.setMinimumSize(800, 600)
@@ -37,7 +43,7 @@ class QuestionPreviewDialog(QDialog):
         layout.addWidget(self.selection_status)
         
         # Excel preview table
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.loadExcelData()
         layout.addWidget(self.table)
         
@@ -61,25 +67,20 @@ class QuestionPreviewDialog(QDialog):
     def loadExcelData(self):
         try:
             self.logger.info(f"Loading Excel file: {self.file_path}")
-            self.df = pd.read_excel(self.file_path)
-            self.logger.debug(f"Excel file loaded with {len(self.df.columns)} columns")
+            # Only the header and the first rows are read
+            self.preview = read_preview(self.file_path)
+            self.logger.debug(f"Excel preview loaded with {self.preview.n_columns} columns")
             
-            self.table.setRowCount(min(100, len(self.df)))
-            self.table.setColumnCount(len(self.df.columns))
+            self.model = PreviewTableModel(self.preview, self)
+            self.table.setModel(self.model)
             
             # Set headers
-            self.table.setHorizontalHeaderLabels(self.df.columns)
             header = self.table.horizontalHeader()
             header.setSectionsClickable(True)
             header.sectionClicked.connect(self.handleHeaderClick)
             
-            # Populate data
-            for row in range(min(100, len(self.df))):
-                for col in range(len(self.df.columns)):
-                    item = QTableWidgetItem(str(self.df.iloc[row, col]))
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    self.table.setItem(row, col, item)
-            
+            # Size columns from the visible rows only
+            header.setResizeContentsPrecision(0)
             self.table.resizeColumnsToContents()
             self.logger.info("Excel data loaded successfully into table")
             
@@ -100,7 +101,7 @@ class QuestionPreviewDialog(QDialog):
             if self.range_start is None:
                 # First click
                 self.range_start = column_index
-                self.table.horizontalHeaderItem(column_index).setBackground(Qt.yellow)
+                self.model.set_header_backgrounds([column_index], Qt.yellow)
                 self.selection_status.setText("Now click last column / الآن انقر على العمود الأخير")
                 self.logger.info(f"First column selected: {column_index}")
                 return
@@ -110,32 +111,31 @@ class QuestionPreviewDialog(QDialog):
                 return
 
             # Second click
-            range_end = column_index
-            start = min(self.range_start, range_end)
-            end = max(self.range_start, range_end)
-            
-            self.logger.info(f"Range selected: {start} -> {end}")
-            
-            # Create the range
-            self.selected_columns = list(range(start, end + 1))
-            self.logger.info(f"Selected columns: {self.selected_columns}")
-            
-            # Update display
-            for col in range(self.table.columnCount()):
-                if col >= start and col <= end:
-                    self.table.horizontalHeaderItem(col).setBackground(Qt.lightGray)
-                else:
-                    self.table.horizontalHeaderItem(col).setBackground(Qt.white)
-            
-            count = len(self.selected_columns)
-            self.selection_status.setText(f"Selected {count} columns / تم اختيار {count} عمود")
-            self.range_complete = True
-            self.logger.info(f"Selection complete - {count} columns selected")
+            self.selectRange(self.range_start, column_index)
             
         except Exception as e:
             self.logger.error(f"Error in header click: {str(e)}")
             self.clearSelection()
 
+    def selectRange(self, first, last):
+        start = min(first, last)
+        end = max(first, last)
+        
+        self.logger.info(f"Range selected: {start} -> {end}")
+        
+        # Create the range
+        self.range_start = start
+        self.selected_columns = list(range(start, end + 1))
+        self.logger.info(f"Selected columns: {self.selected_columns}")
+        
+        # Update display
+        self.model.set_header_backgrounds(self.selected_columns, Qt.lightGray)
+        
+        count = len(self.selected_columns)
+        self.selection_status.setText(f"Selected {count} columns / تم اختيار {count} عمود")
+        self.range_complete = True
+        self.logger.info(f"Selection complete - {count} columns selected")
+
     def clearSelection(self):
         try:
             self.logger.info("Clearing selection...")
@@ -146,8 +146,8 @@ class QuestionPreviewDialog(QDialog):
             self.selected_columns = []
             
             # Reset all column backgrounds
-            for col in range(self.table.columnCount()):
-                self.table.horizontalHeaderItem(col).setBackground(Qt.white)
+            if self.model is not None:
+                self.model.set_header_backgrounds([], Qt.white)
             
             self.selection_status.setText("Click first column / انقر على العمود الأول")
             self.logger.info("Selection cleared successfully")
@@ -7,15 +7,19 @@ from src.gui.components.question_range_selector import QuestionRangeSelector
 from src.gui.components.dimension_config import DimensionConfig
 from src.gui.components.data_cleaner import DataCleaner
 from src.gui.components.progress_indicator import ProgressIndicator
-from src.core.analyzer import StatisticalAnalyzer
+from src.gui.utils.analysis_worker import AnalysisWorker
 import sys
 
 class MainLayout(QWidget):
     file_selected = pyqtSignal(str)
 
-    def __init__(self):
+    def __init__(self, profile=False, trace_memory=False):
         super().__init__()
         self.selected_file = None
+        self.worker = None
+        # Profiling switches passed on to every analysis run
+        self.profile = profile
+        self.trace_memory = trace_memory
         self.setupUI()
         
     def setupUI(self):
@@ -33,6 +37,7 @@ class MainLayout(QWidget):
         self.analyze_button.setEnabled(False)
         
         self.file_selector.file_selected.connect(self.handle_file_selection)
+        self.progress.cancel_requested.connect(self.cancel_analysis)
         
         layout.addWidget(self.file_selector)
         layout.addWidget(self.question_selector)
@@ -63,32 +68,54 @@ class MainLayout(QWidget):
             if not hasattr(self.dimension_config, 'dimension_data') or not self.dimension_config.dimension_data:
                 raise ValueError("No dimensions configured")
             
-            self.progress.update_progress(10, "Starting analysis...")
+            self.progress.update_progress(0, "Starting analysis...")
             
-            # Pass original dimension data directly
-            analyzer = StatisticalAnalyzer(
+            # Run the analysis on a worker thread so the window stays responsive
+            self.worker = AnalysisWorker(
                 self.selected_file,
                 self.question_selector.selected_questions,
-                self.dimension_config.dimension_data
-            )
-            
-            self.progress.update_progress(30, "Running statistical analysis...")
-            
-            # Run analysis and get output file
-            output_file = analyzer.analyze_and_export()
-            
-            self.progress.update_progress(100, "Analysis complete!")
-            
-            QMessageBox.information(
+                self.dimension_config.dimension_data,
                 self,
-                "Analysis Complete / اكتمل التحليل",
-                f"Results saved to:\n{output_file}"
+                profile=self.profile,
+                trace_memory=self.trace_memory
             )
+            self.worker.progress_changed.connect(self.progress.update_progress)
+            self.worker.analysis_finished.connect(self.handle_analysis_finished)
+            self.worker.analysis_failed.connect(self.handle_analysis_failed)
+            self.worker.analysis_cancelled.connect(self.handle_analysis_cancelled)
+            self.worker.finished.connect(self.handle_worker_stopped)
+            
+            self.analyze_button.setEnabled(False)
+            self.progress.set_running(True)
+            self.worker.start()
             
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error / خطأ",
-                str(e)
-            )
-            self.progress.update_progress(0, "Analysis failed")
\ No newline at end of file
+            self.handle_analysis_failed(str(e))
+    
+    def cancel_analysis(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+    
+    def handle_analysis_finished(self, output_file):
+        self.progress.update_progress(100, "Analysis complete!")
+        QMessageBox.information(
+            self,
+            "Analysis Complete / اكتمل التحليل",
+            f"Results saved to:\n{output_file}"
+        )
+    
+    def handle_analysis_failed(self, message):
+        QMessageBox.critical(
+            self,
+            "Error / خطأ",
+            message
+        )
+        self.progress.update_progress(0, "Analysis failed")
+    
+    def handle_analysis_cancelled(self):
+        self.progress.update_progress(0, "Analysis cancelled / تم إلغاء التحليل")
+    
+    def handle_worker_stopped(self):
+        self.progress.set_running(False)
+        self.analyze_button.setEnabled(self.selected_file is not None)
+        self.worker = None
@@ -1,21 +1,37 @@
+import argparse
 import sys
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QMainWindow
 from .layouts.main_layout import MainLayout
+from .utils.warmup import WarmupThread
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, profile=False, trace_memory=False):
         super().__init__()
         self.setWindowTitle("Excel AutoRanker 📊")
         self.setMinimumSize(800, 600)
         
         # Set main layout
-        main_widget = MainLayout()
+        main_widget = MainLayout(profile, trace_memory)
         self.setCentralWidget(main_widget)
 
+def parse_options(argv):
+    """Profiling switches; other arguments are left to Qt"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--profile', action='store_true', help="Profile analysis runs with cProfile")
+    parser.add_argument('--trace-memory', action='store_true', help="Record peak allocations per stage")
+    return parser.parse_known_args(argv)
+
 def run_app():
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    options, qt_args = parse_options(sys.argv[1:])
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = MainWindow(options.profile, options.trace_memory)
     window.show()
+    
+    # Only PyQt5 is needed to paint the window; load the analysis stack once it is up
+    warmup = WarmupThread(window)
+    QTimer.singleShot(0, warmup.start)
+    app.aboutToQuit.connect(warmup.wait)
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
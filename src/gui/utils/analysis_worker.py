@@ -0,0 +1,73 @@
+# src/gui/utils/analysis_worker.py
+import os
+from PyQt5.QtCore import QThread, pyqtSignal
+from ...core.progress import AnalysisCancelled, ProgressReporter
+from ...core.result_cache import ResultCache
+from ...utils.logger import AppLogger
+from ...utils.profiling import RunProfiler
+
+class AnalysisWorker(QThread):
+    """Runs StatisticalAnalyzer off the UI thread and reports stage progress through signals"""
+    progress_changed = pyqtSignal(int, str)
+    analysis_finished = pyqtSignal(str)
+    analysis_failed = pyqtSignal(str)
+    analysis_cancelled = pyqtSignal()
+
+    REPORTS_DIR = 'reports'
+
+    def __init__(self, file_path, selected_questions, dimension_data, parent=None,
+                 profile=False, trace_memory=False):
+        super().__init__(parent)
+        self.logger = AppLogger.get_logger()
+        self.file_path = file_path
+        self.selected_questions = selected_questions
+        self.dimension_data = dimension_data
+        # Called on the worker thread; the signal is queued to the UI thread
+        self.progress = ProgressReporter(self.progress_changed.emit)
+        # Stage timings are always recorded; cProfile and tracemalloc only on request
+        self.profiler = RunProfiler(cprofile=profile, trace_memory=trace_memory)
+
+    def cancel(self):
+        """Request cancellation; the run stops at its next stage or row-chunk checkpoint"""
+        self.logger.info("Cancellation requested")
+        self.progress.cancel()
+
+    def run(self):
+        try:
+            from ...core.analyzer import StatisticalAnalyzer
+            
+            # Started here so cProfile follows this thread rather than the UI thread
+            with self.profiler:
+                analyzer = StatisticalAnalyzer(
+                    self.file_path,
+                    self.selected_questions,
+                    self.dimension_data,
+                    progress=self.progress,
+                    result_cache=ResultCache(),
+                    profiler=self.profiler,
+                    # Threads only: forking a process that runs Qt is not safe
+                    workers=os.cpu_count() or 1,
+                    processes=False
+                )
+                output_file = analyzer.analyze_and_export()
+            self.write_report(output_file, analyzer.n_rows)
+            self.analysis_finished.emit(output_file)
+            
+        except AnalysisCancelled:
+            self.analysis_cancelled.emit()
+        except Exception as e:
+            self.logger.error(f"Analysis worker failed: {str(e)}")
+            self.analysis_failed.emit(str(e))
+
+    def write_report(self, output_file, n_rows):
+        """Save the run report, and any profiles, in a reports folder next to the output"""
+        prefix = os.path.join(os.path.dirname(output_file), self.REPORTS_DIR,
+                              os.path.splitext(os.path.basename(output_file))[0])
+        try:
+            report = self.profiler.write_report(f"{prefix}_run_report.json", input=self.file_path,
+                                                output=output_file, rows=n_rows)
+            self.logger.info(f"Run report written to {report}")
+            for path in self.profiler.dump_profiles(prefix):
+                self.logger.info(f"Profile written to {path}")
+        except OSError as e:
+            self.logger.warning(f"Could not write run report: {str(e)}")
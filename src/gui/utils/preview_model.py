@@ -0,0 +1,57 @@
+# src/gui/utils/preview_model.py
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush
+
+def format_cell(value) -> str:
+    """Display text of a raw cell value; empty cells stay blank"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+class PreviewTableModel(QAbstractTableModel):
+    """
+    Read-only table over a WorkbookPreview.
+
+    The view asks only for the cells it paints, and their text is produced
+    at that point, so no per-cell items are created up front. Header
+    backgrounds mark selected columns.
+    """
+
+    def __init__(self, preview, parent=None):
+        super().__init__(parent)
+        self.preview = preview
+        self._header_backgrounds = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.preview.n_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.preview.n_columns
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return format_cell(self.preview.value(index.row(), index.column()))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self.preview.header[section]
+            if role == Qt.BackgroundRole and section in self._header_backgrounds:
+                return QBrush(self._header_backgrounds[section])
+        elif role == Qt.DisplayRole:
+            return str(section + 1)
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_header_backgrounds(self, columns, color) -> None:
+        """Color the headers of the given columns and reset all others"""
+        self._header_backgrounds = {col: color for col in columns}
+        if self.preview.n_columns:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, self.preview.n_columns - 1)
@@ -1,6 +1,6 @@
 import os
-import pandas as pd
 from ..dialogs.error_dialog import ErrorDialog
+from ...core.schema_inference import SchemaCache
 
 def validate_excel_file(file_path):
     """
@@ -11,11 +11,11 @@ def validate_excel_file(file_path):
         return False
         
     try:
-        # Try to read the Excel file
-        df = pd.read_excel(file_path)
+        # Read the header and a few rows only; the schema is reused by later consumers
+        schema = SchemaCache.get_instance().infer(file_path)
         
         # Check if file has any data
-        if df.empty:
+        if not schema.has_data:
             ErrorDialog.show_error("File Error", "Selected Excel file is empty.")
             return False
             
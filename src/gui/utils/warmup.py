@@ -0,0 +1,31 @@
+# src/gui/utils/warmup.py
+from PyQt5.QtCore import QThread
+from ...core.workbook_cache import WorkbookCache
+from ...utils.logger import AppLogger
+
+class WarmupThread(QThread):
+    """
+    Imports the numerical and Excel modules in the background once the
+    window is on screen, so the first file selection or analysis does not
+    pay for them. Until it finishes, the first user of a module imports it
+    itself; Python's import lock keeps the two from loading it twice.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = AppLogger.get_logger()
+
+    def run(self):
+        try:
+            from ...core.analyzer import StatisticalAnalyzer  # noqa: F401  (pandas, openpyxl, calculators)
+            from ...core.formatters import writers  # noqa: F401  (xlsxwriter)
+            from ...core.sidecar_cache import SidecarCache
+
+            # Files reopened during a review session skip the Excel parser
+            cache = WorkbookCache.get_instance()
+            if cache.sidecar is None:
+                cache.set_sidecar_cache(SidecarCache())
+            self.logger.debug("Analysis modules loaded")
+        except Exception as e:
+            # Not fatal: the modules are imported again, and any error reported, on first use
+            self.logger.warning(f"Background import failed: {str(e)}")
@@ -1,37 +1,72 @@
 # src/utils/logger.py
+import atexit
 import logging
+import multiprocessing
 import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+class _ConsoleFilter(logging.Filter):
+    """Component loggers only reach the console with warnings and errors"""
+
+    def filter(self, record):
+        return record.name == AppLogger.LOGGER_NAME or record.levelno >= logging.WARNING
+
+class _NullQueue:
+    """Queue stand-in that drops records, for processes with nowhere to send them"""
+
+    def put_nowait(self, record):
+        pass
 
 class AppLogger:
+    """
+    Application-wide logging.
+
+    Every component logs through 'ExcelAutoRanker' or one of its children
+    (get_logger('cronbach_alpha') -> 'ExcelAutoRanker.cronbach_alpha'). The
+    logger only puts records on a queue; a single listener thread formats
+    them and writes them to the console and to logs/app.log, which is
+    rotated by size. Callers never wait on file I/O, and however many
+    components are created, each record is written once.
+
+    Pool worker processes do not open the log file themselves: their pools
+    are created with attach_worker as (part of) the initializer, and the
+    workers put their records on worker_queue(), which the parent's
+    listener writes out with its own. Any other forked child drops its
+    records until it is attached, so only the parent ever writes the file.
+    """
     _instance = None
-    
+    LOGGER_NAME = 'ExcelAutoRanker'
+    LOG_DIR = 'logs'
+    LOG_FILE = 'app.log'
+    MAX_BYTES = 10 * 1024 * 1024
+    BACKUP_COUNT = 5
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(AppLogger, cls).__new__(cls)
             cls._instance._initialize_logger()
         return cls._instance
-    
+
     def _initialize_logger(self):
         # Create logs directory if it doesn't exist
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
+        os.makedirs(self.LOG_DIR, exist_ok=True)
+        
         # Set up logging configuration
-        self.logger = logging.getLogger('ExcelAutoRanker')
+        self.logger = logging.getLogger(self.LOGGER_NAME)
         self.logger.setLevel(logging.DEBUG)
         
-        # Create a unique log file for each session
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = f'logs/app_{timestamp}.log'
-        
-        # File handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # File handler, rotated by size instead of one new file per session
+        file_handler = RotatingFileHandler(
+            os.path.join(self.LOG_DIR, self.LOG_FILE),
+            maxBytes=self.MAX_BYTES, backupCount=self.BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
+        console_handler.addFilter(_ConsoleFilter())
         
         # Create formatters and add them to the handlers
         file_formatter = logging.Formatter(
@@ -43,20 +78,104 @@ class AppLogger:
         
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
+        self.handlers = (file_handler, console_handler)
         
-        # Add the handlers to the logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-    
+        # Records are queued by the caller and written by the listener thread
+        self.queue_handler = QueueHandler(queue.Queue())
+        self.logger.addHandler(self.queue_handler)
+        self.process_queue = None
+        self.process_listener = None
+        self._running = []
+        self._start_listener()
+        atexit.register(self.shutdown)
+        if hasattr(os, 'register_at_fork'):
+            # A forked worker process inherits the logger but not the listener thread
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _start_listener(self):
+        self.queue_handler.queue = queue.Queue()
+        self.listener = QueueListener(self.queue_handler.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self._running.append(self.listener)
+
+    def _stop_listeners(self):
+        for listener in self._running:
+            listener.stop()
+        self._running = []
+
+    def _after_fork(self):
+        # The child inherits the listener objects but none of their threads
+        self._running = []
+        if self.process_queue is not None:
+            # Send the child's records to the parent rather than to a second writer of the file
+            self._attach(self.process_queue)
+        else:
+            # No queue to the parent exists yet; drop records until attach_worker
+            self._attach(_NullQueue())
+            self.process_queue = None
+
+    def _attach(self, log_queue):
+        self.process_queue = log_queue
+        self.process_listener = None
+        self.listener = None
+        self.handlers = ()
+        self.queue_handler.queue = log_queue
+
+    def shutdown(self):
+        """Write out queued records; called automatically at exit"""
+        self._stop_listeners()
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream may already be closed at exit, as logging.shutdown allows
+                pass
+
+    @classmethod
+    def worker_queue(cls):
+        """Queue for the records of pool worker processes, written out by this process"""
+        instance = cls._instance or cls()
+        if instance.process_queue is None:
+            instance.process_queue = multiprocessing.Queue()
+            instance.process_listener = QueueListener(instance.process_queue, *instance.handlers,
+                                                      respect_handler_level=True)
+            instance.process_listener.start()
+            instance._running.append(instance.process_listener)
+        return instance.process_queue
+
+    @classmethod
+    def attach_worker(cls, log_queue) -> None:
+        """Pool initializer: log this worker process through the parent's worker_queue()"""
+        if cls._instance is None:
+            # A spawned worker starts without a logger; build one that only queues
+            instance = super(AppLogger, cls).__new__(cls)
+            instance.logger = logging.getLogger(cls.LOGGER_NAME)
+            instance.logger.setLevel(logging.DEBUG)
+            instance.queue_handler = QueueHandler(log_queue)
+            instance.logger.addHandler(instance.queue_handler)
+            instance._running = []
+            cls._instance = instance
+        else:
+            cls._instance._stop_listeners()
+        cls._instance._attach(log_queue)
+
     @classmethod
-    def get_logger(cls):
+    def get_logger(cls, name: str = None):
+        """The application logger, or its child for one component"""
         if cls._instance is None:
             cls()
-        return cls._instance.logger
+        if name is None:
+            return cls._instance.logger
+        return cls._instance.logger.getChild(name)
 
 # Usage example:
 # logger = AppLogger.get_logger()
 # logger.debug("Debug message")
 # logger.info("Info message")
 # logger.warning("Warning message")
-# logger.error("Error message")
\ No newline at end of file
+# logger.error("Error message")
+#
+# Component loggers:
+# logger = AppLogger.get_logger('cronbach_alpha')
+# if logger.isEnabledFor(logging.DEBUG):
+#     logger.debug(f"Item variances: {variances}")
@@ -0,0 +1,191 @@
+# src/utils/profiling.py
+import io
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; spans then carry no resident memory figure
+    resource = None
+
+_MB = 1024 * 1024
+
+def max_rss_mb() -> Optional[float]:
+    """Resident memory high-water mark of this process so far"""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+@dataclass
+class Span:
+    """One timed stage; rows and items are filled in by the code being timed"""
+    __slots__ = ('name', 'parent', 'start', 'seconds', 'rows', 'items', 'peak_bytes', 'max_rss_mb')
+    name: str
+    parent: Optional[str]
+    start: float
+    seconds: Optional[float]
+    rows: Optional[int]
+    items: Optional[int]
+    peak_bytes: Optional[int]
+    max_rss_mb: Optional[float]
+
+    def as_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'parent': self.parent,
+            'start': round(self.start, 6),
+            'seconds': round(self.seconds, 6),
+            'rows': self.rows,
+            'items': self.items,
+            'peak_traced_mb': None if self.peak_bytes is None else round(self.peak_bytes / _MB, 3),
+            'max_rss_mb': self.max_rss_mb
+        }
+
+class RunProfiler:
+    """
+    Stage timings of one analysis run.
+
+    Code wraps each stage in span(), which records wall time, the rows and
+    items processed and the process memory high-water mark. Spans nest, so
+    a stage's sub-steps are listed with it as parent. With trace_memory the
+    peak Python and NumPy allocation of every span is recorded through
+    tracemalloc; with cprofile the run is profiled by cProfile. Both slow
+    the run down and are off by default. Start and stop the optional
+    profilers around the run, from the thread that runs it, with
+    `with profiler:`.
+    """
+
+    def __init__(self, cprofile: bool = False, trace_memory: bool = False):
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._profile = None
+        self._memory_snapshot = None
+        self._tracing = False
+
+    def __enter__(self) -> 'RunProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._origin = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self.cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        if self._tracing:
+            self._memory_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self._tracing = False
+
+    def _stack(self) -> List[Span]:
+        # Spans nest per thread, so stages run on worker threads get their own parents
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, rows: int = None, items: int = None, parent: str = None):
+        """
+        Time the enclosed block; the yielded Span's rows and items can be set
+        inside it. parent names the enclosing stage of a span opened on a
+        worker thread, where the stage's own span is not on the stack.
+        """
+        stack = self._stack()
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Hand the peak reached so far to the enclosing span before restarting the count
+            if stack:
+                stack[-1].peak_bytes = max(stack[-1].peak_bytes or 0, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        span = Span(name, stack[-1].name if stack else parent, time.perf_counter() - self._origin,
+                    None, rows, items, 0 if tracing else None, None)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+            span.seconds = time.perf_counter() - self._origin - span.start
+            span.max_rss_mb = max_rss_mb()
+            if tracing and tracemalloc.is_tracing():
+                span.peak_bytes = max(span.peak_bytes, tracemalloc.get_traced_memory()[1])
+                if stack:
+                    stack[-1].peak_bytes = max(stack[-1].peak_bytes or 0, span.peak_bytes)
+            with self._lock:
+                self.spans.append(span)
+
+    def record(self, name: str, started: float, seconds: float, rows: int = None, items: int = None,
+               parent: str = None) -> None:
+        """
+        Add a span timed elsewhere, e.g. in a worker process; started is its
+        time.perf_counter() value, which processes on one machine share
+        """
+        span = Span(name, parent, started - self._origin, seconds, rows, items, None, None)
+        with self._lock:
+            self.spans.append(span)
+
+    def report(self, **details) -> Dict:
+        """Machine-readable summary of the run; details (input, output, ...) are included as given"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        top_level = [s for s in spans if s.parent is None]
+        return dict(details, **{
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'total_seconds': round(sum(s.seconds for s in top_level), 6),
+            'max_rss_mb': max_rss_mb(),
+            'profiling': {'cprofile': self.cprofile, 'tracemalloc': self.trace_memory},
+            'spans': [s.as_dict() for s in spans]
+        })
+
+    def write_report(self, path: str, **details) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(**details), f, ensure_ascii=False, indent=2)
+        return path
+
+    def dump_profiles(self, prefix: str, limit: int = 40) -> List[str]:
+        """
+        Write the collected profiles next to prefix: <prefix>.prof (load it
+        with pstats or snakeviz) and a text summary of the slowest calls, and
+        <prefix>.memory.txt with the lines holding the most memory at the end
+        of the run. Returns the files written.
+        """
+        written = []
+        os.makedirs(os.path.dirname(os.path.abspath(prefix)), exist_ok=True)
+        if self._profile is not None:
+            import pstats
+            self._profile.dump_stats(f"{prefix}.prof")
+            summary = io.StringIO()
+            pstats.Stats(self._profile, stream=summary).sort_stats('cumulative').print_stats(limit)
+            with open(f"{prefix}.prof.txt", 'w', encoding='utf-8') as f:
+                f.write(summary.getvalue())
+            written += [f"{prefix}.prof", f"{prefix}.prof.txt"]
+        if self._memory_snapshot is not None:
+            with open(f"{prefix}.memory.txt", 'w', encoding='utf-8') as f:
+                for stat in self._memory_snapshot.statistics('lineno')[:limit]:
+                    f.write(f"{stat}\n")
+            written.append(f"{prefix}.memory.txt")
+        return written
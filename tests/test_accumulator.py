@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.statistics.accumulator import ResponseAccumulator
+from src.core.statistics.cronbach_alpha import CronbachAlphaCalculator
+from src.core.statistics.split_half import SplitHalfCalculator
+
+QUESTIONS = ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+@pytest.fixture
+def responses():
+    """Likert answers with a few incomplete rows"""
+    rng = np.random.default_rng(5)
+    trait = rng.normal(size=120)
+    values = np.clip(np.rint(3 + trait[:, None] + rng.normal(scale=0.8, size=(120, 5))), 1, 5)
+    values[[4, 37, 90], [0, 2, 4]] = np.nan
+    return pd.DataFrame(values, columns=QUESTIONS)
+
+def complete_covariance(data):
+    return np.cov(data.dropna().to_numpy(), rowvar=False, ddof=1)
+
+def test_chunked_updates_equal_single_pass(responses):
+    accumulator = ResponseAccumulator(QUESTIONS)
+    for start in range(0, len(responses), 17):
+        accumulator.update(responses.to_numpy()[start:start + 17])
+
+    assert accumulator.n == len(responses.dropna())
+    np.testing.assert_allclose(accumulator.covariance(), complete_covariance(responses))
+
+def test_merged_accumulators_equal_single_pass(responses):
+    values = responses.to_numpy()
+    parts = [ResponseAccumulator(QUESTIONS).update(chunk) for chunk in np.array_split(values, 4)]
+    merged = ResponseAccumulator(QUESTIONS)
+    for part in reversed(parts):
+        merged.merge(part)
+
+    np.testing.assert_allclose(merged.covariance(), complete_covariance(responses))
+    np.testing.assert_allclose(merged.covariance(["Q4", "Q1"]),
+                               np.cov(responses.dropna()[["Q4", "Q1"]].to_numpy(), rowvar=False))
+
+def test_merge_rejects_other_questions():
+    with pytest.raises(ValueError):
+        ResponseAccumulator(QUESTIONS).merge(ResponseAccumulator(QUESTIONS[:3]))
+
+def test_saved_accumulator_keeps_accumulating(responses, tmp_path):
+    values = responses.to_numpy()
+    path = tmp_path / "accumulator.npz"
+    ResponseAccumulator(QUESTIONS).update(values[:70]).save(str(path))
+
+    accumulator = ResponseAccumulator.load(str(path)).update(values[70:])
+
+    assert accumulator.questions == QUESTIONS
+    np.testing.assert_allclose(accumulator.covariance(), complete_covariance(responses))
+
+def test_calculators_match_dataframe_path(responses):
+    accumulator = ResponseAccumulator(QUESTIONS).update(responses.to_numpy())
+
+    alpha = CronbachAlphaCalculator().calculate(accumulator, QUESTIONS)
+    assert alpha.alpha == pytest.approx(CronbachAlphaCalculator().calculate(responses, QUESTIONS).alpha)
+
+    split_half = SplitHalfCalculator().calculate(accumulator, QUESTIONS)
+    expected = SplitHalfCalculator().calculate(responses, QUESTIONS)
+    assert split_half.pearson_correlation == pytest.approx(expected.pearson_correlation)
+    assert split_half.spearman_brown == pytest.approx(expected.spearman_brown)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from src.core.statistics.bootstrap import (BootstrapEstimator, alpha_replicates, resample_weights,
+                                           split_half_replicates)
+
+@pytest.fixture
+def values():
+    """Complete-case Likert answers"""
+    rng = np.random.default_rng(9)
+    trait = rng.normal(size=60)
+    return np.clip(np.rint(3 + trait[:, None] + rng.normal(scale=0.9, size=(60, 5))), 1, 5)
+
+def resampled_rows(values, seed, n_replicates):
+    """The explicit resamples behind resample_weights for the same generator"""
+    indices = np.random.default_rng(seed).integers(0, len(values), size=(n_replicates, len(values)))
+    return [values[idx] for idx in indices]
+
+def alpha_of(sample):
+    k = sample.shape[1]
+    return (k / (k - 1)) * (1 - sample.var(axis=0, ddof=1).sum() / sample.sum(axis=1).var(ddof=1))
+
+def spearman_brown_of(sample):
+    r = np.corrcoef(sample[:, 0::2].sum(axis=1), sample[:, 1::2].sum(axis=1))[0, 1]
+    return 2 * r / (1 + r)
+
+def test_replicates_match_explicit_resamples(values):
+    weights = resample_weights(np.random.default_rng(4), len(values), 5)
+    samples = resampled_rows(values, 4, 5)
+
+    np.testing.assert_allclose(alpha_replicates(weights, values), [alpha_of(s) for s in samples])
+    np.testing.assert_allclose(split_half_replicates(weights, values), [spearman_brown_of(s) for s in samples])
+
+@pytest.mark.parametrize("statistic", ["alpha", "split_half"])
+def test_intervals_do_not_depend_on_worker_count(values, statistic):
+    # 600 replicates of 60 rows make three blocks
+    single = BootstrapEstimator(600, seed=12, workers=1).interval(statistic, values)
+    pooled = BootstrapEstimator(600, seed=12, workers=3).interval(statistic, values)
+
+    assert single == pooled
+    assert single.n_replicates == 600
+    assert single.lower < single.upper
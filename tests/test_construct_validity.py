@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import spearmanr
+from src.core.statistics.construct_validity import ConstructValidityCalculator
+from src.core.statistics.kernels import item_rest_spearman
+
+QUESTIONS = ["Q1", "Q2", "Q3", "Q4", "Q5", "Q6"]
+DIMENSIONS = {"1": QUESTIONS[:3], "2": QUESTIONS[3:]}
+
+@pytest.fixture
+def responses():
+    """Tied Likert answers with missing cells in both dimensions"""
+    rng = np.random.default_rng(11)
+    trait = rng.normal(size=80)
+    values = np.clip(np.rint(3 + trait[:, None] + rng.normal(scale=0.9, size=(80, 6))), 1, 5)
+    data = pd.DataFrame(values, columns=QUESTIONS)
+    data.iloc[[1, 22, 50], 1] = np.nan
+    data.iloc[[8, 63], 4] = np.nan
+    return data
+
+def pairwise_item_rest(items):
+    """Item-rest correlations one pair at a time"""
+    total = items.sum(axis=1)
+    return np.array([spearmanr(items[:, i], total - items[:, i])[0] for i in range(items.shape[1])])
+
+@pytest.mark.parametrize("chunk_elements", [1, 100, 8_000_000])
+def test_item_rest_spearman_matches_spearmanr(responses, chunk_elements):
+    items = responses.dropna().to_numpy()
+    np.testing.assert_allclose(item_rest_spearman(items, chunk_elements), pairwise_item_rest(items))
+
+def test_constant_item_has_undefined_correlation():
+    items = np.array([[3, 1, 2], [3, 2, 2], [3, 4, 5], [3, 5, 4]], dtype=float)
+    correlations = item_rest_spearman(items)
+
+    assert np.isnan(correlations[0])
+    total = items.sum(axis=1)
+    expected = [spearmanr(items[:, i], total - items[:, i])[0] for i in (1, 2)]
+    np.testing.assert_allclose(correlations[1:], expected)
+
+def test_item_rest_uses_complete_cases(responses):
+    result = ConstructValidityCalculator().calculate_item_rest(responses, QUESTIONS, DIMENSIONS)
+    complete = responses.dropna()
+
+    assert result["status"] == "success"
+    for dim_num, dim_questions in DIMENSIONS.items():
+        expected = pairwise_item_rest(complete[dim_questions].to_numpy())
+        np.testing.assert_allclose([result["correlations"][dim_num][q] for q in dim_questions], expected)
+
+def test_dimension_total_correlations_match_spearmanr(responses):
+    result = ConstructValidityCalculator().calculate(responses, QUESTIONS, DIMENSIONS)
+    complete = responses.dropna()
+    total = complete.sum(axis=1)
+
+    expected = [spearmanr(complete[cols].sum(axis=1), total)[0] for cols in DIMENSIONS.values()]
+    np.testing.assert_allclose(result.correlations, expected)
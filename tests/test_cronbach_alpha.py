@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.statistics.cronbach_alpha import CronbachAlphaCalculator
+from src.core.statistics.kernels import item_deletion_statistics
+from src.core.statistics_manager import StatisticsManager
+
+QUESTIONS = ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+@pytest.fixture
+def responses():
+    """Likert answers with missing cells spread over several items"""
+    rng = np.random.default_rng(7)
+    trait = rng.normal(size=60)
+    values = np.clip(np.rint(3 + trait[:, None] + rng.normal(scale=0.8, size=(60, 5))), 1, 5)
+    data = pd.DataFrame(values, columns=QUESTIONS)
+    data.iloc[[2, 9, 31], 0] = np.nan
+    data.iloc[[5, 40], 3] = np.nan
+    data.iloc[17, 4] = np.nan
+    return data
+
+def loop_alpha(data, questions):
+    """Alpha as the baseline computed it: drop incomplete rows of the given items, then variances"""
+    clean = data[questions].dropna()
+    k = len(questions)
+    return (k / (k - 1)) * (1 - clean.var().sum() / clean.sum(axis=1).var())
+
+def test_kernel_matches_baseline_loop(responses):
+    complete = responses.dropna()
+    statistics = item_deletion_statistics(np.cov(complete.to_numpy(), rowvar=False, ddof=1))
+
+    assert statistics["alpha"] == pytest.approx(loop_alpha(complete, QUESTIONS))
+    for i, question in enumerate(QUESTIONS):
+        rest = [q for q in QUESTIONS if q != question]
+        assert statistics["alpha_if_deleted"][i] == pytest.approx(loop_alpha(complete, rest))
+        corrected = complete[question].corr(complete[rest].sum(axis=1))
+        assert statistics["corrected_item_total"][i] == pytest.approx(corrected)
+
+def test_item_deletion_matches_alpha_calculator(responses):
+    calculator = CronbachAlphaCalculator()
+    deletion = calculator.calculate_item_deletion(responses, QUESTIONS)
+
+    assert deletion["status"] == "success"
+    assert deletion["alpha"] == pytest.approx(calculator.calculate(responses, QUESTIONS).alpha)
+    np.testing.assert_allclose(deletion["alpha_change"], deletion["alpha_if_deleted"] - deletion["alpha"])
+
+def test_question_analysis_uses_complete_cases(responses):
+    manager = StatisticsManager(responses, QUESTIONS, {"1": QUESTIONS[:3], "2": QUESTIONS[3:]})
+    results = manager.calculate_per_question_alpha()
+    complete = responses.dropna()
+
+    # Q1 is missing where Q2..Q5 are present: those rows no longer count towards its alpha if deleted
+    rest = QUESTIONS[1:]
+    assert results["Q1"]["alpha_if_deleted"] == pytest.approx(loop_alpha(complete, rest))
+    assert results["Q1"]["alpha_if_deleted"] != pytest.approx(loop_alpha(responses, rest))
+    # Dimension values use the complete cases of that dimension's items
+    dimension = responses[QUESTIONS[:3]].dropna()
+    assert results["Q1"]["dimension_alpha_if_deleted"] == pytest.approx(loop_alpha(dimension, ["Q2", "Q3"]))
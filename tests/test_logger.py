@@ -0,0 +1,23 @@
+import multiprocessing
+import pytest
+from src.utils.logger import AppLogger
+
+def _report_child_logging(conn):
+    instance = AppLogger._instance
+    AppLogger.get_logger().info("record from a forked child")
+    conn.send((instance.handlers, instance._running, instance.listener))
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_forked_child_never_writes_the_log_file():
+    AppLogger.get_logger()
+    ctx = multiprocessing.get_context('fork')
+    receiver, sender = ctx.Pipe()
+    child = ctx.Process(target=_report_child_logging, args=(sender,))
+    child.start()
+    handlers, running, listener = receiver.recv()
+    child.join()
+
+    assert child.exitcode == 0
+    assert handlers == ()
+    assert running == []
+    assert listener is None
@@ -0,0 +1,48 @@
+import os
+import numpy as np
+import pandas as pd
+from src.core.analyzer import StatisticalAnalyzer
+from src.core.result_cache import ResultCache
+
+def _survey(path):
+    rng = np.random.default_rng(3)
+    trait = rng.normal(size=40)
+    values = np.clip(np.rint(3 + trait[:, None] + rng.normal(size=(40, 6))), 1, 5)
+    pd.DataFrame(values, columns=[f"{i}- Question {i}" for i in range(1, 7)]).to_excel(path, index=False)
+
+def _analyzer(path, cache):
+    return StatisticalAnalyzer(str(path), list(range(6)), {1: [0, 1, 2], 2: [3, 4, 5]}, result_cache=cache)
+
+def test_unreadable_entry_is_recomputed(tmp_path):
+    survey = tmp_path / "survey.xlsx"
+    _survey(survey)
+    cache = ResultCache(str(tmp_path / "cache"))
+    first = _analyzer(survey, cache)
+    first.analyze_and_export(str(tmp_path / "out"), 'xlsxwriter', 'first.xlsx')
+
+    # A truncated pickle, read back because the requested backend differs
+    results_file = os.path.join(cache.cache_dir, first.cache_key, 'results.pkl')
+    with open(results_file, 'r+b') as f:
+        f.truncate(10)
+
+    second = _analyzer(survey, cache)
+    assert second.cached is not None
+    output_file = second.analyze_and_export(str(tmp_path / "out"), 'openpyxl', 'second.xlsx')
+
+    assert os.path.exists(output_file)
+    assert second.cached is None
+    # The broken entry was replaced by a fresh one
+    assert isinstance(cache.load_results(second.cache_key), dict)
+
+def test_compute_results_recomputes_unreadable_entry(tmp_path):
+    survey = tmp_path / "survey.xlsx"
+    _survey(survey)
+    cache = ResultCache(str(tmp_path / "cache"))
+    first = _analyzer(survey, cache)
+    expected = first.compute_results()
+    first.analyze_and_export(str(tmp_path / "out"), 'xlsxwriter', 'first.xlsx')
+    with open(os.path.join(cache.cache_dir, first.cache_key, 'results.pkl'), 'wb') as f:
+        f.write(b"not a pickle")
+
+    results = _analyzer(survey, cache).compute_results()
+    assert results.keys() == expected.keys()
@@ -0,0 +1,51 @@
+from itertools import combinations
+import numpy as np
+import pandas as pd
+import pytest
+from src.core.statistics.split_half import SplitHalfCalculator
+
+def _responses(n_items, seed):
+    rng = np.random.default_rng(seed)
+    trait = rng.normal(size=90)
+    values = np.clip(np.rint(3 + trait[:, None] + rng.normal(scale=1.0, size=(90, n_items))), 1, 5)
+    values[[3, 48], [1, n_items - 1]] = np.nan
+    return pd.DataFrame(values, columns=[f"Q{i}" for i in range(1, n_items + 1)])
+
+def brute_force_splits(values):
+    """Coefficients of every balanced split from explicit half sums, each split counted once"""
+    n_items = values.shape[1]
+    half = n_items // 2
+    guttman, spearman_brown, splits = [], [], []
+    for first in combinations(range(n_items), half):
+        if n_items % 2 == 0 and 0 not in first:
+            # The same split with the halves swapped
+            continue
+        second = [i for i in range(n_items) if i not in first]
+        first_sums = values[:, list(first)].sum(axis=1)
+        second_sums = values[:, second].sum(axis=1)
+        total_variance = (first_sums + second_sums).var(ddof=1)
+        guttman.append(2 * (1 - (first_sums.var(ddof=1) + second_sums.var(ddof=1)) / total_variance))
+        r = np.corrcoef(first_sums, second_sums)[0, 1]
+        spearman_brown.append(2 * r / (1 + r))
+        splits.append(first)
+    return np.array(guttman), np.array(spearman_brown), splits
+
+@pytest.mark.parametrize("n_items, expected_splits", [(6, 10), (7, 35)])
+def test_distribution_matches_brute_force(n_items, expected_splits):
+    data = _responses(n_items, seed=n_items)
+    questions = list(data.columns)
+    guttman, spearman_brown, splits = brute_force_splits(data.dropna().to_numpy())
+
+    result = SplitHalfCalculator().calculate_distribution(data, questions)
+
+    assert result.status == "success"
+    assert result.exhaustive
+    assert result.n_splits == len(splits) == expected_splits
+    assert result.guttman_min == pytest.approx(guttman.min())
+    assert result.guttman_mean == pytest.approx(guttman.mean())
+    assert result.guttman_max == pytest.approx(guttman.max())
+    assert result.spearman_brown_min == pytest.approx(spearman_brown.min())
+    assert result.spearman_brown_mean == pytest.approx(spearman_brown.mean())
+    assert result.spearman_brown_max == pytest.approx(spearman_brown.max())
+    # Lambda 4 is attained by the reported best split
+    assert result.best_split == [questions[i] for i in splits[int(guttman.argmax())]]
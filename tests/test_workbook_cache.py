@@ -0,0 +1,34 @@
+import threading
+import pandas as pd
+from src.core.workbook_cache import WorkbookCache
+
+def test_parse_does_not_block_other_files(tmp_path, monkeypatch):
+    slow_file, other_file = tmp_path / "slow.xlsx", tmp_path / "other.xlsx"
+    pd.DataFrame({"Q1": [1, 2]}).to_excel(slow_file, index=False)
+    pd.DataFrame({"Q1": [3, 4]}).to_excel(other_file, index=False)
+
+    cache = WorkbookCache.get_instance()
+    cache.invalidate()
+    parse = cache._parse
+    started, release = threading.Event(), threading.Event()
+
+    def slow_parse(key, sheet_name, sidecar):
+        if key[0] == str(slow_file):
+            started.set()
+            release.wait(10)
+        return parse(key, sheet_name, sidecar)
+
+    monkeypatch.setattr(cache, "_parse", slow_parse)
+    loader = threading.Thread(target=cache.load, args=(str(slow_file),))
+    loader.start()
+    try:
+        assert started.wait(10)
+        # Neither a lookup nor a load of another file waits for the slow parse
+        assert cache.peek(str(other_file)) is None
+        assert cache.load(str(other_file)).data["Q1"].tolist() == [3, 4]
+        assert loader.is_alive()
+    finally:
+        release.set()
+        loader.join()
+    assert cache.peek(str(slow_file)) is not None
+    cache.invalidate()
@@ -0,0 +1,26 @@
+import os
+from src.core.formatters.writers import create_workbook_writer
+
+def test_xlsxwriter_discard_keeps_previous_output(tmp_path):
+    output_file = tmp_path / "report.xlsx"
+    output_file.write_bytes(b"previous report")
+
+    wb = create_workbook_writer(str(output_file), 'xlsxwriter')
+    sheet = wb.add_sheet("Partial")
+    for row in range(1, 50):
+        sheet.write_row(row, [row, "answer"])
+    wb.discard()
+
+    assert output_file.read_bytes() == b"previous report"
+    assert os.listdir(tmp_path) == ["report.xlsx"]
+
+def test_xlsxwriter_close_replaces_output(tmp_path):
+    output_file = tmp_path / "report.xlsx"
+    output_file.write_bytes(b"previous report")
+
+    wb = create_workbook_writer(str(output_file), 'xlsxwriter')
+    wb.add_sheet("Report").write_row(1, ["Dimension", 0.8])
+    wb.close()
+
+    assert output_file.read_bytes()[:2] == b"PK"
+    assert os.listdir(tmp_path) == ["report.xlsx"]